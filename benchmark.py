@@ -0,0 +1,61 @@
+from argparse import ArgumentParser
+from sys import exit
+
+from finsim.benchmarks import (ACCOUNTS, YEARS, STORAGES, benchmark_cases, compare, load_baseline,
+                               regressions, run_benchmarks, save_baseline)
+from finsim.simulation import Simulation
+
+def int_list(value):
+    return [ int(v) for v in value.split(',') ]
+
+def str_list(value):
+    return value.split(',')
+
+def report(comparisons, threshold):
+    slower = regressions(comparisons, threshold)
+    for c in comparisons:
+        flag = '  REGRESSION' if c in slower else ''
+        print('{:<70} {:>12.6f}s {:>12.6f}s {:>+8.1%}{}'.format(c.name, c.baseline, c.current, c.change, flag))
+    print('{} benchmarks compared, {} slower by more than {:.0%}.'.format(
+        len(comparisons), len(slower), threshold))
+    return len(slower) == 0
+
+parser = ArgumentParser(description='Time the simulation hot paths.')
+subparsers = parser.add_subparsers(dest='command')
+
+run_parser = subparsers.add_parser('run', help='run the benchmarks and save the results')
+run_parser.add_argument('--output', default='benchmarks.json', help='JSON file to write results to')
+run_parser.add_argument('--accounts', type=int_list, default=ACCOUNTS, help='e.g. 1,100,10000')
+run_parser.add_argument('--years', type=int_list, default=YEARS, help='e.g. 1,10,100')
+run_parser.add_argument('--engines', type=str_list, default=Simulation.ENGINES)
+run_parser.add_argument('--storages', type=str_list, default=STORAGES)
+run_parser.add_argument('--budget', type=int, default=100000,
+                        help='skip stepwise simulations of more account-years than this (0 for no limit)')
+run_parser.add_argument('--repeat', type=int, default=3)
+run_parser.add_argument('--filter', default='', help='only run benchmarks whose names contain this')
+run_parser.add_argument('--compare', metavar='BASELINE', help='compare the results with a baseline file')
+run_parser.add_argument('--threshold', type=float, default=0.1)
+
+compare_parser = subparsers.add_parser('compare', help='compare two saved results files')
+compare_parser.add_argument('baseline')
+compare_parser.add_argument('current')
+compare_parser.add_argument('--threshold', type=float, default=0.1,
+                            help='fractional slowdown counted as a regression')
+
+args = parser.parse_args()
+
+if args.command == 'run':
+    cases = benchmark_cases(args.accounts, args.years, args.engines, args.storages, args.budget)
+    cases = [ (name, factory) for name, factory in cases if args.filter in name ]
+    results = run_benchmarks(
+        cases,
+        repeat=args.repeat,
+        progress=lambda name, seconds: print('{:<70} {:>12.6f}s'.format(name, seconds)))
+    save_baseline(results, args.output)
+    if args.compare and not report(compare(load_baseline(args.compare), results), args.threshold):
+        exit(1)
+elif args.command == 'compare':
+    if not report(compare(load_baseline(args.baseline), load_baseline(args.current)), args.threshold):
+        exit(1)
+else:
+    parser.print_help()
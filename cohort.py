@@ -0,0 +1,38 @@
+from argparse import ArgumentParser
+from json import dump as json_dump, dumps as json_dumps
+from time import perf_counter
+
+from finsim.cohort import iter_lines, simulate_cohort
+from finsim.person import Person
+from finsim.simulation import Simulation
+from finsim.strategies import RuleStrategy
+
+parser = ArgumentParser(description='Simulate a cohort of independent households and summarise the results.')
+parser.add_argument('households', help='JSONL file holding one data file\'s contents per line (- for stdin)')
+parser.add_argument('--order', default='avalanche', choices=RuleStrategy.ORDERS,
+                    help='debt repayment order')
+parser.add_argument('--debt-share', default='50',
+                    help='percentage of disposable income put towards debts')
+parser.add_argument('--workers', type=int, help='number of worker processes (defaults to the CPU count)')
+parser.add_argument('--shard-size', type=int, default=256, help='households sent to a worker at a time')
+parser.add_argument('--max-years', type=int, default=100,
+                    help='years after which a household is counted as not reaching its goal')
+parser.add_argument('--engine', default='event', choices=Simulation.ENGINES)
+parser.add_argument('--storage', default='arrays', choices=Person.STORAGES)
+parser.add_argument('--output', help='JSON file to write the summary to (defaults to stdout)')
+args = parser.parse_args()
+
+start = perf_counter()
+stats = simulate_cohort(
+    iter_lines(args.households), { 'debt_share': args.debt_share, 'order': args.order },
+    workers=args.workers, shard_size=args.shard_size, max_years=args.max_years, engine=args.engine,
+    storage=args.storage)
+elapsed = perf_counter() - start
+
+summary = stats.summary()
+if args.output:
+    with open(args.output, 'w') as f:
+        json_dump(summary, f, indent=4, default=str)
+    print('Simulated {} households in {:.2f}s.'.format(summary['households'], elapsed))
+else:
+    print(json_dumps(summary, indent=4, default=str))
@@ -0,0 +1,331 @@
+from copy import copy
+from decimal import Decimal as D
+
+import numpy as np
+
+from finsim import utils
+from finsim.ledger import Ledger, PAYMENT, INTEREST, BONUS
+from finsim.money import BACKENDS, get_backend, percentage_ratio
+from finsim.utils import decimalise, round_currency_to_pounds
+
+PENCE = BACKENDS['pence']
+_LISA_BONUS = percentage_ratio(D('25'))
+
+class AccountView:
+    """
+    A single account's view onto an ``AccountArrays`` instance.
+    """
+
+    __slots__ = ('_group', '_index')
+
+    def __init__(self, group, index):
+        self._group = group
+        self._index = index
+
+    @property
+    def name(self):
+        return self._group.names[self._index]
+
+    @property
+    def interest_rate(self):
+        return self._group.interest_rates[self._index]
+
+    @property
+    def balance(self):
+        return PENCE.to_decimal(int(self._group.balances[self._index]))
+
+    @balance.setter
+    def balance(self, value):
+        self._group.balances[self._index] = PENCE.from_value(value)
+
+    @property
+    def payment_amount(self):
+        return PENCE.to_decimal(int(self._group.payments[self._index]))
+
+    @payment_amount.setter
+    def payment_amount(self, value):
+        self._group.payments[self._index] = PENCE.from_value(value)
+
+    @property
+    def annual_report(self):
+        group = self._group
+        if not group.ledger.enabled:
+            return None
+        return self._report(group.starting_balances, group.annual_payments, group.annual_interest)
+
+    @property
+    def overall_report(self):
+        group = self._group
+        if not group.ledger.enabled:
+            return None
+        return self._report(group.initial_balances, group.overall_payments, group.overall_interest)
+
+    def _report(self, starting_balances, payments, interest):
+        i = self._index
+        report = {
+            'Starting Balance': PENCE.to_decimal(int(starting_balances[i])),
+            'Payments / Deposits': PENCE.to_decimal(int(payments[i]))
+        }
+        if self.interest_rate > 0:
+            report['Interest'] = PENCE.to_decimal(int(interest[i]))
+        return report
+
+
+class DebtView(AccountView):
+    __slots__ = ()
+
+    @property
+    def active(self):
+        return bool(self._group.active[self._index])
+
+
+class SavingsView(AccountView):
+    __slots__ = ()
+
+    @property
+    def type(self):
+        return self._group.types[self._index]
+
+    @property
+    def balance(self):
+        return AccountView.balance.fget(self)
+
+    @balance.setter
+    def balance(self, value):
+        AccountView.balance.fset(self, value)
+        self._group.recalculate_total()
+
+    def _report(self, starting_balances, payments, interest):
+        report = super()._report(starting_balances, payments, interest)
+        if self.type == 'lisa':
+            group = self._group
+            bonus = group.annual_bonus if payments is group.annual_payments else group.overall_bonus
+            report['Government Bonus'] = PENCE.to_decimal(int(bonus[self._index]))
+        return report
+
+
+class AccountArrays:
+    """
+    Array-backed alternative to ``AccountGroup``. Balances, rates, payments and report totals are
+    held as parallel ``int64`` arrays of pence, so paying, depositing and applying interest are
+    single vectorised passes. ``to_list`` returns lightweight views which expose the same
+    per-account attributes as ``Account``.
+
+    Arithmetic follows the pence backend, so results match ``AccountGroup`` to the penny.
+    Amounts passed in or out are converted to the current money backend.
+    """
+
+    view_type = AccountView
+    mutable_arrays = (
+        'balances', 'payments', 'annual_payments', 'overall_payments', 'annual_interest',
+        'overall_interest'
+    )
+
+    def __init__(self, accounts_data, ledger=None, person=None):
+        self.money = get_backend()
+        self.ledger = ledger or Ledger()
+        self.names = [ account['name'] for account in accounts_data ]
+        self.ledger_ids = np.array(
+            [ self.ledger.register(person, name) for name in self.names ], dtype=np.int32)
+        self.index = { name: i for i, name in enumerate(self.names) }
+        self.interest_rates = [ decimalise(a.get('interest_rate', 0)) for a in accounts_data ]
+        ratios = [ percentage_ratio(rate) for rate in self.interest_rates ]
+        self.rate_numerators = np.array([ n for n, _ in ratios ], dtype=np.int64)
+        self.rate_denominators = np.array([ d for _, d in ratios ], dtype=np.int64)
+
+        self.balances = np.array(
+            [ PENCE.from_value(a.get('starting_balance', 0)) for a in accounts_data ], dtype=np.int64)
+        self.payments = np.zeros(len(self.names), dtype=np.int64)
+        self.initial_balances = self.balances.copy()
+        self.starting_balances = self.balances.copy()
+        self.annual_payments = np.zeros_like(self.balances)
+        self.overall_payments = np.zeros_like(self.balances)
+        self.annual_interest = np.zeros_like(self.balances)
+        self.overall_interest = np.zeros_like(self.balances)
+        self.views = [ self.view_type(self, i) for i in range(len(self.names)) ]
+        self.ledger.on_flush(self._close_year)
+
+    def apply_strategy(self, strategy):
+        for item in strategy:
+            self.payments[self.index[item['name']]] = PENCE.from_value(item['payment'])
+
+    def begin_year(self):
+        self.starting_balances = self.balances.copy()
+        if self.ledger.enabled and not self.ledger.monthly:
+            self._close_year(max(self.ledger.month - 1, 0))
+        self.annual_payments[:] = 0
+        self.annual_interest[:] = 0
+
+    def end_year(self):
+        interest = self._interest()
+        self.balances += interest
+        self._update_reports(self.annual_interest, self.overall_interest, interest, INTEREST)
+        return self._to_backend(interest.sum())
+
+    def fork(self, ledger):
+        """
+        Returns a copy recording to ``ledger``, sharing names, rates and other fixed arrays but with
+        its own copy of each of ``mutable_arrays``.
+        """
+        forked = copy(self)
+        forked.ledger = ledger
+        for name in self.mutable_arrays:
+            setattr(forked, name, getattr(self, name).copy())
+        forked.views = [ self.view_type(forked, i) for i in range(len(self.names)) ]
+        ledger.on_flush(forked._close_year)
+        return forked
+
+
+    # -- Private Methods ----------------------------------
+
+    def _interest(self):
+        return _percentage_of(self.balances, self.rate_numerators, self.rate_denominators)
+
+    def _update_reports(self, annual, overall, amounts, kind):
+        if not self.ledger.enabled:
+            return
+        annual += amounts
+        overall += amounts
+        if self.ledger.monthly:
+            self.ledger.record_many(self.ledger_ids, kind, amounts)
+
+    def _close_year(self, month):
+        self.ledger.record_many(self.ledger_ids, PAYMENT, self.annual_payments, month)
+        self.ledger.record_many(self.ledger_ids, INTEREST, self.annual_interest, month)
+
+    def _to_backend(self, pence):
+        return self.money.from_value(PENCE.to_decimal(int(pence)))
+
+
+class DebtArrays(AccountArrays):
+    """
+    Array-backed equivalent of ``Debts``.
+    """
+
+    view_type = DebtView
+    mutable_arrays = AccountArrays.mutable_arrays + ('active',)
+
+    def __init__(self, accounts_data, ledger=None, person=None):
+        super().__init__(accounts_data, ledger, person)
+        self.active = self.balances > 0
+        self.recently_cleared = []
+
+    def pay(self, months=1):
+        amounts = self.payments * months * self.active
+        self.balances -= amounts
+        self._update_reports(self.annual_payments, self.overall_payments, amounts, PAYMENT)
+
+        still_active = self.balances > 0
+        cleared = np.flatnonzero(self.active & ~still_active)
+        self.active &= still_active
+        self.recently_cleared += [ self.names[i] for i in cleared ]
+
+    def months_until_cleared(self):
+        paying = self.active & (self.payments > 0)
+        if not paying.any():
+            return None
+        months = -(-self.balances[paying] // self.payments[paying])
+        return int(months.min())
+
+    def reset_recently_cleared(self):
+        self.recently_cleared = []
+
+    def fork(self, ledger):
+        forked = super().fork(ledger)
+        forked.recently_cleared = list(self.recently_cleared)
+        return forked
+
+    def end_year(self):
+        interest = self._interest() * self.active
+        self.balances += interest
+        self._update_reports(self.annual_interest, self.overall_interest, interest, INTEREST)
+        return self._to_backend(interest.sum())
+
+    def to_list(self, active_only=True):
+        if active_only:
+            return [ self.views[i] for i in np.flatnonzero(self.active) ]
+        else:
+            return list(self.views)
+
+    def to_string(self):
+        active_debts = self.to_list()
+        if len(active_debts) == 0:
+            return ''
+        padding_length = max(len(d.name) for d in active_debts) + 2
+        debt_string = ''
+        for debt in active_debts:
+            padded_name = '{}:'.format(debt.name).ljust(padding_length, ' ')
+            debt_string += '\t{} £{}\n'.format(
+                padded_name,
+                round_currency_to_pounds(debt.balance))
+
+        return debt_string
+
+
+class SavingsArrays(AccountArrays):
+    """
+    Array-backed equivalent of ``SavingsAccounts``, including its running total.
+    """
+
+    view_type = SavingsView
+    mutable_arrays = AccountArrays.mutable_arrays + ('annual_bonus', 'overall_bonus')
+
+    def __init__(self, accounts_data, ledger=None, person=None):
+        super().__init__(accounts_data, ledger, person)
+        self.types = [ account.get('type', 'traditional') for account in accounts_data ]
+        self.lisa = np.array([ t == 'lisa' for t in self.types ], dtype=bool)
+        self.annual_bonus = np.zeros_like(self.balances)
+        self.overall_bonus = np.zeros_like(self.balances)
+        self.recalculate_total()
+
+    def begin_year(self):
+        super().begin_year()
+        self.annual_bonus[:] = 0
+
+    def deposit(self, months=1):
+        bonus = self._government_bonus() * months
+        amounts = self.payments * months
+        self.balances += amounts + bonus
+        self._update_reports(self.annual_payments, self.overall_payments, amounts, PAYMENT)
+        self._update_reports(self.annual_bonus, self.overall_bonus, bonus, BONUS)
+
+        deposited = int(amounts.sum() + bonus.sum())
+        self._total += deposited
+        return self._to_backend(deposited)
+
+    def monthly_deposit(self):
+        return PENCE.to_decimal(int(self.payments.sum() + self._government_bonus().sum()))
+
+    def end_year(self):
+        interest = self._interest()
+        self.balances += interest
+        self._update_reports(self.annual_interest, self.overall_interest, interest, INTEREST)
+        self._total += int(interest.sum())
+        return self._to_backend(interest.sum())
+
+    def to_list(self):
+        return list(self.views)
+
+    def total_saved(self):
+        total = PENCE.to_decimal(self._total)
+        if utils.VERIFY_TOTALS:
+            utils.verify_total('savings arrays', total, PENCE.to_decimal(int(self.balances.sum())))
+        return total
+
+    def recalculate_total(self):
+        self._total = int(self.balances.sum())
+
+
+    # -- Private Methods ----------------------------------
+
+    def _government_bonus(self):
+        return _percentage_of(self.payments, *_LISA_BONUS) * self.lisa
+
+    def _close_year(self, month):
+        super()._close_year(month)
+        self.ledger.record_many(self.ledger_ids, BONUS, self.annual_bonus, month)
+
+
+def _percentage_of(values, numerators, denominators):
+    amounts = (np.abs(values) * numerators) // denominators
+    return np.where(values >= 0, amounts, -amounts)
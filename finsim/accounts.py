@@ -1,13 +1,17 @@
 from abc import ABC, abstractmethod
+from copy import copy
 from decimal import Decimal as D
 
-from finsim.utils import get_percentage_of, decimalise as D
+from finsim.ledger import Ledger, PAYMENT, INTEREST
+from finsim.money import get_backend
+from finsim.utils import decimalise as D
 
 class AccountGroup(ABC):
-    def __init__(self, account_type, accounts_data):
+    def __init__(self, account_type, accounts_data, ledger=None, person=None):
+        self.ledger = ledger or Ledger()
         self.account_dict = {}
         for account in accounts_data:
-            new_account = account_type(account_data=account)
+            new_account = account_type(account_data=account, ledger=self.ledger, person=person)
             self.account_dict[account['name']] = new_account
 
     def apply_strategy(self, strategy):
@@ -22,38 +26,83 @@ class AccountGroup(ABC):
         for name, account in self.account_dict.items():
             account.end_year()
 
+    def fork(self, ledger):
+        """
+        Returns a copy whose accounts change independently of these, recording to ``ledger``.
+        """
+        forked = copy(self)
+        forked.ledger = ledger
+        forked.account_dict = { name: a.fork(ledger) for name, a in self.account_dict.items() }
+        return forked
+
 class Account(ABC):
-    def __init__(self, account_data):
+    def __init__(self, account_data, ledger=None, person=None):
+        self.money = get_backend()
         self.name = account_data['name']
         self.interest_rate = D(account_data.get('interest_rate', 0))
-        self.balance = D(account_data.get('starting_balance', 0))
-        self.payment_amount = 0
-        self.annual_report = self._init_report()
-        self.overall_report = self._init_report()
+        self._balance = self.money.from_value(account_data.get('starting_balance', 0))
+        self._payment = self.money.zero
+        self._initial_balance = self._balance
+        self._starting_balance = self._balance
+        self.ledger = ledger or Ledger()
+        self.ledger_id = self.ledger.register(person, self.name)
+
+    @property
+    def balance(self):
+        return self.money.to_decimal(self._balance)
+
+    @balance.setter
+    def balance(self, value):
+        self._balance = self.money.from_value(value)
+
+    @property
+    def payment_amount(self):
+        return self.money.to_decimal(self._payment)
+
+    @payment_amount.setter
+    def payment_amount(self, value):
+        self._payment = self.money.from_value(value)
+
+    @property
+    def annual_report(self):
+        if not self.ledger.enabled:
+            return None
+        report = { 'Starting Balance': self._starting_balance }
+        report.update(self.ledger.annual(self.ledger_id, self._report_kinds()))
+        return self._to_decimals(report)
+
+    @property
+    def overall_report(self):
+        if not self.ledger.enabled:
+            return None
+        report = { 'Starting Balance': self._initial_balance }
+        report.update(self.ledger.overall(self.ledger_id, self._report_kinds()))
+        return self._to_decimals(report)
 
     def begin_year(self):
-        self.annual_report = self._init_report()
+        self._starting_balance = self._balance
+        self.ledger.begin_year(self.ledger_id)
+
+    def fork(self, ledger):
+        forked = copy(self)
+        forked.ledger = ledger
+        return forked
 
     def end_year(self):
         if self.interest_rate > 0:
-            interest_amount = get_percentage_of(self.balance, self.interest_rate)
-            self.balance += interest_amount
-            self._update_reports('Interest', interest_amount)
+            interest_amount = self.money.percentage_of(self._balance, self.interest_rate)
+            self._balance += interest_amount
+            self.ledger.record(self.ledger_id, INTEREST, interest_amount)
+            return interest_amount
+        return self.money.zero
 
 
     # -- Private Methods ----------------------------------
 
-    def _init_report(self):
-        report = {
-            'Starting Balance': self.balance,
-            'Payments / Deposits': 0
-        }
-
+    def _report_kinds(self):
         if self.interest_rate > 0:
-            report['Interest'] = 0
-
-        return report
+            return (PAYMENT, INTEREST)
+        return (PAYMENT,)
 
-    def _update_reports(self, key, amount):
-        self.annual_report[key] += amount
-        self.overall_report[key] += amount
\ No newline at end of file
+    def _to_decimals(self, report):
+        return { name: self.money.to_decimal(amount) for name, amount in report.items() }
@@ -0,0 +1,233 @@
+from collections import namedtuple
+from json import dump as json_dump, load as json_load
+from os import remove
+from platform import platform, python_version
+from tempfile import NamedTemporaryFile
+from timeit import Timer
+
+import numpy as np
+
+from finsim.account_arrays import DebtArrays, SavingsArrays
+from finsim.debts import Debts
+from finsim.economy import default_parameters
+from finsim.expenses import Expenses
+from finsim.payroll import Payroll, _net_monthly
+from finsim.person import Person
+from finsim.savings_accounts import SavingsAccounts
+from finsim.sim_data import SimData
+from finsim.simulation import Simulation
+from finsim.strategies import FixedStrategy
+
+ACCOUNTS = (1, 10, 100, 1000, 10000)
+YEARS = (1, 10, 100)
+STORAGES = ('objects', 'arrays')
+
+Comparison = namedtuple('Comparison', ['name', 'baseline', 'current', 'change'])
+
+def synthetic_data(accounts, savings_goal=None):
+    """
+    Returns raw data for a single person holding ``accounts`` accounts, split evenly between
+    savings and debts, with enough expenses to exercise inflation. Debts are large enough never to
+    clear, so the strategy never needs to change.
+    """
+    num_savings = max(1, accounts // 2)
+    person = {
+        'name': 'Benchmark',
+        'salary': { 'base_salary': str(20000 + 50 * accounts), 'pension': '4.0' },
+        'expenses': synthetic_expenses(min(accounts, 100)),
+        'savings': [
+            {
+                'name': 'Savings {}'.format(i),
+                'interest_rate': '{:.2f}'.format(1 + (i % 5) / 4),
+                'starting_balance': '{}.00'.format(i % 1000),
+                'type': 'lisa' if i % 10 == 0 else 'traditional'
+            }
+            for i in range(num_savings)
+        ],
+        'debts': [
+            {
+                'name': 'Debt {}'.format(i),
+                'starting_balance': '1000000.00',
+                'interest_rate': '{:.2f}'.format(i % 20)
+            }
+            for i in range(accounts - num_savings)
+        ]
+    }
+    data = { 'people': [ person ] }
+    if savings_goal is not None:
+        data['savings_goal'] = str(savings_goal)
+    return data
+
+def synthetic_expenses(count):
+    return {
+        'monthly': [
+            { 'name': 'Monthly {}'.format(i), 'cost': '{}.50'.format(10 + i), 'inflation': i % 3 != 0 }
+            for i in range(count)
+        ],
+        'annual': [ { 'name': 'Annual', 'cost': '1200.00' } ]
+    }
+
+def scripted_strategy(data):
+    """
+    A ``FixedStrategy`` paying a few pounds into every account each month.
+    """
+    person = data['people'][0]
+    return FixedStrategy({
+        person['name']: {
+            'debts': { debt['name']: '2.50' for debt in person['debts'] },
+            'savings': {
+                account['name']: '{}.25'.format(1 + i % 3) for i, account in enumerate(person['savings'])
+            }
+        }
+    })
+
+def calibrate_goal(data, years, storage='objects'):
+    """
+    Returns the savings goal which the scripted strategy reaches in exactly ``years`` years.
+    """
+    person = Person(data['people'][0], scripted_strategy(data), storage)
+    total = None
+    for _ in range(years):
+        person.begin_year()
+        for _ in range(12):
+            person.simulate_month()
+        total = person.total_saved()
+        person.end_year()
+    return total
+
+
+# -- Benchmarks ---------------------------------------
+
+def bench_simulate(accounts, years, engine, storage):
+    data = synthetic_data(accounts)
+    data['savings_goal'] = str(calibrate_goal(data, years, storage))
+    sim_data = SimData.from_dict(data)
+
+    def run():
+        simulation = Simulation(
+            sim_data, scripted_strategy(data), quiet=True, engine=engine, storage=storage,
+            report_detail='none')
+        simulation.simulate()
+    return run
+
+def bench_load(accounts):
+    f = NamedTemporaryFile('w', suffix='.json', delete=False)
+    with f:
+        json_dump(synthetic_data(accounts, savings_goal=10000), f)
+
+    def run():
+        SimData(f.name)
+    return run, lambda: remove(f.name)
+
+def bench_net_salary(cached):
+    payroll = Payroll({ 'base_salary': '31234.56', 'pension': '4.5' })
+
+    def run():
+        if not cached:
+            _net_monthly.cache_clear()
+        payroll._calculate_net_salary()
+    return run
+
+def bench_inflate(expenses):
+    # Zero inflation keeps costs, and so the work per call, constant across repeats
+    economy = default_parameters().replace(inflation_rate='0')
+    group = Expenses(synthetic_expenses(expenses), economy)
+    return group.inflate
+
+def bench_pay_deposit(accounts, storage):
+    data = synthetic_data(accounts)
+    person = data['people'][0]
+    if storage == 'arrays':
+        debts, savings = DebtArrays(person['debts']), SavingsArrays(person['savings'])
+    else:
+        debts, savings = Debts(person['debts']), SavingsAccounts(person['savings'])
+    strategy = scripted_strategy(data).strategies[person['name']]
+    debts.apply_strategy([ { 'name': k, 'payment': v } for k, v in strategy['debts'].items() ])
+    savings.apply_strategy([ { 'name': k, 'payment': v } for k, v in strategy['savings'].items() ])
+
+    def run():
+        debts.pay()
+        savings.deposit()
+    return run
+
+
+# -- Running and Comparing ----------------------------
+
+def benchmark_cases(accounts=ACCOUNTS, years=YEARS, engines=Simulation.ENGINES, storages=STORAGES,
+                    budget=100000):
+    """
+    Yields ``(name, factory)`` for every benchmark in the grid. ``factory()`` returns either the
+    function to time, or a tuple of it and a cleanup function.
+
+    Stepwise simulations of more than ``budget`` account-years are skipped (0 for no limit).
+    """
+    yield 'net_salary[cached]', lambda: bench_net_salary(True)
+    yield 'net_salary[uncached]', lambda: bench_net_salary(False)
+    for n in accounts:
+        yield 'load[accounts={}]'.format(n), _bind(bench_load, n)
+        yield 'inflate[expenses={}]'.format(n), _bind(bench_inflate, n)
+        for storage in storages:
+            name = 'pay_deposit[accounts={},storage={}]'.format(n, storage)
+            yield name, _bind(bench_pay_deposit, n, storage)
+    for n in accounts:
+        for y in years:
+            for engine in engines:
+                if engine == 'stepwise' and budget and n * y > budget:
+                    continue
+                for storage in storages:
+                    name = 'simulate[accounts={},years={},engine={},storage={}]'.format(n, y, engine, storage)
+                    yield name, _bind(bench_simulate, n, y, engine, storage)
+
+def run_benchmarks(cases, repeat=3, progress=None):
+    """
+    Times each case, returning a dict of name → best seconds per call.
+    """
+    results = {}
+    for name, factory in cases:
+        func = factory()
+        cleanup = None
+        if isinstance(func, tuple):
+            func, cleanup = func
+        try:
+            timer = Timer(func)
+            number, _ = timer.autorange()
+            results[name] = min(timer.repeat(repeat=repeat, number=number)) / number
+        finally:
+            if cleanup is not None:
+                cleanup()
+        if progress is not None:
+            progress(name, results[name])
+    return results
+
+def save_baseline(results, path):
+    baseline = {
+        'meta': {
+            'python': python_version(),
+            'numpy': np.__version__,
+            'platform': platform()
+        },
+        'results': results
+    }
+    with open(path, 'w') as f:
+        json_dump(baseline, f, indent=4, sort_keys=True)
+
+def load_baseline(path):
+    with open(path, 'r') as f:
+        return json_load(f)['results']
+
+def compare(baseline, current):
+    """
+    Returns a ``Comparison`` for every benchmark in both result sets, where ``change`` is the
+    fractional change in time (positive is slower).
+    """
+    return [
+        Comparison(name, baseline[name], current[name], (current[name] / baseline[name]) - 1)
+        for name in sorted(baseline)
+        if name in current and baseline[name] > 0
+    ]
+
+def regressions(comparisons, threshold=0.1):
+    return [ c for c in comparisons if c.change > threshold ]
+
+def _bind(func, *args):
+    return lambda: func(*args)
@@ -0,0 +1,247 @@
+from collections import OrderedDict
+from copy import deepcopy
+from decimal import Decimal, InvalidOperation
+from hashlib import sha256
+from json import dumps as json_dumps, loads as json_loads
+from os import listdir, makedirs, remove, replace, stat, utime
+from os.path import join
+from threading import Lock
+
+from finsim import money
+from finsim.economy import default_parameters
+from finsim.sim_data import _lower_keys
+from finsim.simulation import Simulation
+from finsim.strategies import StrategyProvider
+from finsim.sweep import final_balances
+
+FORMAT_VERSION = 2
+
+_SUFFIX = '.result'
+_COUNTERS = ('memory_hits', 'disk_hits', 'misses', 'memory_evictions', 'disk_evictions')
+
+class CacheError(Exception):
+    pass
+
+def cache_key(raw_data, strategy_provider, economy=None, engine='event', storage='objects',
+              max_months=None):
+    """
+    Returns a hash identifying the result of simulating ``raw_data`` (a data file's contents) with
+    ``strategy_provider`` for at most ``max_months``. Keys are lowered and numbers decimalised first, so ``"500"``, ``"500.00"``
+    and ``500`` give the same key, as do ``"Salary"`` and ``"salary"``.
+
+    Providers are identified by their class and attributes, so only those holding plain data (such
+    as rules or fixed strategies) can be cached; interactive ones raise a ``CacheError``.
+    """
+    economy = economy or default_parameters()
+    content = [
+        FORMAT_VERSION,
+        _canonical(_lower_keys(raw_data)),
+        _fingerprint(strategy_provider),
+        { field: str(value.normalize()) for field, value in economy._asdict().items() },
+        engine,
+        storage,
+        money.get_backend().name,
+        max_months
+    ]
+    encoded = json_dumps(content, sort_keys=True, separators=(',', ':'))
+    return sha256(encoded.encode('utf-8')).hexdigest()
+
+def simulation_result(simulation, months):
+    return {
+        'months': months,
+        'debt_free_month': simulation.debt_free_month,
+        'total_saved': simulation.model.total_saved(),
+        'balances': final_balances(simulation)
+    }
+
+
+class ResultCache:
+    """
+    Holds simulation results by ``cache_key``: the ``max_entries`` most recently used in memory,
+    and, if ``path`` is given, up to ``max_bytes`` of results in files there. Entries evicted from
+    memory stay on disk, and the least recently used files are removed when the disk tier is full.
+    The disk tier may be shared between processes, so results are stored there as JSON. Each
+    caller is given its own copy of a result.
+
+    ``counters`` holds the number of memory and disk hits, misses and evictions from each tier.
+    """
+
+    def __init__(self, max_entries=1024, path=None, max_bytes=64 * 1024 * 1024):
+        if max_entries < 1:
+            raise ValueError('The cache must hold at least one entry in memory.')
+        self.max_entries = max_entries
+        self.path = path
+        self.max_bytes = max_bytes
+        self.counters = { counter: 0 for counter in _COUNTERS }
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self._disk_bytes = 0
+        if path is not None:
+            makedirs(path, exist_ok=True)
+            self._disk_bytes = sum(size for _, _, size in self._disk_files())
+
+    def get(self, key):
+        """
+        Returns the result held for ``key``, or None.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.counters['memory_hits'] += 1
+                return deepcopy(self._entries[key])
+
+            result = self._read(key)
+            if result is None:
+                self.counters['misses'] += 1
+                return None
+            self.counters['disk_hits'] += 1
+            self._remember(key, result)
+            return deepcopy(result)
+
+    def put(self, key, result):
+        with self._lock:
+            self._remember(key, deepcopy(result))
+            self._write(key, result)
+
+    def simulate(self, data, strategy_provider, economy=None, engine='event', storage='objects',
+                 max_months=None):
+        """
+        Returns the ``simulation_result`` of simulating ``data`` (a ``SimData``), from the cache if
+        it has been run before.
+        """
+        economy = economy or default_parameters()
+        key = cache_key(data.data, strategy_provider, economy, engine, storage, max_months)
+        result = self.get(key)
+        if result is None:
+            simulation = Simulation(
+                data, strategy_provider, quiet=True, engine=engine, storage=storage, economy=economy,
+                report_detail='none', max_months=max_months)
+            result = simulation_result(simulation, simulation.simulate())
+            self.put(key, result)
+            result = deepcopy(result)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self.path is not None:
+                for name, _, _ in self._disk_files():
+                    _remove(join(self.path, name))
+                self._disk_bytes = 0
+
+
+    # -- Private Methods ----------------------------------
+
+    def _remember(self, key, result):
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.counters['memory_evictions'] += 1
+
+    def _read(self, key):
+        if self.path is None:
+            return None
+        file_path = join(self.path, key + _SUFFIX)
+        try:
+            with open(file_path, 'rb') as f:
+                result = _decode(json_loads(f.read().decode('utf-8')))
+            utime(file_path)
+        except (OSError, ValueError, InvalidOperation):
+            return None
+        return result
+
+    def _write(self, key, result):
+        if self.path is None:
+            return
+        content = json_dumps(result, default=str, separators=(',', ':')).encode('utf-8')
+        if len(content) > self.max_bytes:
+            return
+        file_path = join(self.path, key + _SUFFIX)
+        partial = '{}.{}.partial'.format(file_path, id(self))
+        with open(partial, 'wb') as f:
+            f.write(content)
+        replace(partial, file_path)
+        self._disk_bytes += len(content)
+        if self._disk_bytes > self.max_bytes:
+            self._evict(keep=file_path)
+
+    def _evict(self, keep):
+        # Other processes may share the directory, so its true size is only known from a listing
+        files = sorted(self._disk_files(), key=lambda item: (item[1], item[0]))
+        self._disk_bytes = sum(size for _, _, size in files)
+        for name, _, size in files:
+            if self._disk_bytes <= self.max_bytes:
+                break
+            if join(self.path, name) == keep:
+                continue
+            if _remove(join(self.path, name)):
+                self.counters['disk_evictions'] += 1
+            self._disk_bytes -= size
+
+    def _disk_files(self):
+        files = []
+        for name in listdir(self.path):
+            if not name.endswith(_SUFFIX):
+                continue
+            try:
+                info = stat(join(self.path, name))
+            except OSError:
+                continue
+            files.append((name, info.st_mtime, info.st_size))
+        return files
+
+
+def _canonical(value, key=None):
+    if isinstance(value, dict):
+        return { k: _canonical(v, k) for k, v in value.items() }
+    if isinstance(value, (list, tuple)):
+        return [ _canonical(v) for v in value ]
+    if isinstance(value, bool) or value is None or key == 'name':
+        return value
+    if isinstance(value, (int, float, str, Decimal)):
+        try:
+            number = Decimal(str(value))
+        except InvalidOperation:
+            return value
+        if number.is_finite():
+            return { 'decimal': str(number.normalize()) }
+    return value if isinstance(value, str) else str(value)
+
+def _decode(result):
+    # Decimals are written as strings, and are all amounts of a simulation result
+    if isinstance(result, dict):
+        if isinstance(result.get('total_saved'), str):
+            result['total_saved'] = Decimal(result['total_saved'])
+        if isinstance(result.get('balances'), dict):
+            result['balances'] = { name: Decimal(balance) for name, balance in result['balances'].items() }
+    return result
+
+def _fingerprint(provider):
+    if not isinstance(provider, StrategyProvider):
+        error_msg = 'Only strategy providers can be part of a cache key.'
+        raise CacheError(error_msg)
+    attributes = {}
+    for name, value in vars(provider).items():
+        if isinstance(value, StrategyProvider):
+            attributes[name] = _fingerprint(value)
+        elif _is_plain(value):
+            attributes[name] = _canonical(value, name)
+        else:
+            error_msg = 'Results from a {} cannot be cached.'.format(type(provider).__name__)
+            raise CacheError(error_msg)
+    return { 'type': type(provider).__name__, 'attributes': attributes }
+
+def _is_plain(value):
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _is_plain(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return all(_is_plain(v) for v in value)
+    return value is None or isinstance(value, (bool, int, float, str, Decimal))
+
+def _remove(path):
+    try:
+        remove(path)
+    except OSError:
+        return False
+    return True
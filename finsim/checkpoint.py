@@ -0,0 +1,141 @@
+from io import BytesIO
+from os import replace
+from pickle import HIGHEST_PROTOCOL, Pickler, Unpickler, UnpicklingError
+from zlib import compress, decompress, error as ZlibError
+
+from finsim.simulation import Simulation
+from finsim.strategies import StrategyProvider
+from finsim.ui import UI
+
+FORMAT_VERSION = 1
+
+_PROVIDER_ID = 'strategy_provider'
+_STATE = (
+    'group_mode', 'quiet', 'engine', 'economy', 'ledger', 'model', 'month', 'steps',
+    'debt_free_month', 'savings_goal', 'max_months'
+)
+
+class CheckpointError(Exception):
+    pass
+
+def snapshot(simulation, level=6):
+    """
+    Returns the full state of ``simulation`` - its month, every person's payroll, expenses,
+    accounts, strategy history and the ledger - as compressed bytes.
+
+    Strategy providers are left out, as they may be interactive or hold resources, and are
+    supplied again on restore. So are any exporter and checkpointer. A simulation being profiled
+    cannot be snapshotted.
+    """
+    if simulation.profiler is not None:
+        error_msg = 'A simulation being profiled cannot be checkpointed.'
+        raise CheckpointError(error_msg)
+
+    state = { name: getattr(simulation, name) for name in _STATE }
+    buffer = BytesIO()
+    _Pickler(buffer, HIGHEST_PROTOCOL).dump((FORMAT_VERSION, state))
+    return compress(buffer.getvalue(), level)
+
+def restore(checkpoint, strategy_provider=None, exporter=None, checkpointer=None):
+    """
+    Returns a ``Simulation`` in exactly the state ``checkpoint`` was taken in, which continues
+    from that month when ``simulate`` is called. ``strategy_provider`` defaults to the UI.
+    """
+    provider = strategy_provider or UI()
+    try:
+        version, state = _Unpickler(BytesIO(decompress(checkpoint)), provider).load()
+    except (ZlibError, EOFError, UnpicklingError, ValueError) as e:
+        error_msg = 'The checkpoint could not be read: {}'.format(e)
+        raise CheckpointError(error_msg)
+    if version != FORMAT_VERSION:
+        error_msg = 'Checkpoint format {} is not supported.'.format(version)
+        raise CheckpointError(error_msg)
+
+    simulation = Simulation.__new__(Simulation)
+    simulation.max_months = None
+    for name, value in state.items():
+        setattr(simulation, name, value)
+    simulation.exporter = exporter
+    simulation.profiler = None
+    simulation.checkpointer = checkpointer
+
+    people = simulation.model.people if simulation.group_mode else [ simulation.model ]
+    for person in people:
+        person.savings.recalculate_total()
+    if simulation.group_mode:
+        simulation.model.recalculate_total()
+    return simulation
+
+def save(simulation, path):
+    """
+    Writes a snapshot of ``simulation`` to ``path``, replacing any earlier one only once the new
+    one is complete.
+    """
+    _write(path, snapshot(simulation))
+
+def load(path, strategy_provider=None, exporter=None, checkpointer=None):
+    with open(path, 'rb') as f:
+        return restore(f.read(), strategy_provider, exporter, checkpointer)
+
+
+class Checkpointer:
+    """
+    Snapshots a simulation every ``every`` months as it runs. The latest ``keep`` snapshots are
+    held in ``checkpoints`` (month → bytes), and the latest is also written to ``path`` if given.
+    Under the event engine, a snapshot is taken at the first step on or after each due month.
+    """
+
+    def __init__(self, every=12, path=None, keep=None):
+        if every < 1:
+            raise ValueError('Checkpoints must be at least one month apart.')
+        self.every = every
+        self.path = path
+        self.keep = keep
+        self.checkpoints = {}
+        self._month = None
+
+    def record(self, simulation):
+        month = simulation.month
+        previous = self._month if self._month is not None else month - 1
+        self._month = month
+        if month // self.every == previous // self.every:
+            return
+
+        data = snapshot(simulation)
+        self.checkpoints[month] = data
+        if self.keep is not None:
+            for old_month in sorted(self.checkpoints)[:-self.keep]:
+                del self.checkpoints[old_month]
+        if self.path is not None:
+            _write(self.path, data)
+
+    def latest(self):
+        if len(self.checkpoints) == 0:
+            return None
+        return self.checkpoints[max(self.checkpoints)]
+
+
+class _Pickler(Pickler):
+    def persistent_id(self, obj):
+        if isinstance(obj, StrategyProvider):
+            return _PROVIDER_ID
+        return None
+
+
+class _Unpickler(Unpickler):
+    def __init__(self, f, provider):
+        super().__init__(f)
+        self.provider = provider
+
+    def persistent_load(self, pid):
+        if pid == _PROVIDER_ID:
+            return self.provider
+        error_msg = 'Unknown persistent reference "{}".'.format(pid)
+        raise CheckpointError(error_msg)
+
+
+def _write(path, data):
+    partial = path + '.partial'
+    with open(partial, 'wb') as f:
+        f.write(data)
+    replace(partial, path)
@@ -0,0 +1,202 @@
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from decimal import Decimal
+from itertools import islice
+from json import loads as json_loads
+from os import cpu_count
+from sys import stdin
+
+from finsim import money
+from finsim.economy import default_parameters
+from finsim.sim_data import DataImportError, SimData, _lower_pairs
+from finsim.simulation import Simulation
+from finsim.strategies import RuleStrategy, StrategyError
+from finsim.utils import round_currency
+
+_MAX_ERRORS = 10
+
+class CohortStats:
+    """
+    Summary statistics of a cohort of households, built up one household at a time. Months are
+    held as histograms, so the size of the statistics is bounded by the horizon rather than the
+    number of households, and statistics from separate shards can be merged.
+    """
+
+    def __init__(self):
+        self.households = 0
+        self.reached = 0
+        self.debt_free = 0
+        self.errors = 0
+        self.months = Counter()
+        self.debt_free_months = Counter()
+        self.total_saved = Decimal('0')
+        self.error_samples = []
+
+    @property
+    def not_reached(self):
+        return self.households - self.errors - self.reached
+
+    def add(self, months, debt_free_month, total_saved):
+        """
+        Records a household which reached its goal in ``months`` months, or never did within the
+        horizon if ``months`` is None.
+        """
+        self.households += 1
+        if months is not None:
+            self.reached += 1
+            self.months[months] += 1
+        if debt_free_month is not None:
+            self.debt_free += 1
+            self.debt_free_months[debt_free_month] += 1
+        self.total_saved += total_saved
+
+    def add_error(self, message):
+        self.households += 1
+        self.errors += 1
+        if len(self.error_samples) < _MAX_ERRORS:
+            self.error_samples.append(message)
+
+    def merge(self, other):
+        self.households += other.households
+        self.reached += other.reached
+        self.debt_free += other.debt_free
+        self.errors += other.errors
+        self.months.update(other.months)
+        self.debt_free_months.update(other.debt_free_months)
+        self.total_saved += other.total_saved
+        self.error_samples += other.error_samples[:_MAX_ERRORS - len(self.error_samples)]
+        return self
+
+    def summary(self):
+        simulated = self.households - self.errors
+        return {
+            'households': self.households,
+            'reached': self.reached,
+            'not_reached': self.not_reached,
+            'errors': self.errors,
+            'reached_rate': self.reached / simulated if simulated > 0 else None,
+            'debt_free_rate': self.debt_free / simulated if simulated > 0 else None,
+            'months_to_goal': _distribution(self.months),
+            'debt_free_month': _distribution(self.debt_free_months),
+            'mean_total_saved': round_currency(self.total_saved / simulated) if simulated > 0 else None,
+            'error_samples': list(self.error_samples)
+        }
+
+
+def simulate_cohort(households, strategy=None, workers=None, shard_size=256, max_years=100,
+                    engine='event', storage='arrays', economy=None):
+    """
+    Simulates every household in ``households`` - an iterable of ``SimData``, data dicts or lines
+    of JSON - and returns their ``CohortStats``. Households which do not reach their goal within
+    ``max_years`` are counted as not reached, and invalid ones as errors.
+
+    Households are read lazily and sent to worker processes in shards of ``shard_size``, with at
+    most two shards per worker in flight, so memory stays bounded however large the cohort is.
+    Each worker reduces its shard to statistics, and only those are sent back. ``strategy`` is
+    either a dict of ``RuleStrategy`` arguments or any picklable strategy provider.
+    """
+    strategy = {} if strategy is None else strategy
+    economy = economy or default_parameters()
+    max_months = max_years * 12
+    workers = workers or cpu_count() or 1
+    shards = _shards(households, shard_size)
+    stats = CohortStats()
+
+    if workers == 1:
+        for shard in shards:
+            stats.merge(simulate_shard(shard, strategy, max_months, engine, storage, economy))
+        return stats
+
+    backend = money.get_backend().name
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for shard in shards:
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stats.merge(future.result())
+            pending.add(executor.submit(
+                money.call_with_backend, backend, simulate_shard, shard, strategy, max_months, engine,
+                storage, economy))
+        for future in pending:
+            stats.merge(future.result())
+    return stats
+
+def simulate_shard(households, strategy, max_months, engine='event', storage='arrays', economy=None):
+    stats = CohortStats()
+    provider = RuleStrategy(**strategy) if isinstance(strategy, dict) else strategy
+    for household in households:
+        try:
+            simulation = Simulation(
+                _load(household), provider, quiet=True, engine=engine, storage=storage,
+                economy=economy, report_detail='none')
+            reached = simulation.advance(until=max_months)
+        except (DataImportError, StrategyError, ValueError) as e:
+            stats.add_error(str(e))
+            continue
+        except Exception as e:
+            # One failing household must not fail the rest of the cohort
+            stats.add_error('The simulation failed: {}'.format(repr(e)))
+            continue
+        stats.add(
+            simulation.month if reached else None, simulation.debt_free_month,
+            simulation.model.total_saved())
+    return stats
+
+def iter_lines(path):
+    """
+    Lazily yields each non-blank line of a JSONL file, or of stdin when ``path`` is '-', leaving
+    parsing and validation to the workers.
+    """
+    if path == '-':
+        yield from _non_blank(stdin)
+    else:
+        with open(path, 'r') as f:
+            yield from _non_blank(f)
+
+def _shards(households, shard_size):
+    iterator = iter(households)
+    while True:
+        shard = [ _portable(household) for household in islice(iterator, shard_size) ]
+        if len(shard) == 0:
+            return
+        yield shard
+
+def _portable(household):
+    return household.data if isinstance(household, SimData) else household
+
+def _load(household):
+    if isinstance(household, str):
+        household = json_loads(household, object_pairs_hook=_lower_pairs)
+        if not isinstance(household, dict):
+            error_msg = 'Each household must be a JSON object.'
+            raise DataImportError(error_msg)
+    return SimData.from_dict(household)
+
+def _non_blank(lines):
+    for line in lines:
+        if line.strip():
+            yield line
+
+def _distribution(histogram):
+    count = sum(histogram.values())
+    if count == 0:
+        return None
+    values = sorted(histogram)
+    distribution = {
+        'min': values[0],
+        'mean': sum(value * n for value, n in histogram.items()) / count,
+        'max': values[-1]
+    }
+    for name, fraction in (('p10', 0.1), ('p50', 0.5), ('p90', 0.9)):
+        distribution[name] = _percentile(values, histogram, count, fraction)
+    return distribution
+
+def _percentile(values, histogram, count, fraction):
+    rank = min(int(fraction * count), count - 1)
+    seen = 0
+    for value in values:
+        seen += histogram[value]
+        if seen > rank:
+            return value
+    return values[-1]
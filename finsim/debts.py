@@ -1,23 +1,34 @@
 from decimal import Decimal as D
 
 from finsim.accounts import AccountGroup, Account
-from finsim.utils import get_percentage_of, round_currency_to_pounds
+from finsim.ledger import PAYMENT
+from finsim.utils import round_currency_to_pounds
 
 class Debts(AccountGroup):
-    def __init__(self, accounts_data):
-        super().__init__(Debt, accounts_data)
+    def __init__(self, accounts_data, ledger=None, person=None):
+        super().__init__(Debt, accounts_data, ledger, person)
         self.recently_cleared = []
 
-    def pay(self):
+    def pay(self, months=1):
         for name, debt in self.account_dict.items():
-            debt.pay()
+            debt.pay(months)
             cleared = debt.was_updated()
             if cleared: 
                 self.recently_cleared.append(name)
 
+    def months_until_cleared(self):
+        months = [ d.months_until_cleared() for _, d in self.account_dict.items() ]
+        months = [ m for m in months if m is not None ]
+        return min(months) if len(months) > 0 else None
+
     def reset_recently_cleared(self):
         self.recently_cleared = []
 
+    def fork(self, ledger):
+        forked = super().fork(ledger)
+        forked.recently_cleared = list(self.recently_cleared)
+        return forked
+
     def to_list(self, active_only=True):
         if active_only:
             return [ d for k, d in self.account_dict.items() if d.active ]
@@ -39,19 +50,25 @@ class Debts(AccountGroup):
         return debt_string
 
 class Debt(Account):
-    def __init__(self, account_data):
-        super().__init__(account_data) 
-        self.active = self.balance > 0
+    def __init__(self, account_data, ledger=None, person=None):
+        super().__init__(account_data, ledger, person)
+        self.active = self._balance > 0
         self.updated = False
 
-    def pay(self):
+    def pay(self, months=1):
         if self.active:
-            self.balance -= self.payment_amount
-            self._update_reports('Payments / Deposits', self.payment_amount)
-            active = self.balance > 0
+            amount = self._payment * months
+            self._balance -= amount
+            self.ledger.record(self.ledger_id, PAYMENT, amount)
+            active = self._balance > 0
             self.updated = self.active != active
             self.active = active
 
+    def months_until_cleared(self):
+        if not self.active or self._payment <= 0:
+            return None
+        return self.money.months_to_cover(self._balance, self._payment)
+
     def was_updated(self):
         if self.updated:
             self.updated = False
@@ -61,4 +78,5 @@ class Debt(Account):
 
     def end_year(self):
         if self.active:
-            super().end_year()
\ No newline at end of file
+            return super().end_year()
+        return self.money.zero
\ No newline at end of file
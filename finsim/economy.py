@@ -0,0 +1,48 @@
+from collections import namedtuple
+from functools import lru_cache
+from os import environ
+from dotenv import load_dotenv
+
+from finsim.utils import decimalise as D
+
+_FIELDS = (
+    'inflation_rate',
+    'ni_threshold', 'ni_rate',
+    'it_threshold', 'it_rate',
+    'sl_threshold', 'sl_rate'
+)
+
+class EconomicParameters(namedtuple('EconomicParameters', _FIELDS)):
+    """
+    Immutable inflation and tax assumptions for a single run - the inflation rate, and the
+    (threshold, rate) pairs for National Insurance, Income Tax and Student Loan deductions.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, *args, **kwargs):
+        params = super().__new__(cls, *args, **kwargs)
+        return super().__new__(cls, *[ D(value) for value in params ])
+
+    @classmethod
+    def from_environ(cls, path='.env'):
+        load_dotenv(path)
+        return cls(*[ environ[field.upper()] for field in cls._fields ])
+
+    @property
+    def tax_bands(self):
+        return (
+            (self.ni_threshold, self.ni_rate),
+            (self.it_threshold, self.it_rate),
+            (self.sl_threshold, self.sl_rate)
+        )
+
+    def replace(self, **changes):
+        return EconomicParameters(**dict(self._asdict(), **changes))
+
+@lru_cache(maxsize=None)
+def default_parameters():
+    """
+    The parameters given by the environment (and ``.env``), loaded on first use.
+    """
+    return EconomicParameters.from_environ()
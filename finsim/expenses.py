@@ -1,35 +1,57 @@
-from finsim.utils import get_percentage_of, round_currency, decimalise as D
-from finsim.sim_data import INFLATION_RATE
+from copy import copy
+
+from finsim.economy import default_parameters
+from finsim.money import get_backend
 
 class Expenses:
 
-    def __init__(self, expenses_data):
-        self.monthly_expenses = [ Expense(e) for e in expenses_data.get('monthly', []) ]
-        self.annual_expenses = [ Expense(e) for e in expenses_data.get('annual', []) ]
+    def __init__(self, expenses_data, economy=None):
+        self.money = get_backend()
+        self.monthly_expenses = [ Expense(e, economy) for e in expenses_data.get('monthly', []) ]
+        self.annual_expenses = [ Expense(e, economy) for e in expenses_data.get('annual', []) ]
         self._calculate_monthly_total()
 
+    @property
+    def monthly_total(self):
+        return self.money.to_decimal(self._monthly_total)
+
     def inflate(self):
         for expense in (self.monthly_expenses + self.annual_expenses):
             expense.inflate()
         self._calculate_monthly_total()
 
+    def fork(self):
+        """
+        Returns a copy whose costs inflate independently of these.
+        """
+        forked = copy(self)
+        forked.monthly_expenses = [ copy(e) for e in self.monthly_expenses ]
+        forked.annual_expenses = [ copy(e) for e in self.annual_expenses ]
+        return forked
+
 
     # -- Private Methods ----------------------------------
 
     def _calculate_monthly_total(self):
-        monthly_sum = sum([e.cost for e in self.monthly_expenses])
-        annual_sum = sum([e.cost for e in self.annual_expenses])
-        annual_per_month = round_currency( annual_sum / D('12'), round_up=True )
-        self.monthly_total = monthly_sum + annual_per_month
+        monthly_sum = sum([e._cost for e in self.monthly_expenses], self.money.zero)
+        annual_sum = sum([e._cost for e in self.annual_expenses], self.money.zero)
+        annual_per_month = self.money.divide( annual_sum, 12, round_up=True )
+        self._monthly_total = monthly_sum + annual_per_month
 
 
 class Expense:
-    def __init__(self, expense_data):
+    def __init__(self, expense_data, economy=None):
+        self.money = get_backend()
+        self.inflation_rate = (economy or default_parameters()).inflation_rate
         self.name = expense_data['name']
-        self.cost = D(expense_data['cost'])
+        self._cost = self.money.from_value(expense_data['cost'])
         self.inflation = expense_data.get('inflation', True)
 
+    @property
+    def cost(self):
+        return self.money.to_decimal(self._cost)
+
     def inflate(self):
         if self.inflation:
-            inflation_amount = get_percentage_of(self.cost, INFLATION_RATE)
-            self.cost += inflation_amount
+            inflation_amount = self.money.percentage_of(self._cost, self.inflation_rate)
+            self._cost += inflation_amount
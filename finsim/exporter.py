@@ -0,0 +1,165 @@
+from csv import writer as csv_writer
+from json import dump as json_dump
+from os import makedirs
+from os.path import join
+from struct import pack
+
+import numpy as np
+
+_NPY_HEADER_LENGTH = 128
+_COLUMNS = (
+    ('month', np.int32),
+    ('person', np.int32),
+    ('account', np.int32),
+    ('balance', np.int64)
+)
+
+class TrajectoryExporter:
+    """
+    Writes every account's balance as the simulation runs - one row of (month, person, account,
+    balance) per account per step - buffering ``chunk_size`` rows at a time so that the history is
+    never held in memory.
+
+    Under the event engine, only the months at which the simulation stops are written; use the
+    stepwise engine for a row every month.
+    """
+
+    def __init__(self, chunk_size=4096):
+        self.chunk_size = chunk_size
+        self.people = []
+        self.accounts = []
+        self.rows = 0
+        self._account_lists = []
+
+    def begin(self, model):
+        people = model.people if hasattr(model, 'people') else [ model ]
+        for person_index, person in enumerate(people):
+            self.people.append(person.name)
+            accounts = person.savings.to_list() + person.debts.to_list(active_only=False)
+            self._account_lists.append((person_index, accounts))
+            for account in accounts:
+                self.accounts.append({ 'person': person.name, 'name': account.name })
+        self._open()
+
+    def record(self, month):
+        account_index = 0
+        for person_index, accounts in self._account_lists:
+            for account in accounts:
+                self._write_row(month, person_index, account_index, account.balance)
+                account_index += 1
+
+    def close(self):
+        try:
+            self._flush()
+        finally:
+            self._close()
+
+
+class CSVExporter(TrajectoryExporter):
+    """
+    Writes the trajectory as CSV, with people and accounts by name and balances in pounds.
+    """
+
+    def __init__(self, path, chunk_size=4096):
+        super().__init__(chunk_size)
+        self.path = path
+        self._buffer = []
+
+    def _open(self):
+        self._file = open(self.path, 'w', newline='')
+        self._writer = csv_writer(self._file)
+        self._writer.writerow([ 'month', 'person', 'account', 'balance' ])
+
+    def _write_row(self, month, person_index, account_index, balance):
+        self._buffer.append((month, self.people[person_index], self.accounts[account_index]['name'], balance))
+        if len(self._buffer) >= self.chunk_size:
+            self._flush()
+
+    def _flush(self):
+        self._writer.writerows(self._buffer)
+        self.rows += len(self._buffer)
+        self._buffer = []
+
+    def _close(self):
+        self._file.close()
+
+
+class ColumnarExporter(TrajectoryExporter):
+    """
+    Writes the trajectory to a directory holding one ``.npy`` file per column, readable with
+    ``numpy.load``, and a ``header.json`` naming the people and accounts the indices refer to.
+    Balances are in pence.
+    """
+
+    def __init__(self, directory, chunk_size=4096):
+        super().__init__(chunk_size)
+        self.directory = directory
+        self._buffer = { name: np.zeros(chunk_size, dtype=dtype) for name, dtype in _COLUMNS }
+        self._size = 0
+
+    def _open(self):
+        makedirs(self.directory, exist_ok=True)
+        self._files = {}
+        try:
+            for name, dtype in _COLUMNS:
+                self._files[name] = open(join(self.directory, '{}.npy'.format(name)), 'wb')
+                self._files[name].write(_npy_header(dtype, 0))
+        except BaseException:
+            for f in self._files.values():
+                f.close()
+            raise
+
+    def _write_row(self, month, person_index, account_index, balance):
+        i = self._size
+        self._buffer['month'][i] = month
+        self._buffer['person'][i] = person_index
+        self._buffer['account'][i] = account_index
+        self._buffer['balance'][i] = int(balance.scaleb(2))
+        self._size += 1
+        if self._size == self.chunk_size:
+            self._flush()
+
+    def _flush(self):
+        for name, f in self._files.items():
+            f.write(self._buffer[name][:self._size].tobytes())
+        self.rows += self._size
+        self._size = 0
+
+    def _close(self):
+        try:
+            for name, dtype in _COLUMNS:
+                f = self._files[name]
+                f.seek(0)
+                f.write(_npy_header(dtype, self.rows))
+        finally:
+            for f in self._files.values():
+                f.close()
+
+        header = {
+            'rows': self.rows,
+            'columns': { name: np.dtype(dtype).str for name, dtype in _COLUMNS },
+            'people': self.people,
+            'accounts': self.accounts
+        }
+        with open(join(self.directory, 'header.json'), 'w') as f:
+            json_dump(header, f, indent=4)
+
+
+def exporter_for(path, chunk_size=4096):
+    """
+    Returns a ``CSVExporter`` for paths ending in ``.csv``, otherwise a ``ColumnarExporter``.
+    """
+    if path.endswith('.csv'):
+        return CSVExporter(path, chunk_size)
+    return ColumnarExporter(path, chunk_size)
+
+def _npy_header(dtype, rows):
+    """
+    Returns a version 1.0 ``.npy`` header of fixed length, so it can be rewritten in place once the
+    final number of rows is known.
+    """
+    description = "{{'descr': '{}', 'fortran_order': False, 'shape': ({},), }}".format(
+        np.dtype(dtype).str, rows)
+    prefix_length = len(np.lib.format.MAGIC_PREFIX) + 4
+    padded = description.ljust(_NPY_HEADER_LENGTH - prefix_length - 1) + '\n'
+    return np.lib.format.MAGIC_PREFIX + b'\x01\x00' + pack('<H', len(padded)) + padded.encode('latin1')
@@ -0,0 +1,78 @@
+from math import ceil
+
+_HORIZON_YEARS = 1000
+# Pounds per person per month, covering the rounding of net pay, and per account, covering the
+# rounding of payments
+_SLACK = 1.0
+_PENNY = 0.01
+_LISA_BONUS = 1.25
+
+def earliest_month(simulation, limit=None):
+    """
+    Returns a lower bound on the month in which ``simulation`` can meet its savings goal, or None if
+    it provably cannot by month ``limit`` (or, with no limit, within a thousand years).
+
+    The bound supposes that, from now on, every person saves all of their disposable income into
+    the account which would grow it the most, while pay rises and expenses inflate as they will in
+    the simulation. It is found a year at a time, so costs next to nothing beside simulating.
+
+    It only holds for strategy providers which never pay out more than disposable income (see
+    ``StrategyProvider.within_income``) and for tax bands under which net pay rises no faster than
+    gross pay. Otherwise nothing is proven, and the next month is returned.
+    """
+    model = simulation.model
+    people = model.people if simulation.group_mode else [ model ]
+    month = simulation.month
+    goal = float(simulation.savings_goal)
+    total = float(model.total_saved())
+    if total >= goal or not _bounded(simulation.economy, people):
+        return month + 1
+
+    pay = [
+        float(person.payroll.net_monthly) + _SLACK + (_PENNY * len(person.savings.to_list()))
+        for person in people
+    ]
+    payrises = [ max(1 + float(person.payroll.payrise_rate) / 100, 1.0) for person in people ]
+    expenses = sum([ float(person.expenses.monthly_total) for person in people ])
+    if simulation.group_mode:
+        expenses += float(model.expenses.monthly_total)
+    inflation = min(1 + float(simulation.economy.inflation_rate) / 100, 1.0)
+    accounts = [ account for person in people for account in person.savings.to_list() ]
+    growth = 1 + max([ 0.0 ] + [ float(account.interest_rate) for account in accounts ]) / 100
+    bonus = _LISA_BONUS if any(account.type == 'lisa' for account in accounts) else 1.0
+
+    last = limit if limit is not None else month + (_HORIZON_YEARS * 12)
+    while month < last:
+        year_end = ((month // 12) + 1) * 12
+        deposit = max(sum(pay) - expenses, 0.0) * bonus
+        months = min(year_end, last) - month
+        if deposit > 0 and total + (deposit * months) >= goal:
+            return month + max(ceil((goal - total) / deposit), 1)
+        total += deposit * months
+        month += months
+        if month < year_end:
+            break
+
+        total *= growth
+        if total >= goal:
+            return month
+        stagnant = all(payrise == 1 for payrise in payrises) and (inflation == 1 or expenses == 0)
+        if deposit == 0 and stagnant and (growth == 1 or total <= 0):
+            return None
+        pay = [ amount * payrise for amount, payrise in zip(pay, payrises) ]
+        expenses *= inflation
+    return None
+
+def _bounded(economy, people):
+    # Net pay is affine in gross pay, so rises no faster than it while every band's rate and
+    # threshold is non-negative and the rates leave something of each pound earned
+    rates = [ rate for _, rate in economy.tax_bands ]
+    thresholds = [ threshold for threshold, _ in economy.tax_bands ]
+    if any(rate < 0 for rate in rates) or sum(rates) > 100 or any(threshold < 0 for threshold in thresholds):
+        return False
+    for person in people:
+        if not getattr(person.strategy_provider, 'within_income', False):
+            return False
+        if not 0 <= person.payroll.pension_rate <= 100:
+            return False
+    return True
@@ -0,0 +1,164 @@
+from copy import deepcopy
+from decimal import Decimal
+
+from finsim.sim_data import SimData
+from finsim.simulation import Simulation
+from finsim.strategies import RuleStrategy, StrategyProvider
+from finsim.utils import decimalise as D
+
+_PENNY = Decimal('0.01')
+_MAX_BRACKETS = 40
+
+class GoalSeekError(Exception):
+    pass
+
+class PinnedDeposit(StrategyProvider):
+    """
+    Wraps another strategy provider, replacing the payment into one person's savings account with
+    a fixed ``amount`` and leaving everything else as the wrapped provider chose.
+
+    ``affordable`` becomes False once the amount has exceeded what was left for the account - its
+    own payment and any disposable income the wrapped provider left unallocated.
+    """
+
+    def __init__(self, provider, person, account, amount):
+        self.provider = provider
+        self.person = person
+        self.account = account
+        self.amount = D(amount)
+        self.affordable = True
+
+    def obtain_initial_strategy(self, person):
+        return self._pin(person, self.provider.obtain_initial_strategy(person))
+
+    def obtain_new_strategy(self, person):
+        return self._pin(person, self.provider.obtain_new_strategy(person))
+
+
+    # -- Private Methods ----------------------------------
+
+    def _pin(self, person, strategy):
+        if person.name != self.person:
+            return strategy
+        for item in strategy['savings']:
+            if item['name'] == self.account:
+                if self.amount > item['payment'] + max(strategy['remaining'], D('0')):
+                    self.affordable = False
+                strategy['remaining'] += item['payment'] - self.amount
+                item['payment'] = self.amount
+        return strategy
+
+
+def savings_trajectory(data, months, strategy_provider=None, economy=None, storage='objects'):
+    """
+    Simulates ``data`` (a ``SimData``) for ``months`` months, ignoring its savings goal, and returns
+    the total saved at month 0 and then at the end of every month as the goal is checked against
+    it - before any interest is posted at the end of a year.
+    """
+    raw_data = deepcopy(data.data)
+    raw_data['savings_goal'] = '1'
+    simulation = _Trajectory(
+        SimData.from_dict(raw_data), strategy_provider or RuleStrategy(), quiet=True,
+        engine='stepwise', storage=storage, economy=economy, report_detail='none')
+    simulation.totals.append(simulation.model.total_saved())
+    simulation.advance(until=months)
+    return simulation.totals
+
+def maximum_goal(data, months, strategy_provider=None, economy=None, storage='objects'):
+    """
+    Returns the largest savings goal that ``data`` reaches within ``months`` months.
+
+    Balances never fall, so whether a goal is met by a given month is monotone in the goal, and a
+    single run gives the answer for every goal at once: the total saved at ``months``.
+    """
+    return savings_trajectory(data, months, strategy_provider, economy, storage)[months]
+
+def minimum_deposit(data, person, account, months, strategy_provider=None, goal=None, economy=None,
+                    storage='objects'):
+    """
+    Returns the smallest monthly payment into ``person``'s savings ``account``, to the penny, with
+    which the savings goal (``goal``, or the one in ``data``) is met within ``months`` months. Other
+    payments are left to ``strategy_provider``, a ``RuleStrategy`` by default.
+
+    Meeting the goal is monotone in the deposit, so the answer is bracketed by doubling and then
+    found by bisection, needing a number of simulations logarithmic in the deposit. The deposit
+    must be affordable every month (see ``PinnedDeposit``); if it is not, ``GoalSeekError`` is
+    raised.
+    """
+    _check_account(data, person, account)
+    goal = D(goal) if goal is not None else data.savings_goal
+    if goal is None:
+        error_msg = 'A savings goal must be provided to find a minimum deposit.'
+        raise GoalSeekError(error_msg)
+    if months < 1:
+        error_msg = 'The target must be at least one month away.'
+        raise GoalSeekError(error_msg)
+
+    raw_data = deepcopy(data.data)
+    raw_data['savings_goal'] = str(goal)
+    provider = strategy_provider or RuleStrategy()
+    # The deposit applies from the first month, so probes share no simulated months - only the
+    # loaded starting state, which each one forks
+    start = Simulation(
+        SimData.from_dict(raw_data), provider, quiet=True, engine='event', storage=storage,
+        economy=economy, report_detail='none')
+
+    def reaches_goal(pence):
+        pinned = PinnedDeposit(provider, person, account, Decimal(pence) * _PENNY)
+        return start.fork(pinned).advance(until=months), pinned.affordable
+
+    if reaches_goal(0)[0]:
+        return Decimal('0.00')
+
+    low = 0
+    high = max(int((goal / months) / _PENNY), 1)
+    for _ in range(_MAX_BRACKETS):
+        reached, affordable = reaches_goal(high)
+        if reached:
+            break
+        if not affordable:
+            error_msg = '{} cannot afford a deposit into {} which reaches the goal within {} months.'.format(
+                person, account, months)
+            raise GoalSeekError(error_msg)
+        low, high = high, high * 2
+    else:
+        error_msg = 'No deposit into {} reaches the goal within {} months.'.format(account, months)
+        raise GoalSeekError(error_msg)
+
+    while high - low > 1:
+        middle = (low + high) // 2
+        reached, middle_affordable = reaches_goal(middle)
+        if reached:
+            high, affordable = middle, middle_affordable
+        else:
+            low = middle
+
+    if not affordable:
+        error_msg = '{} cannot afford the £{} a month into {} needed to reach the goal within {} months.'.format(
+            person, Decimal(high) * _PENNY, account, months)
+        raise GoalSeekError(error_msg)
+    return Decimal(high) * _PENNY
+
+class _Trajectory(Simulation):
+    """
+    A simulation which never meets its goal, recording the total saved each time it is checked.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.totals = []
+        super().__init__(*args, **kwargs)
+
+    def _achieved_goal(self):
+        self.totals.append(self.model.total_saved())
+        return False
+
+
+def _check_account(data, person, account):
+    for person_data in data.get_people():
+        if person_data['name'] == person:
+            if any(a['name'] == account for a in person_data['savings']):
+                return
+            error_msg = '{} has no savings account named "{}".'.format(person, account)
+            raise GoalSeekError(error_msg)
+    error_msg = 'No person named "{}" is in the data.'.format(person)
+    raise GoalSeekError(error_msg)
@@ -1,47 +1,134 @@
+from asyncio import gather
+from copy import copy
+
+from finsim import utils
 from finsim.expenses import Expenses
+from finsim.ledger import Ledger
+from finsim.money import get_backend
 from finsim.person import Person
+from finsim.strategies import AsyncStrategyProvider, StrategyError
 from finsim.utils import get_percentage_of, round_currency
 
 class Group:
-    def __init__(self, data):
+    def __init__(self, data, strategy_provider=None, storage='objects', economy=None, ledger=None):
         people_data = data.get_people()
-        self.people = [Person(person) for person in people_data]
-        self.expenses = Expenses(data.get_shared_expenses())
+        self.ledger = ledger or Ledger()
+        self.people = [
+            Person(person, strategy_provider, storage, economy, self.ledger) for person in people_data
+        ]
+        self.expenses = Expenses(data.get_shared_expenses(), economy)
         self.proportional_expenses = data.proportional_expenses
         self.updated = False
+        self.money = get_backend()
+        self.recalculate_total()
 
     def begin_year(self):
         monthly_expense_total = self.expenses.monthly_total
         if self.proportional_expenses:
             combined_salaries = sum([person.payroll.gross for person in self.people])
-            for person in self.people:
-                contrib_ratio = (person.payroll.gross / combined_salaries) * 100
-                contrib = get_percentage_of(monthly_expense_total, contrib_ratio, round_up=True)
-                person.begin_year(joint_contrib=contrib)
+            contribs = [
+                get_percentage_of(
+                    monthly_expense_total, (person.payroll.gross / combined_salaries) * 100, round_up=True)
+                for person in self.people
+            ]
         else:
             num_people = len(self.people)
-            for person in self.people:
-                contrib = round_currency(monthly_expense_total / num_people, round_up=True)
+            contrib = round_currency(monthly_expense_total / num_people, round_up=True)
+            contribs = [ contrib ] * num_people
+
+        loop = self._concurrent_loop()
+        for person, contrib in zip(self.people, contribs):
+            if loop is None:
                 person.begin_year(joint_contrib=contrib)
-        
+            else:
+                person.begin_year(joint_contrib=contrib, strategise=False)
+        if loop is not None:
+            _strategise_concurrently(loop, self.people)
+
         self.updated = False
 
-    def simulate_month(self):
+    def simulate_month(self, months=1):
         for person in self.people:
-            person.simulate_month()
+            self._total_saved += person.simulate_month(months)
             if person.updated:
                 self.updated = True
         
     def total_saved(self):
-        return sum([person.total_saved() for person in self.people])
+        total = self.money.to_decimal(self._total_saved)
+        if utils.VERIFY_TOTALS:
+            utils.verify_total('group', total, self._sum_totals())
+        return total
+
+    def recalculate_total(self):
+        self._total_saved = self.money.from_value(self._sum_totals())
+
+    def debt_free(self):
+        return all([person.debt_free() for person in self.people])
+
+    def monthly_deposit(self):
+        return sum([person.monthly_deposit() for person in self.people])
+
+    def months_until_debt_cleared(self):
+        months = [ person.months_until_debt_cleared() for person in self.people ]
+        months = [ m for m in months if m is not None ]
+        return min(months) if len(months) > 0 else None
 
     def end_year(self):
         self.expenses.inflate()
         for person in self.people:
-            person.end_year()
+            self._total_saved += person.end_year()
 
     def strategise(self):
-        for person in self.people:
-            if person.updated:
+        people = [ person for person in self.people if person.updated ]
+        loop = self._concurrent_loop()
+        if loop is None:
+            for person in people:
                 person.strategise()
+        else:
+            _strategise_concurrently(loop, people)
         self.updated = False
+
+    def fork(self, ledger):
+        forked = copy(self)
+        forked.ledger = ledger
+        forked.people = [ person.fork(ledger) for person in self.people ]
+        forked.expenses = self.expenses.fork()
+        return forked
+
+
+    # -- Private Methods ----------------------------------
+
+    def _sum_totals(self):
+        return sum([person.total_saved() for person in self.people])
+
+    def _concurrent_loop(self):
+        """
+        Returns the event loop shared by the people's async strategy providers, or None if none of
+        them have one.
+        """
+        loops = set(
+            person.strategy_provider.loop for person in self.people
+            if isinstance(person.strategy_provider, AsyncStrategyProvider)
+        )
+        if len(loops) > 1:
+            error_msg = 'The async strategy providers in a group must share an event loop.'
+            raise StrategyError(error_msg)
+        return loops.pop() if len(loops) == 1 else None
+
+
+def _strategise_concurrently(loop, people):
+    # People with synchronous providers, such as the UI, are asked one after another on a worker
+    # thread, so a blocking prompt neither holds up the async requests nor overlaps another prompt
+    asynchronous = [ p for p in people if isinstance(p.strategy_provider, AsyncStrategyProvider) ]
+    synchronous = [ p for p in people if p not in asynchronous ]
+
+    def strategise_synchronous():
+        for person in synchronous:
+            person.strategise()
+
+    async def strategise_all():
+        requests = [ person.strategise_async() for person in asynchronous ]
+        if len(synchronous) > 0:
+            requests.append(loop.run_in_executor(None, strategise_synchronous))
+        await gather(*requests)
+    loop.run_until_complete(strategise_all())
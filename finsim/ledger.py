@@ -0,0 +1,180 @@
+from copy import copy
+
+import numpy as np
+
+from finsim.money import get_backend
+
+PAYMENT, INTEREST, BONUS = range(3)
+KIND_NAMES = ('Payments / Deposits', 'Interest', 'Government Bonus')
+
+_COLUMNS = (
+    ('month', np.int32),
+    ('person', np.int32),
+    ('account', np.int32),
+    ('kind', np.int8),
+    ('amount', np.int64)
+)
+
+class Ledger:
+    """
+    Records every posting to an account as a row of (month, person, account, kind, amount), held
+    in preallocated typed columns which double in size as they fill. Amounts in the columns are in
+    pence.
+
+    ``detail`` selects how much is kept:
+
+    * ``'none'`` - nothing is recorded, and account reports are unavailable.
+    * ``'annual'`` - annual and overall totals are kept, with one row per account and kind written
+      when each year closes.
+    * ``'monthly'`` - every posting is also written as a row as it happens. Under the event engine
+      a posting may cover several months, and is stamped with the last of them.
+
+    Annual and overall reports are running rollups, so reading them costs the same at any detail.
+    """
+
+    DETAILS = ('none', 'annual', 'monthly')
+
+    def __init__(self, detail='annual', capacity=1024):
+        if detail not in Ledger.DETAILS:
+            raise ValueError('"{}" is not a valid report detail.'.format(detail))
+        self.detail = detail
+        self.enabled = detail != 'none'
+        self.monthly = detail == 'monthly'
+        self.money = get_backend()
+        self.month = 0
+        self.people = []
+        self.accounts = []
+        self.size = 0
+        self._person_index = {}
+        self._account_people = []
+        self._annual = []
+        self._overall = []
+        self._flush_callbacks = []
+        self._columns = { name: np.zeros(capacity, dtype=dtype) for name, dtype in _COLUMNS }
+
+    def register(self, person, account):
+        """
+        Adds an account, returning the id used to record postings against it.
+        """
+        if person not in self._person_index:
+            self._person_index[person] = len(self.people)
+            self.people.append(person)
+        self._account_people.append(self._person_index[person])
+        self.accounts.append(account)
+        self._annual.append([ self.money.zero ] * len(KIND_NAMES))
+        self._overall.append([ self.money.zero ] * len(KIND_NAMES))
+        return len(self.accounts) - 1
+
+    def record(self, account_id, kind, amount):
+        if not self.enabled:
+            return
+        self._annual[account_id][kind] += amount
+        self._overall[account_id][kind] += amount
+        if self.monthly and amount != 0:
+            self._append(self.month, account_id, kind, self.money.to_pence(amount))
+
+    def record_many(self, account_ids, kind, amounts, month=None):
+        """
+        Writes rows for a batch of postings already in pence, e.g. from ``AccountArrays``. Only
+        rows are written; the batch's own report totals are kept by the caller.
+        """
+        mask = amounts != 0
+        account_ids = account_ids[mask]
+        count = len(account_ids)
+        if count == 0:
+            return
+        self._reserve(count)
+        rows = slice(self.size, self.size + count)
+        columns = self._columns
+        columns['month'][rows] = self.month if month is None else month
+        columns['person'][rows] = np.take(self._account_people, account_ids)
+        columns['account'][rows] = account_ids
+        columns['kind'][rows] = kind
+        columns['amount'][rows] = amounts[mask]
+        self.size += count
+
+    def annual(self, account_id, kinds):
+        totals = self._annual[account_id]
+        return { KIND_NAMES[kind]: totals[kind] for kind in kinds }
+
+    def overall(self, account_id, kinds):
+        totals = self._overall[account_id]
+        return { KIND_NAMES[kind]: totals[kind] for kind in kinds }
+
+    def begin_year(self, account_id):
+        """
+        Starts a new year for one account. At annual detail, the totals of the year just ended are
+        written as rows first.
+        """
+        if not self.enabled:
+            return
+        if not self.monthly:
+            self._close_year(account_id, max(self.month - 1, 0))
+        self._annual[account_id] = [ self.money.zero ] * len(KIND_NAMES)
+
+    def on_flush(self, callback):
+        """
+        Registers ``callback(month)`` to write the totals of anything keeping its own rollups.
+        """
+        self._flush_callbacks.append(callback)
+
+    def flush(self):
+        """
+        Writes the totals of the current, unfinished year at annual detail. Called once, when the
+        simulation ends.
+        """
+        if self.enabled and not self.monthly:
+            for account_id in range(len(self.accounts)):
+                self._close_year(account_id, self.month)
+            for callback in self._flush_callbacks:
+                callback(self.month)
+
+    def fork(self):
+        """
+        Returns a copy which records independently of this ledger from here on. The registered
+        people and accounts are shared, as none are added once a simulation is running.
+        """
+        forked = copy(self)
+        forked._annual = [ list(totals) for totals in self._annual ]
+        forked._overall = [ list(totals) for totals in self._overall ]
+        forked._flush_callbacks = []
+        forked._columns = {
+            name: column[:max(self.size, 1)].copy() for name, column in self._columns.items()
+        }
+        return forked
+
+    def columns(self):
+        """
+        Returns each column, trimmed to the rows written so far.
+        """
+        return { name: column[:self.size] for name, column in self._columns.items() }
+
+
+    # -- Private Methods ----------------------------------
+
+    def _close_year(self, account_id, month):
+        for kind, amount in enumerate(self._annual[account_id]):
+            if amount != 0:
+                self._append(month, account_id, kind, self.money.to_pence(amount))
+
+    def _append(self, month, account_id, kind, amount):
+        self._reserve(1)
+        i = self.size
+        columns = self._columns
+        columns['month'][i] = month
+        columns['person'][i] = self._account_people[account_id]
+        columns['account'][i] = account_id
+        columns['kind'][i] = kind
+        columns['amount'][i] = amount
+        self.size += 1
+
+    def _reserve(self, count):
+        capacity = len(self._columns['month'])
+        if self.size + count <= capacity:
+            return
+        while capacity < self.size + count:
+            capacity *= 2
+        for name, column in self._columns.items():
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            self._columns[name] = grown
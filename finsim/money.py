@@ -0,0 +1,138 @@
+from decimal import ROUND_DOWN, Decimal as D
+from functools import lru_cache
+from math import ceil, copysign, trunc
+
+from finsim.utils import get_percentage_of, months_to_cover, round_currency, decimalise
+
+_EPSILON = 1e-6
+
+class DecimalMoney:
+    """
+    Exact ``Decimal`` amounts in pounds. This is the default backend.
+    """
+
+    name = 'decimal'
+    zero = D('0')
+
+    def from_value(self, value):
+        return value if isinstance(value, D) else decimalise(value)
+
+    def to_decimal(self, amount):
+        return amount
+
+    def to_pence(self, amount):
+        return int(amount.scaleb(2))
+
+    def percentage_of(self, amount, percentage, round_up=False):
+        return get_percentage_of(amount, percentage, round_up)
+
+    def divide(self, amount, divisor, round_up=False):
+        return round_currency(amount / divisor, round_up)
+
+    def months_to_cover(self, amount, monthly_amount):
+        return months_to_cover(amount, monthly_amount)
+
+
+class PenceMoney:
+    """
+    Integer amounts in pence, rounded exactly as ``DecimalMoney`` rounds (``ROUND_DOWN`` towards
+    zero, ``ROUND_UP`` away from zero) using integer arithmetic only.
+    """
+
+    name = 'pence'
+    zero = 0
+
+    def from_value(self, value):
+        return int(decimalise(value).scaleb(2).to_integral_value(rounding=ROUND_DOWN))
+
+    def to_decimal(self, amount):
+        return D(amount).scaleb(-2)
+
+    def to_pence(self, amount):
+        return amount
+
+    def percentage_of(self, amount, percentage, round_up=False):
+        numerator, denominator = percentage_ratio(percentage)
+        return _divide_rounded(amount * numerator, denominator, round_up)
+
+    def divide(self, amount, divisor, round_up=False):
+        return _divide_rounded(amount, int(divisor), round_up)
+
+    def months_to_cover(self, amount, monthly_amount):
+        return -(-amount // monthly_amount)
+
+
+class FloatMoney:
+    """
+    Floating point amounts in pence, as used by the Monte Carlo engine. Fast, but not guaranteed
+    to match the exact backends to the penny.
+    """
+
+    name = 'float'
+    zero = 0.0
+
+    def from_value(self, value):
+        return float(decimalise(value) * 100)
+
+    def to_decimal(self, amount):
+        return D(repr(amount)).scaleb(-2)
+
+    def to_pence(self, amount):
+        return int(round(amount))
+
+    def percentage_of(self, amount, percentage, round_up=False):
+        return _round_float(amount * (float(percentage) / 100), round_up)
+
+    def divide(self, amount, divisor, round_up=False):
+        return _round_float(amount / float(divisor), round_up)
+
+    def months_to_cover(self, amount, monthly_amount):
+        return int(ceil((amount / monthly_amount) - _EPSILON))
+
+
+BACKENDS = {
+    backend.name: backend for backend in (DecimalMoney(), PenceMoney(), FloatMoney())
+}
+
+_backend = BACKENDS['decimal']
+
+def get_backend():
+    return _backend
+
+def set_backend(name):
+    """
+    Selects the backend used by accounts, payrolls and expenses created from now on.
+    """
+    global _backend
+    try:
+        _backend = BACKENDS[name]
+    except KeyError:
+        raise ValueError('"{}" is not a valid money backend.'.format(name))
+
+def call_with_backend(name, function, *args):
+    """
+    Calls ``function`` with ``args`` under the backend ``name``. Worker processes which are spawned
+    rather than forked start with the default backend, so work sent to them is wrapped in this.
+    """
+    set_backend(name)
+    return function(*args)
+
+
+@lru_cache(maxsize=256)
+def percentage_ratio(percentage):
+    """
+    Returns integers ``(n, d)`` such that ``percentage`` percent of ``x`` is exactly ``x * n / d``.
+    """
+    numerator, denominator = D(percentage).as_integer_ratio()
+    return numerator, denominator * 100
+
+def _divide_rounded(numerator, denominator, round_up):
+    quotient = abs(numerator) // denominator
+    if round_up and (abs(numerator) % denominator) != 0:
+        quotient += 1
+    return quotient if (numerator >= 0) else -quotient
+
+def _round_float(value, round_up):
+    if round_up:
+        return copysign(ceil(abs(value) - _EPSILON), value)
+    return float(trunc(value + copysign(_EPSILON, value)))
@@ -0,0 +1,279 @@
+import numpy as np
+
+from finsim.payroll import TaxSchedule
+from finsim.simulation import Simulation
+from finsim.strategies import RuleStrategy
+
+_EPSILON = 1e-6
+
+class MonteCarlo:
+    """
+    Simulates many scenarios of the same household at once, drawing a fresh inflation path and
+    payrise path for every scenario. All money is held as ``(scenarios,)`` arrays of pence.
+
+    Each person's strategy is expressed as a share of their disposable income per account, taken
+    from ``shares`` (person name → account name → share) or, failing that, from the initial
+    strategy supplied by ``strategy_provider``. When a debt clears, its share rolls over to the next
+    active debt in ``order``, then to savings in proportion to their shares.
+    """
+
+    def __init__(self, data, strategy_provider=None, shares=None, scenarios=10000, max_years=50,
+                 inflation_sd='1.0', payrise_sd='1.0', order='avalanche', seed=None, economy=None):
+        simulation = Simulation(
+            data, strategy_provider or RuleStrategy(order=order), quiet=True, economy=economy,
+            report_detail='none')
+        model = simulation.model
+        model.begin_year()
+        people = model.people if simulation.group_mode else [ model ]
+        people_data = data.get_people()
+
+        self.savings_goal = _to_pence(simulation.savings_goal)
+        self.scenarios = scenarios
+        self.max_years = max_years
+        self.proportional_expenses = bool(data.proportional_expenses)
+        self.shared_expenses = _ExpenseArrays(model.expenses, scenarios) if simulation.group_mode else None
+        self.people = [
+            _PersonArrays(person, person_data['salary'], scenarios, (shares or {}).get(person.name), order)
+            for person, person_data in zip(people, people_data)
+        ]
+
+        rng = np.random.default_rng(seed)
+        shape = (scenarios, max_years)
+        self.inflation_paths = rng.normal(float(simulation.economy.inflation_rate), float(inflation_sd), shape)
+        for person in self.people:
+            if person.payrise_rate is None:
+                person.payrise_paths = self.inflation_paths
+            else:
+                person.payrise_paths = rng.normal(person.payrise_rate, float(payrise_sd), shape)
+
+    def assign_shares(self, shares):
+        """
+        Gives every scenario its own strategy. ``shares`` maps person name to a ``(scenarios,
+        accounts)`` array of shares, with accounts in ``account_names`` order.
+        """
+        for person in self.people:
+            if person.name in shares:
+                person.assign_shares(np.asarray(shares[person.name], dtype=float))
+
+    def account_names(self, person_name):
+        """
+        Returns the names of a person's accounts in the order their shares are held: debts, then
+        savings accounts.
+        """
+        for person in self.people:
+            if person.name == person_name:
+                return list(person.account_names)
+        error_msg = 'No person named "{}" is in the simulation.'.format(person_name)
+        raise KeyError(error_msg)
+
+    def run(self):
+        months_to_goal = np.full(self.scenarios, -1, dtype=np.int32)
+        for year in range(self.max_years):
+            self._begin_year()
+            for month in range(1, 13):
+                total_saved = np.zeros(self.scenarios)
+                for person in self.people:
+                    person.simulate_month()
+                    total_saved += person.total_saved()
+
+                reached = (total_saved >= self.savings_goal) & (months_to_goal < 0)
+                months_to_goal[reached] = (year * 12) + month
+                if (months_to_goal >= 0).all():
+                    return MonteCarloResult(months_to_goal)
+
+            self._end_year(year)
+
+        return MonteCarloResult(months_to_goal)
+
+
+    # -- Private Methods ----------------------------------
+
+    def _begin_year(self):
+        if self.shared_expenses is None:
+            self.people[0].begin_year(np.zeros(self.scenarios))
+            return
+
+        monthly_total = self.shared_expenses.monthly_total()
+        if self.proportional_expenses:
+            combined_salaries = sum(person.gross for person in self.people)
+            for person in self.people:
+                contrib_ratio = person.gross / combined_salaries
+                person.begin_year(_round_up(monthly_total * contrib_ratio))
+        else:
+            for person in self.people:
+                person.begin_year(_round_up(monthly_total / len(self.people)))
+
+    def _end_year(self, year):
+        inflation = self.inflation_paths[:, year]
+        if self.shared_expenses is not None:
+            self.shared_expenses.inflate(inflation)
+        for person in self.people:
+            person.end_year(year, inflation)
+
+
+class MonteCarloResult:
+    """
+    Months taken to reach the savings goal in each scenario, or -1 where it was not reached.
+    """
+
+    def __init__(self, months_to_goal):
+        self.months_to_goal = months_to_goal
+
+    def reached_fraction(self):
+        return float((self.months_to_goal >= 0).mean())
+
+    def percentile(self, q):
+        """
+        Returns the ``q``th percentile of months to goal, or None if it lies among the scenarios
+        which never reached the goal.
+        """
+        months = np.sort(np.where(self.months_to_goal >= 0, self.months_to_goal, np.inf))
+        result = months[int(np.ceil((q / 100) * (len(months) - 1)))]
+        return None if np.isinf(result) else int(result)
+
+    def summary(self):
+        reached = self.months_to_goal[self.months_to_goal >= 0]
+        return {
+            'scenarios': len(self.months_to_goal),
+            'reached_fraction': self.reached_fraction(),
+            'mean': float(reached.mean()) if len(reached) > 0 else None,
+            'p10': self.percentile(10),
+            'p50': self.percentile(50),
+            'p90': self.percentile(90)
+        }
+
+
+class _PersonArrays:
+    def __init__(self, person, salary_data, n, shares, order):
+        self.name = person.name
+        self.gross = np.full(n, _to_pence(person.payroll.gross))
+        self.pension_rate = float(person.payroll.pension_rate)
+        payrise_rate = salary_data.get('payrise_rate', None)
+        self.payrise_rate = None if payrise_rate is None else float(payrise_rate)
+        self.payrise_paths = None
+        self.tax_schedule = TaxSchedule.for_economy(person.payroll.economy)
+        self.expenses = _ExpenseArrays(person.expenses, n)
+        self._calculate_net_salary()
+
+        debts = person.debts.to_list(active_only=False)
+        savings = person.savings.to_list()
+        self.num_debts = len(debts)
+        self.debt_balance = np.tile([ _to_pence(d.balance) for d in debts ], (n, 1)).astype(float)
+        self.debt_rate = np.array([ float(d.interest_rate) for d in debts ])
+        self.debt_active = self.debt_balance > 0
+        self.savings_balance = np.tile([ _to_pence(a.balance) for a in savings ], (n, 1)).astype(float)
+        self.savings_rate = np.array([ float(a.interest_rate) for a in savings ])
+        self.lisa = np.array([ a.type == 'lisa' for a in savings ])
+
+        if order == 'avalanche':
+            ranked = sorted(range(len(debts)), key=lambda i: (-debts[i].interest_rate, debts[i].balance))
+        else:
+            ranked = sorted(range(len(debts)), key=lambda i: (debts[i].balance, -debts[i].interest_rate))
+        self.debt_priority = np.array(ranked, dtype=int)
+
+        accounts = debts + savings
+        self.account_names = [ a.name for a in accounts ]
+        if shares is None:
+            shares = _shares_from_strategy(person)
+        share_row = [ float(shares.get(a.name, 0)) for a in accounts ]
+        self.assign_shares(np.tile(share_row, (n, 1)))
+        self.disposable = np.zeros(n)
+
+    def assign_shares(self, shares):
+        self.shares = shares.copy()
+        self.shares[:, :self.num_debts] *= self.debt_active
+
+    def begin_year(self, joint_contrib):
+        total_expenses = self.expenses.monthly_total() + joint_contrib
+        self.disposable = self.net_monthly - total_expenses
+        self._calculate_payments()
+
+    def simulate_month(self):
+        self.savings_balance += self.savings_deposits
+        if self.num_debts > 0:
+            self.debt_balance -= self.debt_payments * self.debt_active
+            cleared = self.debt_active & (self.debt_balance <= 0)
+            if cleared.any():
+                # As in a Simulation, freed payments are redirected from the next month
+                self.debt_active &= ~cleared
+                self._roll_over(cleared)
+                self._calculate_payments()
+
+    def total_saved(self):
+        return self.savings_balance.sum(axis=1)
+
+    def end_year(self, year, inflation):
+        self.gross += _percentage_of(self.gross, self.payrise_paths[:, year])
+        self._calculate_net_salary()
+        self.expenses.inflate(inflation)
+        self.debt_balance += _percentage_of(self.debt_balance, self.debt_rate) * self.debt_active
+        self.savings_balance += _percentage_of(self.savings_balance, self.savings_rate)
+
+
+    # -- Private Methods ----------------------------------
+
+    def _calculate_net_salary(self):
+        self.net_monthly = self.tax_schedule.net_monthly_pence(self.gross, self.pension_rate)
+
+    def _calculate_payments(self):
+        available = np.maximum(self.disposable, 0)[:, None]
+        payments = _round_down(self.shares * available)
+        self.debt_payments = payments[:, :self.num_debts]
+        savings_payments = payments[:, self.num_debts:]
+        self.savings_deposits = savings_payments + (_percentage_of(savings_payments, 25.0) * self.lisa)
+
+    def _roll_over(self, cleared):
+        rows, columns = np.nonzero(cleared)
+        freed = self.shares[rows, columns]
+        self.shares[rows, columns] = 0
+
+        ranked_active = self.debt_active[rows][:, self.debt_priority]
+        has_debts = ranked_active.any(axis=1)
+        next_debt = self.debt_priority[ranked_active.argmax(axis=1)]
+        np.add.at(self.shares, (rows[has_debts], next_debt[has_debts]), freed[has_debts])
+
+        rows, freed = rows[~has_debts], freed[~has_debts]
+        savings_shares = self.shares[rows, self.num_debts:]
+        savings_total = savings_shares.sum(axis=1, keepdims=True)
+        even_split = np.full_like(savings_shares, 1 / savings_shares.shape[1])
+        weights = np.divide(savings_shares, savings_total,
+                            out=even_split, where=savings_total > 0)
+        np.add.at(self.shares, (rows, slice(self.num_debts, None)), weights * freed[:, None])
+
+
+class _ExpenseArrays:
+    def __init__(self, expenses, n):
+        items = expenses.monthly_expenses + expenses.annual_expenses
+        self.num_monthly = len(expenses.monthly_expenses)
+        self.costs = np.tile([ _to_pence(e.cost) for e in items ], (n, 1)).astype(float)
+        self.inflation = np.array([ e.inflation for e in items ], dtype=bool)
+
+    def monthly_total(self):
+        monthly_sum = self.costs[:, :self.num_monthly].sum(axis=1)
+        annual_sum = self.costs[:, self.num_monthly:].sum(axis=1)
+        return monthly_sum + _round_up(annual_sum / 12)
+
+    def inflate(self, inflation):
+        self.costs += _percentage_of(self.costs, inflation[:, None]) * self.inflation
+
+
+def _shares_from_strategy(person):
+    strategy = person.current_strategy
+    if person.disposable_income <= 0:
+        return {}
+    return {
+        item['name']: item['payment'] / person.disposable_income
+        for item in strategy.get('debts', []) + strategy['savings']
+    }
+
+def _to_pence(value):
+    return float(value * 100)
+
+def _round_down(x):
+    return np.trunc(x + np.copysign(_EPSILON, x))
+
+def _round_up(x):
+    return np.copysign(np.ceil(np.abs(x) - _EPSILON), x)
+
+def _percentage_of(value, percentage):
+    return _round_down(value * (percentage / 100))
@@ -0,0 +1,165 @@
+from collections import namedtuple
+
+import numpy as np
+
+from finsim.monte_carlo import MonteCarlo
+from finsim.strategies import RuleStrategy, ShareStrategy
+
+_LISA_BONUS = 25.0
+
+class OptimiserResult(namedtuple('OptimiserResult', ['name', 'months', 'shares', 'order'])):
+    """
+    The best split found by one approach, and the months it takes to reach the goal (None if it
+    never does).
+    """
+    __slots__ = ()
+
+    def strategy(self):
+        return ShareStrategy(self.shares, self.order)
+
+
+class StrategyOptimiser:
+    """
+    Searches for the split of each person's disposable income across their debts and savings
+    accounts which reaches the savings goal soonest. Candidate splits are evaluated thousands at a
+    time, each as one row of a ``MonteCarlo`` batch in which inflation and payrises follow their
+    expected paths.
+
+    Splits are held as shares of disposable income, and reallocated as in ``ShareStrategy`` when a
+    debt clears. Debt payments never count towards the goal, so ``min_debt_share`` sets the
+    smallest share which must go to debts while any remain, standing in for minimum payments.
+    """
+
+    def __init__(self, data, min_debt_share=0, max_years=50, seed=None, economy=None):
+        self.data = data
+        self.min_debt_share = float(min_debt_share)
+        self.max_years = max_years
+        self.economy = economy
+        self.rng = np.random.default_rng(seed)
+
+        template = self._batch(1, 'avalanche')
+        self.people = [ person.name for person in template.people ]
+        self.accounts = { person.name: list(person.account_names) for person in template.people }
+        self.num_debts = { person.name: person.num_debts for person in template.people }
+        self.savings_rates = {
+            person.name: person.savings_rate + (_LISA_BONUS * person.lisa) for person in template.people
+        }
+        self.priority = {
+            order: { person.name: person.debt_priority for person in self._batch(1, order).people }
+            for order in RuleStrategy.ORDERS
+        }
+
+    def evaluate(self, shares, order='avalanche'):
+        """
+        Returns the months each candidate takes to reach the goal, or -1 where it never does.
+        ``shares`` maps each person's name to a ``(candidates, accounts)`` array, with accounts
+        ordered as in ``accounts``.
+        """
+        candidates = len(next(iter(shares.values())))
+        batch = self._batch(candidates, order)
+        batch.assign_shares(shares)
+        return batch.run().months_to_goal
+
+    def rule_candidates(self, order, steps=11):
+        """
+        Splits paying a range of debt shares into the first debt in ``order``, with the remainder
+        divided equally between savings accounts.
+        """
+        debt_shares = np.linspace(self.min_debt_share, 1, steps)
+        shares = {}
+        for name in self.people:
+            num_debts, num_accounts = self.num_debts[name], len(self.accounts[name])
+            rows = np.zeros((steps, num_accounts))
+            if num_debts > 0:
+                rows[:, self.priority[order][name][0]] = debt_shares
+                remaining = 1 - debt_shares
+            else:
+                remaining = np.ones(steps)
+            if num_accounts > num_debts:
+                rows[:, num_debts:] = (remaining / (num_accounts - num_debts))[:, None]
+            shares[name] = rows
+        return shares
+
+    def greedy_candidates(self):
+        """
+        The split which puts ``min_debt_share`` into the highest-interest debt and everything else
+        into the savings account with the best return, counting the LISA bonus.
+        """
+        shares = {}
+        for name in self.people:
+            num_debts = self.num_debts[name]
+            row = np.zeros((1, len(self.accounts[name])))
+            remaining = 1.0
+            if num_debts > 0:
+                row[0, self.priority['avalanche'][name][0]] = self.min_debt_share
+                remaining -= self.min_debt_share
+            if len(self.savings_rates[name]) > 0:
+                row[0, num_debts + int(np.argmax(self.savings_rates[name]))] = remaining
+            shares[name] = row
+        return shares
+
+    def random_candidates(self, count):
+        """
+        Splits drawn uniformly at random, with at least ``min_debt_share`` going to debts.
+        """
+        shares = {}
+        for name in self.people:
+            num_debts, num_accounts = self.num_debts[name], len(self.accounts[name])
+            rows = self.rng.dirichlet(np.ones(num_accounts), count) if num_accounts > 0 else np.zeros((count, 0))
+            if 0 < num_debts < num_accounts:
+                debt_total = rows[:, :num_debts].sum(axis=1, keepdims=True)
+                short = debt_total < self.min_debt_share
+                debt_scale = np.where(short, self.min_debt_share / np.maximum(debt_total, 1e-12), 1)
+                savings_scale = np.where(short, (1 - self.min_debt_share) / np.maximum(1 - debt_total, 1e-12), 1)
+                rows[:, :num_debts] *= debt_scale
+                rows[:, num_debts:] *= savings_scale
+            shares[name] = rows
+        return shares
+
+    def compare(self, candidates=2000):
+        """
+        Returns the best result of each approach: avalanche and snowball across a range of debt
+        shares, the greedy split, and a random search of ``candidates`` splits (plus the greedy
+        one) under both orders.
+        """
+        results = [
+            self._best('avalanche', self.rule_candidates('avalanche'), 'avalanche'),
+            self._best('snowball', self.rule_candidates('snowball'), 'snowball'),
+            self._best('greedy', self.greedy_candidates(), 'avalanche')
+        ]
+        search = _concatenate(self.greedy_candidates(), self.random_candidates(candidates))
+        searched = [ self._best('search', search, order) for order in RuleStrategy.ORDERS ]
+        results.append(min(searched, key=_sort_key))
+        return results
+
+    def optimise(self, candidates=2000):
+        return min(self.compare(candidates), key=_sort_key)
+
+
+    # -- Private Methods ----------------------------------
+
+    def _batch(self, candidates, order):
+        return MonteCarlo(
+            self.data, scenarios=candidates, max_years=self.max_years, inflation_sd=0, payrise_sd=0,
+            order=order, economy=self.economy)
+
+    def _best(self, name, shares, order):
+        months = self.evaluate(shares, order)
+        ranked = np.where(months >= 0, months, np.iinfo(months.dtype).max)
+        best = int(np.argmin(ranked))
+        best_shares = {
+            person: {
+                account: float(share)
+                for account, share in zip(self.accounts[person], shares[person][best])
+                if share > 0
+            }
+            for person in self.people
+        }
+        return OptimiserResult(name, int(months[best]) if months[best] >= 0 else None, best_shares, order)
+
+
+def _concatenate(*batches):
+    return { name: np.concatenate([ batch[name] for batch in batches ]) for name in batches[0] }
+
+def _sort_key(result):
+    return (result.months is None, result.months or 0)
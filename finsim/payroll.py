@@ -1,30 +1,102 @@
-from os import environ
+from functools import lru_cache
 
-from finsim.utils import round_currency, get_percentage_of, decimalise as D
-import finsim.sim_data as data
+import numpy as np
+
+from finsim.economy import default_parameters
+from finsim.money import BACKENDS, get_backend
+from finsim.utils import decimalise as D
+
+_EPSILON = 1e-6
 
 class Payroll:
-    def __init__(self, salary_data):
-        self.gross = D(salary_data['base_salary'])
+    def __init__(self, salary_data, economy=None):
+        self.money = get_backend()
+        self.economy = economy or default_parameters()
+        self._gross = self.money.from_value(salary_data['base_salary'])
         self.pension_rate = D(salary_data.get('pension', 0))
-        self.payrise_rate = D(salary_data.get('payrise_rate', data.INFLATION_RATE))
+        self.payrise_rate = D(salary_data.get('payrise_rate', self.economy.inflation_rate))
         self._calculate_net_salary()
 
+    @property
+    def gross(self):
+        return self.money.to_decimal(self._gross)
+
+    @property
+    def net_monthly(self):
+        return self.money.to_decimal(self._net_monthly)
+
     def payrise(self):
-        payrise_amount = get_percentage_of(self.gross, self.payrise_rate)
-        self.gross += payrise_amount
+        payrise_amount = self.money.percentage_of(self._gross, self.payrise_rate)
+        self._gross += payrise_amount
         self._calculate_net_salary()
 
     def _calculate_net_salary(self):
-        pension_deduction = get_percentage_of(self.gross, self.pension_rate)
-        gross_after_pension = self.gross - pension_deduction
-
-        ni_deduction = get_percentage_of(
-            (gross_after_pension - data.NI_THRESHOLD), data.NI_RATE )
-        it_deduction = get_percentage_of(
-            (gross_after_pension - data.IT_THRESHOLD), data.IT_RATE )
-        sl_deduction = get_percentage_of(
-            (gross_after_pension - data.SL_THRESHOLD), data.SL_RATE )
-
-        net = gross_after_pension - (ni_deduction + it_deduction + sl_deduction)
-        self.net_monthly = round_currency( net / 12 )
+        schedule = TaxSchedule.for_economy(self.economy)
+        self._net_monthly = schedule.net_monthly(self.money, self._gross, self.pension_rate)
+
+
+class TaxSchedule:
+    """
+    Salary deductions as a table of (threshold, rate) bands - National Insurance, Income Tax and
+    Student Loan. Each band deducts ``rate`` percent of the salary after pension above its threshold
+    (or credits it below), rounded down to the penny.
+
+    Results are memoised per (schedule, backend, gross, pension rate), and ``net_monthly_batch``
+    evaluates the table over whole arrays of salaries.
+    """
+
+    def __init__(self, bands):
+        self.bands = tuple( (D(threshold), D(rate)) for threshold, rate in bands )
+        self._thresholds = np.array([ float(threshold * 100) for threshold, _ in self.bands ])
+        self._rates = np.array([ float(rate) / 100 for _, rate in self.bands ])
+
+    def __eq__(self, other):
+        return isinstance(other, TaxSchedule) and self.bands == other.bands
+
+    def __hash__(self):
+        return hash(self.bands)
+
+    @staticmethod
+    def for_economy(economy):
+        return _schedule_for(*economy.tax_bands)
+
+    def net_monthly(self, money, gross, pension_rate):
+        return _net_monthly(self, money.name, gross, pension_rate)
+
+    def net_monthly_batch(self, gross, pension_rate):
+        """
+        Returns net monthly pay, in pounds, for an array of gross annual salaries in pounds.
+        """
+        gross_pence = np.asarray(gross, dtype=float) * 100
+        return self.net_monthly_pence(gross_pence, pension_rate) / 100
+
+    def net_monthly_pence(self, gross, pension_rate):
+        pension_deduction = _round_down(gross * (float(pension_rate) / 100))
+        gross_after_pension = (gross - pension_deduction)[..., None]
+        deductions = _round_down((gross_after_pension - self._thresholds) * self._rates).sum(axis=-1)
+        return _round_down((gross_after_pension[..., 0] - deductions) / 12)
+
+
+def net_salary_cache_info():
+    return _net_monthly.cache_info()
+
+@lru_cache(maxsize=64)
+def _schedule_for(*bands):
+    return TaxSchedule(bands)
+
+@lru_cache(maxsize=4096)
+def _net_monthly(schedule, backend_name, gross, pension_rate):
+    money = BACKENDS[backend_name]
+    pension_deduction = money.percentage_of(gross, pension_rate)
+    gross_after_pension = gross - pension_deduction
+
+    deductions = money.zero
+    for threshold, rate in schedule.bands:
+        deductions += money.percentage_of(
+            (gross_after_pension - money.from_value(threshold)), rate )
+
+    net = gross_after_pension - deductions
+    return money.divide( net, 12 )
+
+def _round_down(x):
+    return np.trunc(x + np.copysign(_EPSILON, x))
@@ -1,17 +1,33 @@
+from copy import copy
+
 from finsim.ui import UI
+from finsim.account_arrays import DebtArrays, SavingsArrays
 from finsim.debts import Debts
 from finsim.expenses import Expenses
+from finsim.ledger import Ledger
 from finsim.payroll import Payroll
 from finsim.savings_accounts import SavingsAccounts
+from finsim.strategies import AsyncStrategyProvider
 
 
 class Person:
-    def __init__(self, person_data):
+    STORAGES = ('objects', 'arrays')
+
+    def __init__(self, person_data, strategy_provider=None, storage='objects', economy=None,
+                 ledger=None):
+        if storage not in Person.STORAGES:
+            raise ValueError('"{}" is not a valid account storage.'.format(storage))
         self.name = person_data['name']
-        self.payroll = Payroll(person_data['salary'])
-        self.expenses = Expenses(person_data['expenses'])
-        self.savings = SavingsAccounts(person_data['savings'])
-        self.debts = Debts(person_data['debts'])
+        self.payroll = Payroll(person_data['salary'], economy)
+        self.expenses = Expenses(person_data['expenses'], economy)
+        self.ledger = ledger or Ledger()
+        if storage == 'arrays':
+            self.savings = SavingsArrays(person_data['savings'], self.ledger, self.name)
+            self.debts = DebtArrays(person_data.get('debts', []), self.ledger, self.name)
+        else:
+            self.savings = SavingsAccounts(person_data['savings'], self.ledger, self.name)
+            self.debts = Debts(person_data.get('debts', []), self.ledger, self.name)
+        self.strategy_provider = strategy_provider or UI()
 
         self.joint_contrib = None
         self.disposable_income = None
@@ -19,38 +35,86 @@ class Person:
         self.outdated_strategies = []
         self.updated = False
 
-    def begin_year(self, joint_contrib=0):
+    def begin_year(self, joint_contrib=0, strategise=True):
+        self.savings.begin_year()
+        self.debts.begin_year()
         self.joint_contrib = joint_contrib
         total_expenses = self.expenses.monthly_total + joint_contrib
         self.disposable_income = self.payroll.net_monthly - total_expenses
-        self.strategise()
+        if strategise:
+            self.strategise()
 
     def strategise(self):
-        ui = UI()
+        provider = self.strategy_provider
         if self.current_strategy is None:
-            new_strategy = ui.obtain_initial_strategy(self)
+            new_strategy = provider.obtain_initial_strategy(self)
         else:
-            new_strategy = ui.obtain_new_strategy(self)
-            self.outdated_strategies.append(self.current_strategy)
-        
-        self.current_strategy = new_strategy
-        self.savings.apply_strategy(new_strategy['savings'])
-        if new_strategy.get('debts', None) is not None:
-            self.debts.apply_strategy(new_strategy['debts'])
-        self.debts.reset_recently_cleared()
-        self.updated = False
+            new_strategy = provider.obtain_new_strategy(self)
+        self._apply_strategy(new_strategy)
 
-    def simulate_month(self):
-        self.debts.pay()
-        self.savings.deposit()
+    async def strategise_async(self):
+        """
+        Awaits a new strategy from an ``AsyncStrategyProvider``. Any other provider is asked
+        directly, as in ``strategise``.
+        """
+        provider = self.strategy_provider
+        if not isinstance(provider, AsyncStrategyProvider):
+            self.strategise()
+            return
+        if self.current_strategy is None:
+            new_strategy = await provider.obtain_initial_strategy_async(self)
+        else:
+            new_strategy = await provider.obtain_new_strategy_async(self)
+        self._apply_strategy(new_strategy)
+
+    def simulate_month(self, months=1):
+        self.debts.pay(months)
+        deposited = self.savings.deposit(months)
         if len(self.debts.recently_cleared) > 0:
             self.updated = True
+        return deposited
 
     def total_saved(self):
         return self.savings.total_saved()
 
+    def debt_free(self):
+        return len(self.debts.to_list()) == 0
+
+    def monthly_deposit(self):
+        return self.savings.monthly_deposit()
+
+    def months_until_debt_cleared(self):
+        return self.debts.months_until_cleared()
+
     def end_year(self):
         self.payroll.payrise()
         self.expenses.inflate()
         self.debts.end_year()
-        self.savings.end_year()
+        return self.savings.end_year()
+
+    def fork(self, ledger):
+        """
+        Returns a copy which can be simulated independently of this person, recording to
+        ``ledger``. Only balances, costs, pay and strategy history are copied.
+        """
+        forked = copy(self)
+        forked.ledger = ledger
+        forked.payroll = copy(self.payroll)
+        forked.expenses = self.expenses.fork()
+        forked.savings = self.savings.fork(ledger)
+        forked.debts = self.debts.fork(ledger)
+        forked.outdated_strategies = list(self.outdated_strategies)
+        return forked
+
+
+    # -- Private Methods ----------------------------------
+
+    def _apply_strategy(self, new_strategy):
+        if self.current_strategy is not None:
+            self.outdated_strategies.append(self.current_strategy)
+        self.current_strategy = new_strategy
+        self.savings.apply_strategy(new_strategy['savings'])
+        if new_strategy.get('debts', None) is not None:
+            self.debts.apply_strategy(new_strategy['debts'])
+        self.debts.reset_recently_cleared()
+        self.updated = False
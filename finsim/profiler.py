@@ -0,0 +1,98 @@
+from functools import wraps
+from time import perf_counter
+
+MODEL_PHASES = ('begin_year', 'simulate_month', 'strategise', 'end_year')
+SIMULATION_PHASES = ('_achieved_goal', '_months_until_event')
+ACCOUNT_PHASES = {
+    'savings': ('begin_year', 'apply_strategy', 'deposit', 'end_year'),
+    'debts': ('begin_year', 'apply_strategy', 'pay', 'end_year')
+}
+
+class Profiler:
+    """
+    Times each phase of a simulation, keeping cumulative wall-clock seconds and call counts per
+    phase for the simulation, the group, each person and each person's account groups.
+
+    Attaching wraps the relevant methods of those objects only, so a simulation run without a
+    profiler is untouched. Times are inclusive: a person's ``simulate_month`` includes the time
+    spent in their accounts' ``pay`` and ``deposit``.
+
+    People are told apart by their position, so two people sharing a name are timed separately;
+    their names are then labelled with their positions, as in ``Alice[0]`` and ``Alice[1]``.
+    """
+
+    def __init__(self):
+        self.stats = {}
+        self.labels = {}
+
+    def attach(self, simulation):
+        self._wrap(simulation, 'simulation', SIMULATION_PHASES)
+        model = simulation.model
+        if hasattr(model, 'people'):
+            self._wrap(model, 'group', MODEL_PHASES)
+            people = model.people
+        else:
+            people = [ model ]
+        names = [ person.name for person in people ]
+        for index, person in enumerate(people):
+            label = person.name if names.count(person.name) == 1 else '{}[{}]'.format(person.name, index)
+            self._wrap(person, ('person', index), MODEL_PHASES, label)
+            for group, phases in ACCOUNT_PHASES.items():
+                self._wrap(
+                    getattr(person, group), ('person', index, group), phases, '{}.{}'.format(label, group))
+
+    def summary(self):
+        """
+        Returns ``{ scope: { phase: { 'calls': n, 'seconds': s } } }``, in the order the phases were
+        first attached.
+        """
+        summary = {}
+        for (scope, phase), (calls, seconds) in self.stats.items():
+            summary.setdefault(self.labels[scope], {})[phase.lstrip('_')] = { 'calls': calls, 'seconds': seconds }
+        return summary
+
+    def to_table(self):
+        rows = [ ('Scope', 'Phase', 'Calls', 'Seconds', 'Per Call (us)') ]
+        for (scope, phase), (calls, seconds) in self.stats.items():
+            if calls == 0:
+                continue
+            per_call = (seconds / calls) * 1e6
+            rows.append((
+                self.labels[scope], phase.lstrip('_'), str(calls), '{:.6f}'.format(seconds),
+                '{:.2f}'.format(per_call)))
+        widths = [ max(len(row[i]) for row in rows) for i in range(len(rows[0])) ]
+        lines = []
+        for number, row in enumerate(rows):
+            cells = [ cell.ljust(width) if i < 2 else cell.rjust(width)
+                      for i, (cell, width) in enumerate(zip(row, widths)) ]
+            lines.append('  '.join(cells))
+            if number == 0:
+                lines.append('  '.join('-' * width for width in widths))
+        return '\n'.join(lines)
+
+    def print_table(self):
+        print(self.to_table())
+
+
+    # -- Private Methods ----------------------------------
+
+    def _wrap(self, target, scope, phases, label=None):
+        self.labels[scope] = label or scope
+        for phase in phases:
+            method = getattr(target, phase, None)
+            if method is None:
+                continue
+            totals = self.stats.setdefault((scope, phase), [0, 0.0])
+            setattr(target, phase, _timed(method, totals))
+
+
+def _timed(method, totals):
+    @wraps(method)
+    def timed(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            totals[0] += 1
+            totals[1] += perf_counter() - start
+    return timed
@@ -1,44 +1,88 @@
 from decimal import Decimal as D
 
+from finsim import utils
 from finsim.accounts import AccountGroup, Account
-from finsim.utils import get_percentage_of
+from finsim.ledger import PAYMENT, BONUS
+from finsim.money import get_backend
+
+_LISA_BONUS_RATE = D('25')
 
 class SavingsAccounts(AccountGroup):
-    def __init__(self, accounts_data):
-        super().__init__(SavingsAccount, accounts_data)
+    def __init__(self, accounts_data, ledger=None, person=None):
+        super().__init__(SavingsAccount, accounts_data, ledger, person)
+        self.money = get_backend()
+        self.recalculate_total()
+
+    def deposit(self, months=1):
+        deposited = self.money.zero
+        for name, account in self.account_dict.items():
+            deposited += account.deposit(months)
+        self._total += deposited
+        return deposited
 
-    def deposit(self):
+    def end_year(self):
+        interest = self.money.zero
         for name, account in self.account_dict.items():
-            account.deposit()
+            interest += account.end_year()
+        self._total += interest
+        return interest
+
+    def monthly_deposit(self):
+        return sum([v.monthly_deposit() for k, v in self.account_dict.items()])
 
     def to_list(self):
         return [ a for k, a in self.account_dict.items() ]
 
     def total_saved(self):
+        total = self.money.to_decimal(self._total)
+        if utils.VERIFY_TOTALS:
+            utils.verify_total('savings accounts', total, self._sum_balances())
+        return total
+
+    def recalculate_total(self):
+        """
+        Rebuilds the running total from each account's balance. Only needed after balances have been
+        set directly rather than through deposits and interest.
+        """
+        self._total = self.money.from_value(self._sum_balances())
+
+
+    # -- Private Methods --------------------------------------------
+
+    def _sum_balances(self):
         return sum([v.balance for k, v in self.account_dict.items()])
 
 
 class SavingsAccount(Account):
-    def __init__(self, account_data):
+    def __init__(self, account_data, ledger=None, person=None):
         self.type = account_data.get('type', 'traditional')
-        super().__init__(account_data)
+        super().__init__(account_data, ledger, person)
 
-    def deposit(self):
+    def deposit(self, months=1):
+        gov_bonus = self.money.zero
         if self.type == 'lisa':
-            gov_bonus = get_percentage_of(self.payment_amount, D('25'))
-            self.balance += gov_bonus
-            self._update_reports('Government Bonus', gov_bonus)
+            gov_bonus = self._government_bonus() * months
+            self._balance += gov_bonus
+            self.ledger.record(self.ledger_id, BONUS, gov_bonus)
+
+        amount = self._payment * months
+        self._balance += amount
+        self.ledger.record(self.ledger_id, PAYMENT, amount)
+        return amount + gov_bonus
 
-        self.balance += self.payment_amount
-        self._update_reports('Payments / Deposits', self.payment_amount)
+    def monthly_deposit(self):
+        if self.type == 'lisa':
+            return self.money.to_decimal(self._payment + self._government_bonus())
+        return self.payment_amount
 
 
     # -- Private Methods --------------------------------------------
 
-    def _init_report(self):
-        report = super()._init_report()
-        
-        if self.type == 'lisa':
-            report['Government Bonus'] = D('0')
+    def _government_bonus(self):
+        return self.money.percentage_of(self._payment, _LISA_BONUS_RATE)
 
-        return report
+    def _report_kinds(self):
+        kinds = super()._report_kinds()
+        if self.type == 'lisa':
+            return kinds + (BONUS,)
+        return kinds
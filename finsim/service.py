@@ -0,0 +1,389 @@
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from json import dumps as json_dumps, loads as json_loads
+from os import cpu_count
+from queue import Empty, Queue
+from signal import SIGINT, SIG_IGN, signal
+from socketserver import ThreadingMixIn
+from threading import Lock, Thread
+from time import perf_counter
+
+from finsim import money
+from finsim.cache import CacheError, cache_key, simulation_result
+from finsim.economy import default_parameters
+from finsim.sim_data import DataImportError, SimData
+from finsim.simulation import Simulation
+from finsim.strategies import FixedStrategy, RuleStrategy, StrategyError
+
+_STOP = object()
+
+class ServiceError(Exception):
+    pass
+
+class LatencyStats:
+    """
+    Keeps the latencies of the last ``window`` requests, in seconds, and summarises them in
+    milliseconds.
+    """
+
+    def __init__(self, window=10000):
+        self.latencies = deque(maxlen=window)
+        self.requests = 0
+        self.batches = 0
+        self.cached = 0
+        self._lock = Lock()
+
+    def record_batch(self, latencies):
+        with self._lock:
+            self.latencies.extend(latencies)
+            self.requests += len(latencies)
+            self.batches += 1
+
+    def record_cached(self, latency):
+        with self._lock:
+            self.latencies.append(latency)
+            self.requests += 1
+            self.cached += 1
+
+    def summary(self):
+        with self._lock:
+            latencies = sorted(self.latencies)
+            requests, batches, cached = self.requests, self.batches, self.cached
+        summary = {
+            'requests': requests,
+            'cached': cached,
+            'batches': batches,
+            'mean_batch_size': (requests - cached) / batches if batches > 0 else 0
+        }
+        for name, fraction in (('p50', 0.5), ('p90', 0.9), ('p99', 0.99)):
+            summary['{}_ms'.format(name)] = _percentile(latencies, fraction) * 1000
+        summary['max_ms'] = latencies[-1] * 1000 if len(latencies) > 0 else 0
+        return summary
+
+
+class SimulationService:
+    """
+    Runs simulation requests on a pool of worker processes which stay alive, with finsim imported
+    and the economic parameters loaded, between requests.
+
+    Requests arriving together are grouped into batches of up to ``batch_size``, waiting at most
+    ``batch_wait`` seconds after the first for others to join, and each batch is sent to a worker
+    as one task. With ``workers=0`` batches are run in this process instead.
+
+    A request is a dict holding ``data`` (the contents of a data file), and optionally ``strategy``,
+    ``economy`` and ``max_years``. ``strategy`` is either ``{ "fixed": { name: { "debts": ...,
+    "savings": ... } } }`` or the arguments to a ``RuleStrategy``, ``economy`` any
+    ``EconomicParameters`` fields to override, and ``max_years`` the years after which the goal is
+    given up on, overriding the service's ``max_years``.
+
+    Given a ``ResultCache``, requests which have been run before are answered from it without
+    being queued.
+    """
+
+    def __init__(self, workers=None, batch_size=32, batch_wait=0.001, engine='event', storage='objects',
+                 economy=None, cache=None, max_years=100):
+        if batch_size < 1:
+            raise ValueError('Batches must hold at least one request.')
+        self.workers = (cpu_count() or 1) if workers is None else workers
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.engine = engine
+        self.storage = storage
+        self.economy = economy or default_parameters()
+        self.cache = cache
+        self.max_years = max_years
+        self.latency = LatencyStats()
+        self._queue = Queue()
+        self._executor = None
+        self._dispatcher = None
+
+    def start(self):
+        # Workers forked from here inherit the warmed caches, and each runs a request of its own so
+        # that none is started lazily while a request waits
+        run_batch([ _WARM_UP ], self.engine, self.storage, self.economy, self.max_years)
+        if self.workers > 0:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            backend = money.get_backend().name
+            warm_ups = [
+                self._executor.submit(
+                    money.call_with_backend, backend, _prepare_worker, self.engine, self.storage,
+                    self.economy, self.max_years)
+                for _ in range(self.workers)
+            ]
+            for warm_up in warm_ups:
+                warm_up.result()
+        self._dispatcher = Thread(target=self._dispatch, daemon=True)
+        self._dispatcher.start()
+        return self
+
+    def close(self):
+        if self._dispatcher is not None:
+            self._queue.put(_STOP)
+            self._dispatcher.join()
+            self._dispatcher = None
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def submit(self, request):
+        """
+        Queues ``request``, returning a ``Future`` for its response.
+        """
+        if self._dispatcher is None:
+            error_msg = 'The service has not been started.'
+            raise ServiceError(error_msg)
+        future = Future()
+        submitted = perf_counter()
+        key = self._cache_key(request)
+        if key is not None:
+            result = self.cache.get(key)
+            if result is not None:
+                response = dict(result)
+                latency = perf_counter() - submitted
+                response['latency'] = {
+                    'queued_ms': 0, 'simulate_ms': 0, 'total_ms': latency * 1000, 'batch_size': 0,
+                    'cached': True
+                }
+                self.latency.record_cached(latency)
+                future.set_result(response)
+                return future
+        self._queue.put((request, future, submitted, key))
+        return future
+
+    def simulate(self, request):
+        return self.submit(request).result()
+
+
+    # -- Private Methods ----------------------------------
+
+    def _dispatch(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            batch = [ item ]
+            deadline = perf_counter() + self.batch_wait
+            stopping = False
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(deadline - perf_counter(), 0))
+                except Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._run(batch)
+            if stopping:
+                return
+
+    def _run(self, batch):
+        requests = [ request for request, _, _, _ in batch ]
+        dispatched = perf_counter()
+        if self._executor is None:
+            future = Future()
+            try:
+                future.set_result(run_batch(requests, self.engine, self.storage, self.economy, self.max_years))
+            except Exception as e:
+                future.set_exception(e)
+        else:
+            future = self._executor.submit(
+                money.call_with_backend, money.get_backend().name, run_batch, requests, self.engine,
+                self.storage, self.economy, self.max_years)
+        future.add_done_callback(lambda done: self._complete(batch, dispatched, done))
+
+    def _complete(self, batch, dispatched, done):
+        finished = perf_counter()
+        if done.exception() is not None:
+            for _, future, _, _ in batch:
+                future.set_exception(done.exception())
+            return
+
+        latencies = []
+        for (_, future, submitted, key), (response, seconds) in zip(batch, done.result()):
+            if key is not None and 'error' not in response:
+                self.cache.put(key, dict(response))
+            latencies.append(finished - submitted)
+            response['latency'] = {
+                'queued_ms': (dispatched - submitted) * 1000,
+                'simulate_ms': seconds * 1000,
+                'total_ms': (finished - submitted) * 1000,
+                'batch_size': len(batch),
+                'cached': False
+            }
+            future.set_result(response)
+        self.latency.record_batch(latencies)
+
+    def _cache_key(self, request):
+        if self.cache is None:
+            return None
+        try:
+            raw_data, provider, economy, max_months = request_inputs(request, self.economy, self.max_years)
+            return cache_key(raw_data, provider, economy, self.engine, self.storage, max_months)
+        except (CacheError, ServiceError, StrategyError, TypeError, ValueError):
+            # Left for a worker to report
+            return None
+
+
+def run_batch(requests, engine, storage, economy, max_years=None):
+    """
+    Runs each request, returning a ``(response, seconds)`` pair for each. Invalid or failing
+    requests give a response holding ``error`` (and ``errors``, for invalid data) rather than
+    raising.
+    """
+    results = []
+    for request in requests:
+        start = perf_counter()
+        try:
+            response = run_request(request, engine, storage, economy, max_years)
+        except DataImportError as e:
+            response = { 'error': str(e), 'errors': [ list(error) for error in e.errors ] }
+        except (ServiceError, StrategyError, TypeError, ValueError) as e:
+            response = { 'error': str(e) }
+        except Exception as e:
+            # One failing request must not fail the rest of its batch
+            response = { 'error': 'The simulation failed: {}'.format(repr(e)) }
+        results.append((response, perf_counter() - start))
+    return results
+
+def run_request(request, engine='event', storage='objects', economy=None, max_years=None):
+    raw_data, provider, economy, max_months = request_inputs(request, economy, max_years)
+    simulation = Simulation(
+        SimData.from_dict(raw_data), provider, quiet=True, engine=engine, storage=storage,
+        economy=economy, report_detail='none', max_months=max_months)
+    return simulation_result(simulation, simulation.simulate())
+
+def request_inputs(request, economy=None, max_years=None):
+    """
+    Returns the raw data, strategy provider, economic parameters and horizon in months described
+    by ``request``, the horizon defaulting to ``max_years``.
+    """
+    if not isinstance(request, dict) or not isinstance(request.get('data'), dict):
+        error_msg = 'A request must be an object holding the "data" to simulate.'
+        raise ServiceError(error_msg)
+
+    strategy = request.get('strategy') or {}
+    if 'fixed' in strategy:
+        provider = FixedStrategy(strategy['fixed'])
+    else:
+        provider = RuleStrategy(**strategy)
+    economy = (economy or default_parameters()).replace(**(request.get('economy') or {}))
+
+    if 'max_years' in request:
+        # A request may shorten or lengthen the horizon, but never turn it off
+        max_years = request['max_years']
+        if isinstance(max_years, bool) or not isinstance(max_years, int) or max_years < 1:
+            error_msg = '"max_years" must be a whole number of years, at least 1.'
+            raise ServiceError(error_msg)
+    max_months = max_years * 12 if max_years is not None else None
+    return request['data'], provider, economy, max_months
+
+
+# -- HTTP ---------------------------------------------
+
+class ServiceServer(ThreadingMixIn, HTTPServer):
+    """
+    Serves a started ``SimulationService`` over HTTP, with one thread per connection:
+
+    - ``POST /simulate`` takes a request and returns its response, with status 400 if it is
+      invalid, or takes a list of requests and returns a list of responses.
+    - ``GET /metrics`` returns the service's latency summary.
+    - ``GET /health`` returns ``{ "status": "ok" }``.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, service, host='localhost', port=8000, verbose=False):
+        super().__init__((host, port), _Handler)
+        self.service = service
+        self.verbose = verbose
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately, which Nagle's algorithm would hold back
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._reply(200, { 'status': 'ok' })
+        elif self.path == '/metrics':
+            summary = self.server.service.latency.summary()
+            if self.server.service.cache is not None:
+                summary['cache'] = dict(self.server.service.cache.counters)
+            self._reply(200, summary)
+        else:
+            self._reply(404, { 'error': 'Not found.' })
+
+    def do_POST(self):
+        if self.path != '/simulate':
+            self._reply(404, { 'error': 'Not found.' })
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            body = json_loads(self.rfile.read(length).decode('utf-8'))
+        except ValueError as e:
+            self._reply(400, { 'error': 'The request is not valid JSON: {}'.format(e) })
+            return
+
+        requests = body if isinstance(body, list) else [ body ]
+        try:
+            futures = [ self.server.service.submit(request) for request in requests ]
+            responses = [ future.result() for future in futures ]
+        except Exception as e:
+            self._reply(500, { 'error': str(e) })
+            return
+
+        if isinstance(body, list):
+            self._reply(200, responses)
+        else:
+            self._reply(400 if 'error' in responses[0] else 200, responses[0])
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+    # -- Private Methods ----------------------------------
+
+    def _reply(self, status, body):
+        content = json_dumps(body, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+_WARM_UP = {
+    'data': {
+        'savings_goal': '1000',
+        'people': [
+            {
+                'name': 'Warm Up',
+                'salary': { 'base_salary': '30000' },
+                'expenses': { 'monthly': [ { 'name': 'Rent', 'cost': '500' } ] },
+                'savings': [ { 'name': 'Savings', 'interest_rate': '1.0' } ],
+                'debts': [ { 'name': 'Card', 'starting_balance': '500', 'interest_rate': '1.0' } ]
+            }
+        ]
+    }
+}
+
+def _prepare_worker(engine, storage, economy, max_years):
+    # Interrupting the server shuts the pool down, which workers should not pre-empt
+    signal(SIGINT, SIG_IGN)
+    run_batch([ _WARM_UP ], engine, storage, economy, max_years)
+
+def _percentile(values, fraction):
+    if len(values) == 0:
+        return 0
+    return values[min(int(fraction * len(values)), len(values) - 1)]
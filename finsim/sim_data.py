@@ -1,34 +1,35 @@
-from json import load as json_load
+from concurrent.futures import ProcessPoolExecutor
+from json import load as json_load, loads as json_loads
 from enum import Enum
-from os import environ
-from dotenv import load_dotenv
-from decimal import InvalidOperation, Decimal as D
+from math import ceil
+from os import cpu_count
+from sys import stdin
 
 from finsim.utils import decimalise
-
-
-load_dotenv('.env')
-INFLATION_RATE = D(environ['INFLATION_RATE'])
-NI_THRESHOLD = D(environ['NI_THRESHOLD'])
-NI_RATE = D(environ['NI_RATE'])
-IT_THRESHOLD = D(environ['IT_THRESHOLD'])
-IT_RATE = D(environ['IT_RATE'])
-SL_THRESHOLD = D(environ['SL_THRESHOLD'])
-SL_RATE = D(environ['SL_RATE'])
+from finsim.validation import DATA_VALIDATOR, ValidationError
 
 
 class DataImportError(Exception):
-    pass
+    def __init__(self, message, errors=None):
+        super().__init__(message)
+        self.errors = errors or []
 
-class SimData:
+    @classmethod
+    def from_errors(cls, errors):
+        message = '\n'.join([ '{}: {}'.format(path, msg) for path, msg in errors ])
+        return cls(message, errors)
 
-    def __init__(self):
-        with open('data.json', 'r') as f:
-            raw_data = json_load(f)
+class SimData:
 
-        self.data = _lower_keys(raw_data)
+    def __init__(self, path='data.json'):
+        with open(path, 'r') as f:
+            self.data = json_load(f, object_pairs_hook=_lower_pairs)
         self._process()
 
+    @classmethod
+    def from_dict(cls, raw_data):
+        return cls._from_lowered(_lower_keys(raw_data))
+
     def get_people(self):
         return self.data['people']
 
@@ -37,127 +38,82 @@ class SimData:
 
 
     # -- Private Methods ----------------------------------
-    
-    def _process(self):
-        self._process_mode()
-        self._validate_people(self.data['people'])
-        goal = self.data.get('savings_goal', None)
-        if goal is not None:
-            try:
-                self.savings_goal = decimalise(goal)
-                if self.savings_goal <= 0:
-                    error_msg = 'Savings Goal must be greater than Zero.'
-                    raise DataImportError(error_msg)
-            except InvalidOperation:
-                error_msg = 'Savings Goal must be a valid number.'
-                raise DataImportError(error_msg)
-        else:
-            self.savings_goal = None
-        if self.group_mode == True:
-            group_expenses = self.data['group']['expenses']
-            self._validate_expenses(group_expenses)
-
-    def _process_mode(self):
-        people = self.data.get('people', [])
-        num_people = len(people)
-
-        if num_people == 0 :
-            error_msg = 'The data file must contain at least one person.'
-            raise DataImportError(error_msg)
-        elif num_people == 1:
-            if 'group' in self.data:
-                error_msg = '"Group" data is not permitted when only one person is defined.'
-                raise DataImportError(error_msg)
-            self.group_mode = False
-            self.proportional_expenses = None
-        else:
-            if 'group' not in self.data:
-                error_msg = 'If the data file contains more than one person, a "group" must be defined.'
-                raise DataImportError(error_msg)
-            self.group_mode = True
-            self.proportional_expenses = self.data['group'].get('proportional_expenses', False)
 
-    @staticmethod
-    def _validate_people(people):
-        for person in people:
-            SimData._validate_object(
-                person,
-                'person',
-                req_attr=['name', 'salary', 'savings'],
-                optional_attr=['expenses', 'debts']
-            )
-            
-            # Validate Person Names
-            if not isinstance(person['name'], str):
-                error_msg = 'Each person in the data file must have a valid name.'
-                raise DataImportError(error_msg)
-            
-            # Validate Salaries
-            salary = person['salary']
-            SimData._validate_object(
-                salary,
-                'salary',
-                req_attr=['base_salary'],
-                optional_attr=['pension', 'payrise_rate']
-            )
-
-            # Validate Savings Accounts
-            accounts = person['savings']
-            if len(accounts) == 0:
-                error_tmpl = '{} must have at least one savings account.'
-                error_msg = error_tmpl.format(person['name'])
-                raise DataImportError(error_msg)
-            for account in accounts:
-                SimData._validate_object(
-                    account,
-                    'savings',
-                    req_attr=['name'],
-                    optional_attr=['interest_rate', 'starting_balance', 'type']
-                )
-            
-            # Validate Expenses
-            SimData._validate_expenses(person['expenses'])
-
-    @staticmethod
-    def _validate_expenses(expenses):
-        SimData._validate_object(
-            expenses,
-            'expenses',
-            req_attr=[],
-            optional_attr=['monthly', 'annual']
-        )
-
-        all_expenses = expenses.get('monthly', []) + expenses.get('annual', [])
-        for item in all_expenses:
-            SimData._validate_object(
-                item,
-                'expense',
-                req_attr=['name', 'cost'],
-                optional_attr=['inflation']
-            )
-            try:
-                cost = decimalise(item['cost'])
-                if cost <= 0:
-                    error_msg = 'Expense costs must be greater than Zero.'
-                    raise DataImportError(error_msg)
-            except InvalidOperation:
-                error_msg = 'Expense costs must be a valid number.'
-                raise DataImportError(error_msg)
+    @classmethod
+    def _from_lowered(cls, data):
+        sim_data = cls.__new__(cls)
+        sim_data.data = data
+        sim_data._process()
+        return sim_data
 
-            if not isinstance(item.get('inflation', True), bool):
-                error_msg = 'The "inflation" attribute of an expense item, if included, must be either "true" or "false".'
-                raise DataImportError(error_msg)
+    def _process(self):
+        errors = DATA_VALIDATOR.validate(self.data)
+        if len(errors) > 0:
+            raise DataImportError.from_errors(errors)
 
-    @staticmethod
-    def _validate_object(obj, obj_name, req_attr, optional_attr):
-        for attr in req_attr:
-            if attr not in obj:
-                error_msg = '"{}" object must contain a "{}" attribute.'.format(obj_name, attr)
-                raise DataImportError(error_msg)
-        for key in obj.keys():
-            if key not in (req_attr + optional_attr):
-                error_msg = '"{}" is not a valid attribute of "{}".'.format(key, obj_name)
+        self.group_mode = len(self.data['people']) > 1
+        if self.group_mode:
+            self.proportional_expenses = self.data['group'].get('proportional_expenses', False)
+        else:
+            self.proportional_expenses = None
+        goal = self.data.get('savings_goal', None)
+        self.savings_goal = decimalise(goal) if goal is not None else None
+
+def iter_scenarios(path):
+    """
+    Lazily yields a ``SimData`` for each line of a JSONL file, or of stdin when ``path`` is '-'.
+    Blank lines are skipped, and only the current line is held in memory.
+    """
+    if path == '-':
+        yield from _parse_lines(stdin)
+    else:
+        with open(path, 'r') as f:
+            yield from _parse_lines(f)
+
+def validate_file(path):
+    """
+    Returns every ``ValidationError`` in the data file at ``path``, without raising.
+    """
+    try:
+        with open(path, 'r') as f:
+            data = json_load(f, object_pairs_hook=_lower_pairs)
+    except (OSError, ValueError) as e:
+        return [ ValidationError('$', str(e)) ]
+    return DATA_VALIDATOR.validate(data)
+
+def validate_files(paths, workers=None, chunksize=None):
+    """
+    Validates many data files across a pool of processes, returning ``(path, errors)`` pairs in
+    the order given.
+    """
+    paths = list(paths)
+    workers = workers or cpu_count() or 1
+    if workers == 1 or len(paths) <= 1:
+        return [ (path, validate_file(path)) for path in paths ]
+
+    if chunksize is None:
+        chunksize = max(1, ceil(len(paths) / (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(validate_file, paths, chunksize=chunksize)
+        return list(zip(paths, results))
+
+def _parse_lines(lines):
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            raw_data = json_loads(line, object_pairs_hook=_lower_pairs)
+            if not isinstance(raw_data, dict):
+                error_msg = 'Each line must contain a JSON object.'
                 raise DataImportError(error_msg)
+            sim_data = SimData._from_lowered(raw_data)
+        except (DataImportError, ValueError) as e:
+            error_msg = 'Line {}: {}'.format(line_number, e)
+            raise DataImportError(error_msg, getattr(e, 'errors', None)) from e
+        yield sim_data
+
+def _lower_pairs(pairs):
+    return { k.lower(): v for k, v in pairs }
 
 def _lower_keys(x):
     if isinstance(x, list):
@@ -1,48 +1,168 @@
+from copy import copy
+
+from finsim.economy import default_parameters
+from finsim.feasibility import earliest_month
 from finsim.group import Group
+from finsim.ledger import Ledger
 from finsim.person import Person
+from finsim.sim_data import DataImportError
 from finsim.ui import UI
+from finsim.utils import months_to_cover
 
 class Simulation:
-    def __init__(self, data):
+    ENGINES = ('stepwise', 'event')
+
+    def __init__(self, data, strategy_provider=None, quiet=False, engine='stepwise',
+                 storage='objects', economy=None, report_detail='annual', exporter=None,
+                 profiler=None, checkpointer=None, max_months=None):
+        if engine not in Simulation.ENGINES:
+            raise ValueError('"{}" is not a valid simulation engine.'.format(engine))
         self.group_mode = data.group_mode
+        self.quiet = quiet
+        self.engine = engine
+        self.economy = economy or default_parameters()
+        self.ledger = Ledger(report_detail)
+        self.exporter = exporter
+        self.checkpointer = checkpointer
+        self.max_months = max_months
         if self.group_mode:
-            self.model = Group(data)
+            self.model = Group(data, strategy_provider, storage, self.economy, self.ledger)
         else:
-            self.model = Person(data.get_people()[0])
+            self.model = Person(
+                data.get_people()[0], strategy_provider, storage, self.economy, self.ledger)
         self.month = 0
+        self.steps = 0
+        self.debt_free_month = 0 if self.model.debt_free() else None
 
         goal_from_data = data.savings_goal
         if goal_from_data is not None:
             self.savings_goal = goal_from_data
+        elif quiet:
+            error_msg = 'A savings goal must be provided to run without the User Interface.'
+            raise DataImportError(error_msg)
         else:
             self.savings_goal = UI.obtain_savings_goal()
 
+        self.profiler = profiler
+        if profiler is not None:
+            profiler.attach(self)
+
     def simulate(self):
+        """
+        Simulates until the savings goal is met, returning the month it was met in, or None if it
+        was not met by month ``max_months``. A goal which provably cannot be met in time (see
+        ``finsim.feasibility``) is not simulated at all, leaving the simulation at its current month.
+        """
+        if self.exporter is not None:
+            self.exporter.begin(self.model)
+        try:
+            if self.exporter is not None:
+                self.exporter.record(self.month)
+            goal_met = False
+            if earliest_month(self, self.max_months) is not None:
+                goal_met = self.advance(until=self.max_months)
+            self.ledger.flush()
+        finally:
+            # The export files are closed even if the simulation or a write fails
+            if self.exporter is not None:
+                self.exporter.close()
+        # TODO: Construct and save final report
+        if not self.quiet:
+            UI.end(self.month, goal_met)
+        return self.month if goal_met else None
+
+    def fork(self, strategy_provider=None):
+        """
+        Returns an independent branch of this simulation from the current month, for comparing
+        what-if strategies. Fixed data - account names and rates, expense definitions, payroll and
+        tax parameters - is shared with the branch; balances, costs, pay and the ledger are copied.
+
+        If ``strategy_provider`` is given, every person in the branch switches to it immediately.
+        The branch has no exporter or checkpointer, and a profiled simulation cannot be forked.
+        """
+        if self.profiler is not None:
+            raise ValueError('A simulation being profiled cannot be forked.')
+        forked = copy(self)
+        forked.ledger = self.ledger.fork()
+        forked.model = self.model.fork(forked.ledger)
+        forked.exporter = None
+        forked.profiler = None
+        forked.checkpointer = None
+        if strategy_provider is not None:
+            people = forked.model.people if self.group_mode else [ forked.model ]
+            for person in people:
+                person.strategy_provider = strategy_provider
+                if person.current_strategy is not None:
+                    person.strategise()
+        return forked
+
+    def advance(self, until=None):
+        """
+        Simulates months until the savings goal is met or, if given, month ``until`` has been
+        simulated. Returns whether the goal was met. Can be called repeatedly to run a simulation
+        in stages.
+        """
         goal_met = False
-        while not goal_met:
+        while not goal_met and (until is None or self.month < until):
             self.month += 1
-            goal_met = self._step_forward()
-        # TODO: Construct and save final report
-        UI.end(self.month)
-        
-        
-    def _step_forward(self):
+            self.steps += 1
+            goal_met = self._step_forward(until)
+            if self.debt_free_month is None and self.model.debt_free():
+                self.debt_free_month = self.month
+            if self.exporter is not None:
+                self.exporter.record(self.month)
+            if self.checkpointer is not None:
+                self.checkpointer.record(self)
+        return goal_met
+
+
+    def _step_forward(self, until=None):
+        self.ledger.month = self.month
         if (self.month % 12) == 1:
             self.model.begin_year()
 
-        self.model.simulate_month()
+        if self.engine == 'event':
+            months = self._months_until_event(until)
+            self.month += months - 1
+            self.ledger.month = self.month
+            self.model.simulate_month(months)
+        else:
+            self.model.simulate_month()
         if self._achieved_goal():
             return True
 
         if (self.month % 12) == 0:
             self.model.end_year()
-            UI.end_year(self.model, self.month // 12)
+            if not self.quiet:
+                UI.end_year(self.model, self.month // 12)
         else:
             if self.model.updated:
                 self.model.strategise()
 
         return False
 
+    def _months_until_event(self, until=None):
+        """
+        Returns the number of months, including the current one, until the next month in which
+        something other than a balance changes: a debt clearing, the goal being met, the year
+        ending or month ``until`` being reached. Balances change linearly until then, so those
+        months can be simulated at once.
+        """
+        months = 12 - ((self.month - 1) % 12)
+        if until is not None:
+            months = min(months, until - self.month + 1)
+
+        debt_cleared = self.model.months_until_debt_cleared()
+        if debt_cleared is not None:
+            months = min(months, debt_cleared)
+
+        monthly_deposit = self.model.monthly_deposit()
+        if monthly_deposit > 0:
+            shortfall = self.savings_goal - self.model.total_saved()
+            months = min(months, max(months_to_cover(shortfall, monthly_deposit), 1))
+
+        return months
+
     def _achieved_goal(self):
         return self.model.total_saved() >= self.savings_goal
-        
\ No newline at end of file
+
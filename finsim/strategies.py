@@ -0,0 +1,373 @@
+from abc import ABC, abstractmethod
+from asyncio import new_event_loop, start_server
+from json import dumps as json_dumps, load as json_load, loads as json_loads
+
+from finsim.utils import get_percentage_of, round_currency, decimalise as D
+
+class StrategyProvider(ABC):
+    """
+    Supplies a person's monthly strategy whenever the simulation asks for one.
+
+    A strategy is a dict of the form ``{ 'debts': [ Item ], 'savings': [ Item ], 'remaining': Decimal }``,
+    where each item is ``{ 'name': str, 'payment': Decimal }``.
+
+    ``within_income`` is True for providers which never pay out more than a person's disposable
+    income, allowing ``finsim.feasibility`` to bound when a goal can be met.
+    """
+
+    within_income = False
+
+    @abstractmethod
+    def obtain_initial_strategy(self, person):
+        pass
+
+    def obtain_new_strategy(self, person):
+        return self.obtain_initial_strategy(person)
+
+
+class FixedStrategy(StrategyProvider):
+    """
+    Applies the same strategy to a person every time one is requested. Payments to debts which have
+    since been cleared are dropped.
+
+    ``strategies`` maps each person's name to either a full strategy dict or a dict with ``debts``
+    and ``savings`` mappings of account name to payment.
+    """
+
+    def __init__(self, strategies):
+        self.strategies = strategies
+
+    def obtain_initial_strategy(self, person):
+        try:
+            strategy = self.strategies[person.name]
+        except KeyError:
+            error_msg = 'No strategy has been provided for {}.'.format(person.name)
+            raise StrategyError(error_msg)
+
+        return build_strategy(
+            person,
+            _to_payments(strategy.get('debts', [])),
+            _to_payments(strategy.get('savings', []))
+        )
+
+
+class FileStrategy(FixedStrategy):
+    """
+    A ``FixedStrategy`` read from a JSON file, keyed by person name.
+    """
+
+    def __init__(self, path):
+        with open(path, 'r') as f:
+            strategies = json_load(f)
+        super().__init__(strategies)
+
+
+class FunctionStrategy(StrategyProvider):
+    """
+    Delegates to ``func(person, initial)``, which must return a strategy dict.
+    """
+
+    def __init__(self, func):
+        self.func = func
+
+    def obtain_initial_strategy(self, person):
+        return self.func(person, True)
+
+    def obtain_new_strategy(self, person):
+        return self.func(person, False)
+
+
+class AsyncStrategyProvider(StrategyProvider):
+    """
+    Supplies strategies asynchronously, e.g. from other terminals, sockets or a web front end.
+    When every person in a ``Group`` is asked for a strategy at once, the requests to async
+    providers run concurrently on ``loop``, so the simulation waits only for the slowest answer.
+    Meanwhile, people with other providers are asked one after another on a worker thread, so a
+    blocking prompt does not hold the async requests back. Asked on its own, each request runs on
+    ``loop`` until complete.
+
+    All the async providers in a group must share a loop. Without one, a loop of the provider's
+    own is created when first needed, and is closed by ``close``.
+    """
+
+    def __init__(self, loop=None):
+        self._loop = loop
+        self._owns_loop = False
+
+    @property
+    def loop(self):
+        if self._loop is None:
+            self._loop = new_event_loop()
+            self._owns_loop = True
+        return self._loop
+
+    def close(self):
+        if self._owns_loop and not self._loop.is_closed():
+            self._loop.close()
+
+    @abstractmethod
+    async def obtain_initial_strategy_async(self, person):
+        pass
+
+    async def obtain_new_strategy_async(self, person):
+        return await self.obtain_initial_strategy_async(person)
+
+    def obtain_initial_strategy(self, person):
+        return self.loop.run_until_complete(self.obtain_initial_strategy_async(person))
+
+    def obtain_new_strategy(self, person):
+        return self.loop.run_until_complete(self.obtain_new_strategy_async(person))
+
+
+class AsyncFunctionStrategy(AsyncStrategyProvider):
+    """
+    Awaits ``func(person, initial)``, a coroutine function which must return a strategy dict.
+    """
+
+    def __init__(self, func, loop=None):
+        super().__init__(loop)
+        self.func = func
+
+    async def obtain_initial_strategy_async(self, person):
+        return await self.func(person, True)
+
+    async def obtain_new_strategy_async(self, person):
+        return await self.func(person, False)
+
+
+class StreamStrategy(AsyncStrategyProvider):
+    """
+    Asks for each person's strategy over their own asyncio stream, such as a socket connection.
+    ``streams`` maps each person's name to a ``(reader, writer)`` pair.
+
+    Each request is written as one line of JSON describing the person's disposable income and
+    accounts, and the reply must be one line of JSON with ``debts`` and ``savings`` mappings of
+    account name to payment.
+    """
+
+    def __init__(self, streams, loop=None):
+        super().__init__(loop)
+        self.streams = streams
+
+    @classmethod
+    def listen(cls, names, host='localhost', port=0, loop=None, ready=None):
+        """
+        Waits for a connection from each person in ``names``, each sending the person's name as its
+        first line, and returns a ``StreamStrategy`` over those connections. ``ready(port)`` is
+        called once the server is listening.
+        """
+        owns_loop = loop is None
+        loop = loop or new_event_loop()
+        streams = {}
+        connected = loop.create_future()
+
+        async def accept(reader, writer):
+            name = (await reader.readline()).decode('utf-8').strip()
+            if name not in names or name in streams:
+                writer.write('"{}" is not expected or is already connected.\n'.format(name).encode('utf-8'))
+                await writer.drain()
+                writer.close()
+                return
+            streams[name] = (reader, writer)
+            if len(streams) == len(names) and not connected.done():
+                connected.set_result(None)
+
+        async def serve():
+            server = await start_server(accept, host, port)
+            if ready is not None:
+                ready(server.sockets[0].getsockname()[1])
+            await connected
+            server.close()
+            await server.wait_closed()
+
+        loop.run_until_complete(serve())
+        provider = cls(streams, loop)
+        provider._owns_loop = owns_loop
+        return provider
+
+    def close(self):
+        """
+        Closes every person's stream, and the loop if this provider created it.
+        """
+        for _, writer in self.streams.values():
+            writer.close()
+        super().close()
+
+    async def obtain_initial_strategy_async(self, person):
+        return await self._request(person, True)
+
+    async def obtain_new_strategy_async(self, person):
+        return await self._request(person, False)
+
+
+    # -- Private Methods ----------------------------------
+
+    async def _request(self, person, initial):
+        try:
+            reader, writer = self.streams[person.name]
+        except KeyError:
+            error_msg = 'No stream has been provided for {}.'.format(person.name)
+            raise StrategyError(error_msg)
+
+        request = {
+            'person': person.name,
+            'initial': initial,
+            'disposable_income': str(person.disposable_income),
+            'debts': [ _describe(d) for d in person.debts.to_list() ],
+            'savings': [ _describe(a) for a in person.savings.to_list() ]
+        }
+        writer.write((json_dumps(request) + '\n').encode('utf-8'))
+        await writer.drain()
+
+        line = await reader.readline()
+        if not line:
+            error_msg = 'The stream for {} closed before a strategy was received.'.format(person.name)
+            raise StrategyError(error_msg)
+        try:
+            reply = json_loads(line.decode('utf-8'))
+            return build_strategy(
+                person, _to_payments(reply.get('debts', [])), _to_payments(reply.get('savings', [])))
+        except (ValueError, AttributeError, KeyError, TypeError) as e:
+            error_msg = 'Invalid strategy received for {}: {}'.format(person.name, e)
+            raise StrategyError(error_msg)
+
+
+class RuleStrategy(StrategyProvider):
+    """
+    Splits disposable income using simple rules. ``debt_share`` percent goes to debts (in
+    ``order``, either 'avalanche' or 'snowball'), the rest is divided between savings accounts by
+    ``savings_weights`` (equally by default). ``reserve`` is held back each month.
+    """
+
+    ORDERS = ('avalanche', 'snowball')
+    within_income = True
+
+    def __init__(self, debt_share='50', order='avalanche', savings_weights=None, reserve='0'):
+        if order not in RuleStrategy.ORDERS:
+            error_msg = '"{}" is not a valid debt repayment order.'.format(order)
+            raise StrategyError(error_msg)
+        self.debt_share = D(debt_share)
+        self.order = order
+        self.savings_weights = savings_weights
+        self.reserve = D(reserve)
+
+    def obtain_initial_strategy(self, person):
+        available = max(person.disposable_income - self.reserve, D('0'))
+        debts = order_debts(person.debts.to_list(), self.order)
+
+        debt_budget = get_percentage_of(available, self.debt_share) if debts else D('0')
+        debt_payments = {}
+        for debt in debts:
+            payment = min(debt_budget, debt.balance)
+            debt_payments[debt.name] = payment
+            debt_budget -= payment
+
+        savings_budget = available - sum(debt_payments.values())
+        savings_payments = self._split_savings(person.savings.to_list(), savings_budget)
+        return build_strategy(person, debt_payments, savings_payments)
+
+
+    # -- Private Methods ----------------------------------
+
+    def _split_savings(self, accounts, budget):
+        weights = self.savings_weights or {}
+        account_weights = [ D(weights.get(a.name, 0 if weights else 1)) for a in accounts ]
+        total_weight = sum(account_weights)
+        if total_weight <= 0:
+            return {}
+
+        return {
+            account.name: round_currency(budget * weight / total_weight)
+            for account, weight in zip(accounts, account_weights)
+        }
+
+
+class ShareStrategy(StrategyProvider):
+    """
+    Pays a fixed share of disposable income into each account. ``shares`` maps each person's name
+    to a mapping of account name to share, where a share is a fraction of disposable income. When a
+    debt clears, its share rolls over to the next active debt in ``order``, or once none remain, to
+    savings in proportion to their shares.
+    """
+
+    def __init__(self, shares, order='avalanche'):
+        if order not in RuleStrategy.ORDERS:
+            error_msg = '"{}" is not a valid debt repayment order.'.format(order)
+            raise StrategyError(error_msg)
+        self.shares = shares
+        self.order = order
+
+    @property
+    def within_income(self):
+        for shares in self.shares.values():
+            values = [ D(share) for share in shares.values() ]
+            if any(value < 0 for value in values) or sum(values) > 1:
+                return False
+        return True
+
+    def obtain_initial_strategy(self, person):
+        shares = { name: D(share) for name, share in self.shares.get(person.name, {}).items() }
+        available = max(person.disposable_income, D('0'))
+        debts = order_debts(person.debts.to_list(), self.order)
+        savings = person.savings.to_list()
+
+        active = set(d.name for d in debts)
+        freed = sum(shares.get(d.name, D('0')) for d in person.debts.to_list(active_only=False)
+                    if d.name not in active)
+        debt_shares = { d.name: shares.get(d.name, D('0')) for d in debts }
+        savings_shares = { a.name: shares.get(a.name, D('0')) for a in savings }
+        if len(debts) > 0:
+            debt_shares[debts[0].name] += freed
+        elif len(savings) > 0:
+            total = sum(savings_shares.values())
+            for name, share in savings_shares.items():
+                weight = share / total if total > 0 else D('1') / len(savings)
+                savings_shares[name] = share + (freed * weight)
+
+        return build_strategy(
+            person,
+            { name: round_currency(available * share) for name, share in debt_shares.items() },
+            { name: round_currency(available * share) for name, share in savings_shares.items() }
+        )
+
+
+class StrategyError(Exception):
+    pass
+
+def order_debts(debts, order):
+    """
+    Sorts debts into repayment order: highest interest rate first for 'avalanche', smallest balance
+    first for 'snowball'.
+    """
+    if order == 'avalanche':
+        return sorted(debts, key=lambda d: (-d.interest_rate, d.balance))
+    return sorted(debts, key=lambda d: (d.balance, -d.interest_rate))
+
+def build_strategy(person, debt_payments, savings_payments):
+    """
+    Builds a strategy dict from account name → payment mappings, ignoring inactive debts.
+    """
+    active_debts = [ d.name for d in person.debts.to_list() ]
+    strategy = {
+        'savings': [
+            { 'name': a.name, 'payment': D(savings_payments.get(a.name, 0)) }
+            for a in person.savings.to_list()
+        ]
+    }
+    if len(active_debts) > 0:
+        strategy['debts'] = [
+            { 'name': name, 'payment': D(debt_payments.get(name, 0)) }
+            for name in active_debts
+        ]
+
+    allocated = sum(item['payment'] for item in strategy.get('debts', []) + strategy['savings'])
+    strategy['remaining'] = person.disposable_income - allocated
+    return strategy
+
+def _to_payments(items):
+    if isinstance(items, dict):
+        return items
+    return { item['name']: item['payment'] for item in items }
+
+def _describe(account):
+    return { 'name': account.name, 'balance': str(account.balance), 'interest_rate': str(account.interest_rate) }
@@ -0,0 +1,337 @@
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from functools import partial
+from itertools import product
+from math import ceil
+from os import cpu_count
+
+import numpy as np
+
+from finsim import money
+from finsim.economy import default_parameters
+from finsim.feasibility import earliest_month
+from finsim.sim_data import SimData
+from finsim.simulation import Simulation
+from finsim.strategies import RuleStrategy
+from finsim.transport import ArrayBlock
+from finsim.validation import DATA_VALIDATOR
+
+STRATEGY_PREFIX = 'strategy.'
+ECONOMY_PREFIX = 'economy.'
+
+class SweepError(Exception):
+    pass
+
+def sweep(base_data, axes, strategy=None, engine='event', workers=None, chunksize=None,
+          economy=None, max_years=100):
+    """
+    Simulates every combination of ``axes`` over ``base_data`` (a ``SimData``) and returns one
+    result row per combination, in grid order.
+
+    ``axes`` maps a dotted path to a list of values. Paths address the data file, e.g.
+    ``savings_goal`` or ``people.*.salary.pension`` (list items can be selected by index, by name
+    or with ``*``), or address a ``RuleStrategy`` argument with ``strategy.`` (e.g.
+    ``strategy.debt_share``), or an ``EconomicParameters`` field with ``economy.`` (e.g.
+    ``economy.inflation_rate``). ``strategy`` is either a dict of ``RuleStrategy`` arguments or any
+    picklable strategy provider, and ``economy`` the base ``EconomicParameters``.
+
+    Points which do not reach the goal within ``max_years`` have ``months`` of None. Points which
+    provably cannot reach it are not simulated, so keep their starting balances.
+    """
+    strategy = {} if strategy is None else strategy
+    strategy_axes = [ path for path in axes if path.startswith(STRATEGY_PREFIX) ]
+    if len(strategy_axes) > 0 and not isinstance(strategy, dict):
+        error_msg = 'Strategy axes can only be swept with a rule-driven strategy.'
+        raise SweepError(error_msg)
+
+    points = _grid(axes)
+    if len(points) == 0:
+        return []
+
+    workers = workers or cpu_count() or 1
+    chunks = _chunks(points, workers, chunksize)
+
+    economy = economy or default_parameters()
+    max_months = max_years * 12
+    if workers == 1:
+        results = [
+            run_points(base_data.data, strategy, engine, chunk, economy, max_months) for chunk in chunks
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            tasks = [ (base_data.data, strategy, engine, chunk, economy, max_months) for chunk in chunks ]
+            in_backend = partial(money.call_with_backend, money.get_backend().name, _run_task)
+            results = list(executor.map(in_backend, tasks))
+
+    return [ row for chunk in results for row in chunk ]
+
+def run_points(base_raw, strategy, engine, points, economy=None, max_months=None):
+    return [ run_point(base_raw, strategy, engine, point, economy, max_months) for point in points ]
+
+def run_point(base_raw, strategy, engine, point, economy=None, max_months=None):
+    sim_data, provider, economy = _point_inputs(base_raw, strategy, point, economy)
+    simulation = Simulation(
+        sim_data, provider, quiet=True, engine=engine, economy=economy, report_detail='none',
+        max_months=max_months)
+    months = simulation.simulate()
+
+    row = dict(point)
+    row['months'] = months
+    row['debt_free_month'] = simulation.debt_free_month
+    row['total_saved'] = simulation.model.total_saved()
+    row.update(final_balances(simulation))
+    return row
+
+def sweep_arrays(base_data, axes, strategy=None, engine='event', workers=None, chunksize=None,
+                 economy=None, max_years=100, totals=False, shared=True):
+    """
+    As ``sweep``, but returns the results as numeric arrays in a ``SweepArrays``. Workers write
+    their grid points' results straight into one block of shared memory created here, so only a
+    small descriptor of the block is pickled each way, rather than rows of ``Decimal`` balances.
+    Without shared memory (before Python 3.8, or with ``shared=False``), each worker's arrays are
+    pickled back and copied in instead.
+
+    Points which do not reach the goal within ``max_years`` have ``months`` of -1. Unless
+    ``totals`` are kept, points which provably cannot reach it are not simulated, so keep their
+    starting balances. With ``totals``, the total saved at the end of every month is kept too; this
+    needs a step every month, so points are then simulated with the stepwise engine.
+    """
+    strategy = {} if strategy is None else strategy
+    if any(path.startswith(STRATEGY_PREFIX) for path in axes) and not isinstance(strategy, dict):
+        error_msg = 'Strategy axes can only be swept with a rule-driven strategy.'
+        raise SweepError(error_msg)
+
+    points = _grid(axes)
+    accounts = [
+        '{}:{}'.format(person['name'], account['name'])
+        for person in base_data.get_people()
+        for account in person.get('savings', []) + person.get('debts', [])
+    ]
+    max_months = max_years * 12
+    layout = _result_layout(len(points), len(accounts), max_months if totals else None)
+    block = ArrayBlock(layout, shared)
+    if totals:
+        engine = 'stepwise'
+
+    workers = workers or cpu_count() or 1
+    economy = economy or default_parameters()
+    tasks = []
+    start = 0
+    for chunk in _chunks(points, workers, chunksize):
+        tasks.append((base_data.data, strategy, engine, chunk, economy, accounts, max_months, totals,
+                      start, block.descriptor))
+        start += len(chunk)
+
+    try:
+        if workers == 1 or len(tasks) <= 1:
+            results = [ _fill_points(task, block) for task in tasks ]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                in_backend = partial(money.call_with_backend, money.get_backend().name, _fill_points)
+                results = list(executor.map(in_backend, tasks))
+        for (_, _, _, chunk, _, _, _, _, start, _), arrays in zip(tasks, results):
+            if arrays is not None:
+                for name, values in arrays.items():
+                    block[name][start:start + len(chunk)] = values
+    except BaseException:
+        block.close()
+        block.unlink()
+        raise
+    return SweepArrays(points, accounts, block)
+
+def final_balances(simulation):
+    people = simulation.model.people if simulation.group_mode else [ simulation.model ]
+    balances = {}
+    for person in people:
+        for account in person.savings.to_list() + person.debts.to_list(active_only=False):
+            balances['{}:{}'.format(person.name, account.name)] = account.balance
+    return balances
+
+class SweepArrays:
+    """
+    The results of ``sweep_arrays``, one row per grid point in ``points``:
+
+    - ``months``: months taken to reach the goal, or -1 if it was not reached.
+    - ``debt_free_month``: the month every debt was cleared, or -1.
+    - ``total_saved``: the total saved at the end, in pence.
+    - ``balances``: each account's final balance in pence, with a column per name in ``accounts``.
+    - ``totals``: if requested, the total saved in pence at the end of each month from 0, and 0
+      after the goal is reached.
+
+    The arrays may live in shared memory, so must not be used after ``close``.
+    """
+
+    def __init__(self, points, accounts, block):
+        self.points = points
+        self.accounts = accounts
+        self._block = block
+
+    def __getattr__(self, name):
+        block = self.__dict__.get('_block')
+        if block is not None and name in block.arrays:
+            return block[name]
+        raise AttributeError(name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._block is not None:
+            self._block.close()
+            self._block.unlink()
+            self._block = None
+
+
+def set_path(data, path, value):
+    """
+    Sets every value in ``data`` addressed by ``path``. An attribute which is missing is only
+    added if the data file schema allows it there, so a misspelt path raises ``SweepError``
+    rather than leaving the data unchanged.
+    """
+    keys = path.lower().split('.')
+    targets = [ data ]
+    for depth, key in enumerate(keys[:-1]):
+        targets = [ child for target in targets for child in _select(target, key, path, keys[:depth]) ]
+    for target in targets:
+        if isinstance(target, list):
+            for item in _select(target, keys[-1], path, keys[:-1]):
+                target[target.index(item)] = value
+        else:
+            _check_attribute(target, keys[-1], path, keys[:-1])
+            target[keys[-1]] = value
+
+def _grid(axes):
+    paths = list(axes.keys())
+    return [ dict(zip(paths, values)) for values in product(*axes.values()) ]
+
+def _chunks(points, workers, chunksize):
+    if chunksize is None:
+        chunksize = max(1, ceil(len(points) / (workers * 4)))
+    return [ points[i:i + chunksize] for i in range(0, len(points), chunksize) ]
+
+def _point_inputs(base_raw, strategy, point, economy=None):
+    raw_data = deepcopy(base_raw)
+    strategy_args = dict(strategy) if isinstance(strategy, dict) else None
+    economy_args = {}
+    for path, value in point.items():
+        if path.startswith(STRATEGY_PREFIX):
+            strategy_args[path[len(STRATEGY_PREFIX):]] = value
+        elif path.startswith(ECONOMY_PREFIX):
+            economy_args[path[len(ECONOMY_PREFIX):]] = value
+        else:
+            set_path(raw_data, path, value)
+
+    provider = RuleStrategy(**strategy_args) if strategy_args is not None else strategy
+    economy = (economy or default_parameters()).replace(**economy_args)
+    return SimData.from_dict(raw_data), provider, economy
+
+def _result_layout(points, accounts, max_months=None):
+    layout = [
+        ('months', np.int32, (points,)),
+        ('debt_free_month', np.int32, (points,)),
+        ('total_saved', np.int64, (points,)),
+        ('balances', np.int64, (points, accounts))
+    ]
+    if max_months is not None:
+        layout.append(('totals', np.int64, (points, max_months + 1)))
+    return layout
+
+def _fill_points(task, block=None):
+    """
+    Simulates a chunk of points, writing their results into rows ``start`` onwards of the shared
+    block described in the task. Without one, the chunk's own arrays are returned instead.
+    """
+    base_raw, strategy, engine, points, economy, accounts, max_months, totals, start, descriptor = task
+    if block is not None:
+        target, rows = block, slice(start, start + len(points))
+    elif descriptor is not None:
+        target, rows = ArrayBlock.attach(descriptor), slice(start, start + len(points))
+    else:
+        target = ArrayBlock(_result_layout(len(points), len(accounts), max_months if totals else None), False)
+        rows = slice(0, len(points))
+
+    columns = { name: index for index, name in enumerate(accounts) }
+    months, debt_free, total_saved = target['months'][rows], target['debt_free_month'][rows], target['total_saved'][rows]
+    balances = target['balances'][rows]
+    history = target['totals'][rows] if totals else None
+    for row, point in enumerate(points):
+        sim_data, provider, point_economy = _point_inputs(base_raw, strategy, point, economy)
+        recorder = _TotalsRecorder(history[row]) if totals else None
+        simulation = Simulation(
+            sim_data, provider, quiet=True, engine=engine, economy=point_economy, report_detail='none',
+            exporter=recorder)
+        if recorder is not None:
+            recorder.begin(simulation.model)
+            reached = simulation.advance(until=max_months)
+        elif earliest_month(simulation, max_months) is not None:
+            reached = simulation.advance(until=max_months)
+        else:
+            reached = False
+
+        months[row] = simulation.month if reached else -1
+        debt_free[row] = simulation.debt_free_month if simulation.debt_free_month is not None else -1
+        total_saved[row] = _pence(simulation.model.total_saved())
+        for name, balance in final_balances(simulation).items():
+            if name not in columns:
+                error_msg = '"{}" is not an account in the base data.'.format(name)
+                raise SweepError(error_msg)
+            balances[row, columns[name]] = _pence(balance)
+
+    del months, debt_free, total_saved, balances, history
+    if block is not None:
+        return None
+    if descriptor is not None:
+        target.close()
+        return None
+    return target.arrays
+
+
+class _TotalsRecorder:
+    def __init__(self, totals):
+        self.totals = totals
+        self._model = None
+
+    def begin(self, model):
+        self._model = model
+        self.totals[0] = _pence(model.total_saved())
+
+    def record(self, month):
+        self.totals[month] = _pence(self._model.total_saved())
+
+    def close(self):
+        pass
+
+
+def _pence(amount):
+    return int(amount.scaleb(2))
+
+def _select(target, key, path, parents):
+    if isinstance(target, dict):
+        if key not in target:
+            _check_attribute(target, key, path, parents)
+            target[key] = {}
+        return [ target[key] ]
+    if key == '*':
+        return list(target)
+    if key.isdigit() and int(key) < len(target):
+        return [ target[int(key)] ]
+
+    matches = [ item for item in target if str(item.get('name', '')).lower() == key ]
+    if len(matches) == 0:
+        error_msg = '"{}" does not match any item in "{}".'.format(key, path)
+        raise SweepError(error_msg)
+    return matches
+
+def _check_attribute(target, key, path, parents):
+    if key in target:
+        return
+    attributes = DATA_VALIDATOR.attributes(parents)
+    if attributes is None or key not in attributes:
+        error_msg = '"{}" is not an attribute which can be set in "{}".'.format(key, path)
+        raise SweepError(error_msg)
+
+def _run_task(task):
+    return run_points(*task)
@@ -0,0 +1,81 @@
+from collections import namedtuple
+
+import numpy as np
+
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:
+    # Python < 3.8
+    SharedMemory = None
+
+SHARED_MEMORY = SharedMemory is not None
+
+_ALIGNMENT = 8
+
+BlockDescriptor = namedtuple('BlockDescriptor', ['name', 'layout'])
+
+class ArrayBlock:
+    """
+    Named numpy arrays laid out one after another in a single block of memory. ``layout`` is a
+    sequence of ``(name, dtype, shape)``, and the arrays start zeroed.
+
+    A shared block is created by one process and attached in others from its ``descriptor`` - just
+    its name and layout - so arrays written by workers are read by the parent without being pickled
+    or copied. The creator must ``close`` and ``unlink`` it once done, and the arrays cannot be
+    used after closing. Without shared memory (before Python 3.8), or with ``shared=False``, the
+    arrays are ordinary ones private to this process.
+    """
+
+    def __init__(self, layout, shared=True, name=None):
+        self.layout = tuple((array_name, np.dtype(dtype).str, tuple(shape)) for array_name, dtype, shape in layout)
+        self.shared = shared and SHARED_MEMORY
+        self.arrays = {}
+        self._memory = None
+        if not self.shared:
+            for array_name, dtype, shape in self.layout:
+                self.arrays[array_name] = np.zeros(shape, dtype)
+            return
+
+        offsets, size = _offsets(self.layout)
+        if name is None:
+            self._memory = SharedMemory(create=True, size=max(size, 1))
+        else:
+            self._memory = SharedMemory(name=name)
+        for (array_name, dtype, shape), offset in zip(self.layout, offsets):
+            self.arrays[array_name] = np.ndarray(shape, dtype, buffer=self._memory.buf, offset=offset)
+        if name is None:
+            for array in self.arrays.values():
+                array.fill(0)
+
+    @classmethod
+    def attach(cls, descriptor):
+        return cls(descriptor.layout, shared=True, name=descriptor.name)
+
+    @property
+    def descriptor(self):
+        if not self.shared:
+            return None
+        return BlockDescriptor(self._memory.name, self.layout)
+
+    def __getitem__(self, array_name):
+        return self.arrays[array_name]
+
+    def close(self):
+        self.arrays = {}
+        if self._memory is not None:
+            self._memory.close()
+
+    def unlink(self):
+        if self._memory is not None:
+            self._memory.unlink()
+            self._memory = None
+
+
+def _offsets(layout):
+    offsets = []
+    size = 0
+    for _, dtype, shape in layout:
+        size = -(-size // _ALIGNMENT) * _ALIGNMENT
+        offsets.append(size)
+        size += np.dtype(dtype).itemsize * int(np.prod(shape, dtype=np.int64))
+    return offsets, size
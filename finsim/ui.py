@@ -3,11 +3,14 @@ from sys import exit
 
 from finsim.utils import round_currency_to_pounds
 from finsim.debts import Debt
+from finsim.strategies import StrategyProvider
 
 class UserRequestedRestart(Exception):
     pass
 
-class UI:
+class UI(StrategyProvider):
+
+    within_income = True
 
     # -- Basic Output Functions -------------------------------------
 
@@ -33,13 +36,14 @@ class UI:
         # TODO: Show annual report for each person
 
     @staticmethod
-    def end(total_months):
+    def end(total_months, goal_met=True):
         years = total_months // 12
         year_label = 'year' if years == 1 else 'years'
         months = total_months % 12
         month_label = 'month' if months == 1 else 'months'
         print(UI._heading('END SIMULATION', level=1))
-        print('Goal achieved in {} {} and {} {}.\n'.format(
+        print('Goal {} {} {} and {} {}.\n'.format(
+            'achieved in' if goal_met else 'not achieved within',
             years,
             year_label,
             months,
@@ -1,4 +1,14 @@
-from decimal import ROUND_DOWN, ROUND_UP, Context, Decimal as D
+from decimal import ROUND_CEILING, ROUND_DOWN, ROUND_UP, Context, Decimal as D
+
+_PENNY = D('.01')
+_POUND = D('1')
+_HUNDRED = D('100')
+
+# When enabled, running totals are checked against a full recomputation every time they are read.
+VERIFY_TOTALS = False
+
+class TotalMismatchError(Exception):
+    pass
 
 def decimalise(value):
     return D(str(value))
@@ -8,16 +18,27 @@ def round_currency(value, round_up=False):
     Rounds the amount to two decimal places using the current ``Decimal`` rounding algorithm.
     """
     round_direction = ROUND_UP if round_up else ROUND_DOWN
-    return D(value.quantize(D('.01'), rounding=round_direction))
+    return value.quantize(_PENNY, rounding=round_direction)
 
 def round_currency_to_pounds(value, round_up=False):
     """
     Rounds the amount to zero decimal places using the current ``Decimal`` rounding algorithm.
     """
     round_direction = ROUND_UP if round_up else ROUND_DOWN
-    return D(value.quantize(D('1'), rounding=round_direction))
+    return value.quantize(_POUND, rounding=round_direction)
 
 def get_percentage_of(value, percentage, round_up=False):
-    return round_currency( value * (percentage / D('100')), round_up ) 
+    return round_currency( value * (percentage / _HUNDRED), round_up )
 
+def months_to_cover(amount, monthly_amount):
+    """
+    Returns the number of whole months of ``monthly_amount`` needed to cover ``amount``.
+    """
+    months = (amount / monthly_amount).to_integral_value(rounding=ROUND_CEILING)
+    return int(months)
 
+def verify_total(label, running_total, recomputed_total):
+    if running_total != recomputed_total:
+        error_msg = 'Running total for {} is {} but the accounts sum to {}.'.format(
+            label, running_total, recomputed_total)
+        raise TotalMismatchError(error_msg)
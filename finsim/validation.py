@@ -0,0 +1,248 @@
+from collections import namedtuple
+from decimal import InvalidOperation
+
+from finsim.utils import decimalise
+
+ValidationError = namedtuple('ValidationError', ['path', 'message'])
+
+class Validator:
+    """
+    A data file schema compiled into a tree of nodes. Attribute lookups are set-based, error
+    messages and child paths are built once at compile time, and ``validate`` checks the whole
+    document in a single walk, collecting every error as a ``ValidationError`` with its JSON path.
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def validate(self, data):
+        errors = []
+        self.root.validate(data, '$', errors)
+        return errors
+
+    def attributes(self, keys):
+        """
+        Returns the attributes an object may hold at the path ``keys`` - attribute names, with any
+        key standing for an item of a list - or None if the schema describes no object there.
+        """
+        node = self.root
+        for key in keys:
+            node = node.child(key) if isinstance(node, (_Object, _List)) else None
+        return node.attributes if isinstance(node, _Object) else None
+
+
+class _Object:
+    def __init__(self, name, required=(), optional=(), fields=None, checks=(), strict=True):
+        self.name = name
+        self.allowed = frozenset(required) | frozenset(optional)
+        self.strict = strict
+        self.checks = checks
+        self.type_msg = 'Expected a "{}" object.'.format(name)
+        self.missing = [
+            (attr, '"{}" object must contain a "{}" attribute.'.format(name, attr))
+            for attr in required
+        ]
+        self.fields = [ (key, '.' + key, node) for key, node in (fields or {}).items() ]
+        self.attributes = self.allowed | frozenset(fields or {})
+
+    def child(self, key):
+        for field, _, node in self.fields:
+            if field == key:
+                return node
+        return None
+
+    def validate(self, value, path, errors):
+        if not isinstance(value, dict):
+            errors.append(ValidationError(path, self.type_msg))
+            return
+
+        for attr, error_msg in self.missing:
+            if attr not in value:
+                errors.append(ValidationError(path, error_msg))
+        if self.strict:
+            for key in value:
+                if key not in self.allowed:
+                    error_msg = '"{}" is not a valid attribute of "{}".'.format(key, self.name)
+                    errors.append(ValidationError(path, error_msg))
+        for key, suffix, node in self.fields:
+            if key in value:
+                node.validate(value[key], path + suffix, errors)
+        for check in self.checks:
+            check(value, path, errors)
+
+
+class _List:
+    def __init__(self, item, name):
+        self.item = item
+        self.type_msg = '"{}" must be a list.'.format(name)
+
+    def child(self, key):
+        return self.item
+
+    def validate(self, value, path, errors):
+        if not isinstance(value, list):
+            errors.append(ValidationError(path, self.type_msg))
+            return
+        for i, item in enumerate(value):
+            self.item.validate(item, '{}[{}]'.format(path, i), errors)
+
+
+class _Number:
+    def __init__(self, label, positive=False, nullable=False):
+        self.positive = positive
+        self.nullable = nullable
+        self.invalid_msg = '{} must be a valid number.'.format(label)
+        if positive:
+            self.range_msg = '{} must be greater than Zero.'.format(label)
+        else:
+            self.range_msg = '{} must not be negative.'.format(label)
+
+    def validate(self, value, path, errors):
+        if value is None and self.nullable:
+            return
+        if isinstance(value, bool):
+            errors.append(ValidationError(path, self.invalid_msg))
+            return
+        try:
+            number = decimalise(value)
+        except InvalidOperation:
+            errors.append(ValidationError(path, self.invalid_msg))
+            return
+        if not number.is_finite():
+            errors.append(ValidationError(path, self.invalid_msg))
+        elif number < 0 or (self.positive and number == 0):
+            errors.append(ValidationError(path, self.range_msg))
+
+
+class _Type:
+    def __init__(self, types, error_msg):
+        self.types = types
+        self.error_msg = error_msg
+
+    def validate(self, value, path, errors):
+        if not isinstance(value, self.types) or (self.types is str and value == ''):
+            errors.append(ValidationError(path, self.error_msg))
+
+
+class _Choice:
+    def __init__(self, choices, error_msg):
+        self.choices = frozenset(choices)
+        self.error_msg = error_msg
+
+    def validate(self, value, path, errors):
+        if not isinstance(value, str) or value not in self.choices:
+            errors.append(ValidationError(path, self.error_msg))
+
+
+# -- Data File Schema ---------------------------------
+
+def _check_savings(person, path, errors):
+    savings = person.get('savings', None)
+    if isinstance(savings, list) and len(savings) == 0:
+        error_msg = '{} must have at least one savings account.'.format(person.get('name'))
+        errors.append(ValidationError(path + '.savings', error_msg))
+
+def _check_mode(data, path, errors):
+    people = data.get('people', [])
+    num_people = len(people) if isinstance(people, list) else 0
+
+    if num_people == 0:
+        error_msg = 'The data file must contain at least one person.'
+        errors.append(ValidationError(path + '.people', error_msg))
+    elif num_people == 1:
+        if 'group' in data:
+            error_msg = '"Group" data is not permitted when only one person is defined.'
+            errors.append(ValidationError(path + '.group', error_msg))
+    elif 'group' not in data:
+        error_msg = 'If the data file contains more than one person, a "group" must be defined.'
+        errors.append(ValidationError(path, error_msg))
+
+def _compile():
+    name = _Type(str, 'Each account and expense must have a valid name.')
+    interest_rate = _Number('Interest rates')
+    starting_balance = _Number('Starting balances')
+
+    expense = _Object(
+        'expense',
+        required=['name', 'cost'],
+        optional=['inflation'],
+        fields={
+            'name': name,
+            'cost': _Number('Expense costs', positive=True),
+            'inflation': _Type(bool, 'The "inflation" attribute of an expense item, if included, must be either "true" or "false".')
+        }
+    )
+    expenses = _Object(
+        'expenses',
+        optional=['monthly', 'annual'],
+        fields={
+            'monthly': _List(expense, 'monthly'),
+            'annual': _List(expense, 'annual')
+        }
+    )
+    salary = _Object(
+        'salary',
+        required=['base_salary'],
+        optional=['pension', 'payrise_rate'],
+        fields={
+            'base_salary': _Number('Base salaries', positive=True),
+            'pension': _Number('Pension rates'),
+            'payrise_rate': _Number('Payrise rates')
+        }
+    )
+    savings_account = _Object(
+        'savings',
+        required=['name'],
+        optional=['interest_rate', 'starting_balance', 'type'],
+        fields={
+            'name': name,
+            'interest_rate': interest_rate,
+            'starting_balance': starting_balance,
+            'type': _Choice(('traditional', 'lisa'), 'Savings account types must be either "traditional" or "lisa".')
+        }
+    )
+    debt = _Object(
+        'debt',
+        required=['name', 'starting_balance'],
+        optional=['interest_rate'],
+        fields={
+            'name': name,
+            'starting_balance': starting_balance,
+            'interest_rate': interest_rate
+        }
+    )
+    person = _Object(
+        'person',
+        required=['name', 'salary', 'savings', 'expenses'],
+        optional=['debts'],
+        fields={
+            'name': _Type(str, 'Each person in the data file must have a valid name.'),
+            'salary': salary,
+            'savings': _List(savings_account, 'savings'),
+            'expenses': expenses,
+            'debts': _List(debt, 'debts')
+        },
+        checks=[ _check_savings ]
+    )
+    group = _Object(
+        'group',
+        required=['expenses'],
+        optional=['proportional_expenses'],
+        fields={
+            'expenses': expenses,
+            'proportional_expenses': _Type(bool, 'The "proportional_expenses" attribute of the group, if included, must be either "true" or "false".')
+        }
+    )
+    root = _Object(
+        'data',
+        fields={
+            'people': _List(person, 'people'),
+            'group': group,
+            'savings_goal': _Number('Savings Goal', positive=True, nullable=True)
+        },
+        checks=[ _check_mode ],
+        strict=False
+    )
+    return Validator(root)
+
+DATA_VALIDATOR = _compile()
@@ -0,0 +1,36 @@
+from argparse import ArgumentParser
+from time import perf_counter
+
+from finsim.goal_seek import maximum_goal, minimum_deposit
+from finsim.sim_data import SimData
+from finsim.strategies import FileStrategy, RuleStrategy
+
+parser = ArgumentParser(description='Find the deposit or savings goal that meets a target date.')
+parser.add_argument('data', nargs='?', default='data.json', help='path to the data file')
+parser.add_argument('--months', type=int, required=True, help='number of months until the target date')
+parser.add_argument('--deposit', nargs=2, metavar=('PERSON', 'ACCOUNT'),
+                    help='find the minimum monthly deposit into this savings account '
+                         '(otherwise, find the largest reachable goal)')
+parser.add_argument('--goal', help='savings goal to meet (defaults to the one in the data file)')
+parser.add_argument('--strategy', help='JSON file containing a fixed strategy for each person')
+parser.add_argument('--order', default='avalanche', choices=RuleStrategy.ORDERS,
+                    help='debt repayment order when no strategy file is given')
+parser.add_argument('--debt-share', default='50',
+                    help='percentage of disposable income put towards debts when no strategy file is given')
+args = parser.parse_args()
+
+if args.strategy is not None:
+    provider = FileStrategy(args.strategy)
+else:
+    provider = RuleStrategy(debt_share=args.debt_share, order=args.order)
+
+start = perf_counter()
+sim_data = SimData(args.data)
+if args.deposit is not None:
+    person, account = args.deposit
+    deposit = minimum_deposit(sim_data, person, account, args.months, provider, goal=args.goal)
+    print('{} must deposit at least £{} a month into {}.'.format(person, deposit, account))
+else:
+    goal = maximum_goal(sim_data, args.months, provider)
+    print('The largest goal reachable in {} months is £{}.'.format(args.months, goal))
+print('Solved in {:.3f}s.'.format(perf_counter() - start))
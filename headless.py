@@ -0,0 +1,111 @@
+from argparse import ArgumentParser
+from os.path import splitext
+from time import perf_counter
+
+from finsim import checkpoint, money, utils
+from finsim.exporter import exporter_for
+from finsim.ledger import Ledger
+from finsim.person import Person
+from finsim.profiler import Profiler
+from finsim.simulation import Simulation
+from finsim.sim_data import SimData, iter_scenarios
+from finsim.strategies import FileStrategy, RuleStrategy, StreamStrategy
+
+parser = ArgumentParser(description='Run a simulation without the User Interface.')
+parser.add_argument('data', nargs='?', default='data.json',
+                    help='path to the data file, or a JSONL file of scenarios (- for stdin)')
+parser.add_argument('--strategy', help='JSON file containing a fixed strategy for each person')
+parser.add_argument('--strategy-port', type=int, metavar='PORT',
+                    help='ask each person for their strategies over a TCP connection to this port')
+parser.add_argument('--order', default='avalanche', choices=RuleStrategy.ORDERS,
+                    help='debt repayment order when no strategy file is given')
+parser.add_argument('--debt-share', default='50',
+                    help='percentage of disposable income put towards debts when no strategy file is given')
+parser.add_argument('--engine', default='event', choices=Simulation.ENGINES,
+                    help='step through every month, or jump straight between events')
+parser.add_argument('--storage', default='objects', choices=Person.STORAGES,
+                    help='hold accounts as individual objects or as parallel arrays')
+parser.add_argument('--max-years', type=int, metavar='YEARS',
+                    help='give up on the goal after this many years')
+parser.add_argument('--report-detail', default='none', choices=Ledger.DETAILS,
+                    help='how much account history to record')
+parser.add_argument('--export', metavar='PATH',
+                    help='write every balance each month to a CSV file, or to a directory of .npy columns')
+parser.add_argument('--checkpoint', metavar='PATH',
+                    help='save the simulation state to this file as it runs, to resume from later')
+parser.add_argument('--checkpoint-every', type=int, default=12, metavar='MONTHS',
+                    help='months between checkpoints')
+parser.add_argument('--resume', metavar='PATH',
+                    help='continue a simulation from a checkpoint file instead of reading data')
+parser.add_argument('--profile', action='store_true',
+                    help='print the time spent in each phase of the simulation')
+parser.add_argument('--money', default='decimal', choices=sorted(money.BACKENDS),
+                    help='representation used for balances')
+parser.add_argument('--verify-totals', action='store_true',
+                    help='check running savings totals against a full recomputation (slow)')
+args = parser.parse_args()
+max_months = args.max_years * 12 if args.max_years is not None else None
+money.set_backend(args.money)
+utils.VERIFY_TOTALS = args.verify_totals
+
+if args.strategy_port is not None:
+    if args.data == '-' or args.data.endswith('.jsonl') or args.resume is not None:
+        parser.error('--strategy-port needs a single data file')
+    names = [ person['name'] for person in SimData(args.data).get_people() ]
+    print('Waiting for {} on port {}...'.format(', '.join(names), args.strategy_port))
+    provider = StreamStrategy.listen(names, port=args.strategy_port)
+elif args.strategy is not None:
+    provider = FileStrategy(args.strategy)
+else:
+    provider = RuleStrategy(debt_share=args.debt_share, order=args.order)
+
+profiler = Profiler() if args.profile else None
+
+def run(sim_data, export_path=None, checkpoint_path=None):
+    exporter = exporter_for(export_path) if export_path is not None else None
+    checkpointer = None
+    if checkpoint_path is not None:
+        checkpointer = checkpoint.Checkpointer(args.checkpoint_every, checkpoint_path, keep=1)
+    if args.resume is not None:
+        simulation = checkpoint.load(args.resume, provider, exporter, checkpointer)
+        if max_months is not None:
+            simulation.max_months = max_months
+    else:
+        simulation = Simulation(sim_data, strategy_provider=provider, quiet=True, engine=args.engine,
+                                storage=args.storage, report_detail=args.report_detail,
+                                exporter=exporter, profiler=profiler, checkpointer=checkpointer,
+                                max_months=max_months)
+    return simulation.simulate()
+
+def outcome(months):
+    if months is None and max_months is None:
+        return 'goal cannot be achieved'
+    if months is None:
+        return 'goal not achieved within {} months'.format(max_months)
+    return 'goal achieved in {} months'.format(months)
+
+def numbered(path, number):
+    if path is None:
+        return None
+    root, extension = splitext(path)
+    return '{}-{}{}'.format(root, number, extension)
+
+start = perf_counter()
+if args.data == '-' or args.data.endswith('.jsonl'):
+    for number, sim_data in enumerate(iter_scenarios(args.data), start=1):
+        months = run(sim_data, numbered(args.export, number), numbered(args.checkpoint, number))
+        print('Scenario {}: {}.'.format(number, outcome(months)))
+    print('Finished in {:.3f}s.'.format(perf_counter() - start))
+else:
+    sim_data = SimData(args.data) if args.resume is None else None
+    months = run(sim_data, args.export, args.checkpoint)
+    elapsed = perf_counter() - start
+    message = outcome(months)
+    print('{} ({:.3f}s).'.format(message[0].upper() + message[1:], elapsed))
+
+if isinstance(provider, StreamStrategy):
+    provider.close()
+
+if profiler is not None:
+    print()
+    profiler.print_table()
@@ -0,0 +1,53 @@
+from argparse import ArgumentParser
+
+from finsim import money
+from finsim.cache import ResultCache
+from finsim.person import Person
+from finsim.service import ServiceServer, SimulationService
+from finsim.simulation import Simulation
+
+parser = ArgumentParser(description='Serve simulations over HTTP from a pool of warm worker processes.')
+parser.add_argument('--host', default='localhost', help='address to listen on')
+parser.add_argument('--port', type=int, default=8000, help='port to listen on')
+parser.add_argument('--workers', type=int,
+                    help='number of worker processes (defaults to the CPU count, 0 to run in this process)')
+parser.add_argument('--batch-size', type=int, default=32, help='most requests sent to a worker at a time')
+parser.add_argument('--batch-wait', type=float, default=1.0,
+                    help='milliseconds to wait for other requests to join a batch')
+parser.add_argument('--engine', default='event', choices=Simulation.ENGINES)
+parser.add_argument('--storage', default='objects', choices=Person.STORAGES)
+parser.add_argument('--money', default='decimal', choices=sorted(money.BACKENDS),
+                    help='representation used for balances')
+parser.add_argument('--max-years', type=int, default=100,
+                    help='years after which a goal is given up on, unless a request gives its own')
+parser.add_argument('--cache-size', type=int, default=0,
+                    help='results to keep in memory for repeated requests (0 to disable caching)')
+parser.add_argument('--cache-dir', help='directory to keep further results in, shared between runs')
+parser.add_argument('--cache-mb', type=float, default=64, help='most megabytes of results to keep on disk')
+parser.add_argument('--verbose', action='store_true', help='log every HTTP request')
+args = parser.parse_args()
+money.set_backend(args.money)
+
+cache = None
+if args.cache_size > 0:
+    cache = ResultCache(args.cache_size, args.cache_dir, int(args.cache_mb * 1024 * 1024))
+elif args.cache_dir is not None:
+    parser.error('--cache-dir needs a --cache-size of at least 1')
+
+service = SimulationService(
+    workers=args.workers, batch_size=args.batch_size, batch_wait=args.batch_wait / 1000,
+    engine=args.engine, storage=args.storage, cache=cache, max_years=args.max_years)
+with service:
+    server = ServiceServer(service, args.host, args.port, verbose=args.verbose)
+    print('Serving simulations on http://{}:{} with {} workers...'.format(
+        args.host, server.server_address[1], service.workers))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print()
+        print(service.latency.summary())
+        if cache is not None:
+            print(cache.counters)
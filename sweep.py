@@ -0,0 +1,69 @@
+from argparse import ArgumentParser
+from csv import DictWriter
+from json import dump as json_dump
+from os import makedirs
+from os.path import join
+from sys import stdout
+from time import perf_counter
+
+import numpy as np
+
+from finsim.sim_data import SimData
+from finsim.simulation import Simulation
+from finsim.sweep import sweep, sweep_arrays
+
+parser = ArgumentParser(description='Simulate every combination of a grid of parameters.')
+parser.add_argument('data', nargs='?', default='data.json', help='path to the base data file')
+parser.add_argument('--axis', action='append', default=[], metavar='PATH=V1,V2,...',
+                    help='a parameter to sweep, e.g. people.*.salary.payrise_rate=1,3,5, '
+                         'strategy.debt_share=25,50 or economy.inflation_rate=1,2,3')
+parser.add_argument('--workers', type=int, help='number of worker processes (defaults to the CPU count)')
+parser.add_argument('--chunksize', type=int, help='grid points sent to a worker at a time')
+parser.add_argument('--engine', default='event', choices=Simulation.ENGINES)
+parser.add_argument('--output', help='CSV file to write results to (defaults to stdout)')
+parser.add_argument('--arrays', metavar='DIR',
+                    help='write results as .npy arrays in pence to this directory instead of CSV')
+parser.add_argument('--totals', action='store_true',
+                    help='with --arrays, also write the total saved at the end of every month')
+parser.add_argument('--max-years', type=int, default=100,
+                    help='years after which a point is recorded as not reaching its goal')
+args = parser.parse_args()
+if args.totals and args.arrays is None:
+    parser.error('--totals needs --arrays')
+
+axes = {}
+for axis in args.axis:
+    path, _, values = axis.partition('=')
+    axes[path] = values.split(',')
+
+if args.arrays is not None:
+    start = perf_counter()
+    results = sweep_arrays(
+        SimData(args.data), axes, engine=args.engine, workers=args.workers, chunksize=args.chunksize,
+        max_years=args.max_years, totals=args.totals)
+    elapsed = perf_counter() - start
+    with results:
+        makedirs(args.arrays, exist_ok=True)
+        names = [ 'months', 'debt_free_month', 'total_saved', 'balances' ] + ([ 'totals' ] if args.totals else [])
+        for name in names:
+            np.save(join(args.arrays, name + '.npy'), getattr(results, name))
+        with open(join(args.arrays, 'header.json'), 'w') as f:
+            json_dump({ 'points': results.points, 'accounts': results.accounts }, f, indent=4)
+    print('Simulated {} grid points in {:.2f}s.'.format(len(results.points), elapsed))
+else:
+    start = perf_counter()
+    rows = sweep(SimData(args.data), axes, engine=args.engine, workers=args.workers, chunksize=args.chunksize,
+                 max_years=args.max_years)
+    elapsed = perf_counter() - start
+
+    fieldnames = []
+    for row in rows:
+        fieldnames += [ key for key in row if key not in fieldnames ]
+
+    output = open(args.output, 'w', newline='') if args.output else stdout
+    writer = DictWriter(output, fieldnames=fieldnames)
+    writer.writeheader()
+    writer.writerows(rows)
+    if args.output:
+        output.close()
+        print('Simulated {} grid points in {:.2f}s.'.format(len(rows), elapsed))
@@ -0,0 +1,184 @@
+from unittest import TestCase
+from unittest.mock import patch
+from decimal import Decimal
+
+from finsim.account_arrays import DebtArrays, SavingsArrays
+from finsim.debts import Debts
+from finsim.ledger import Ledger
+from finsim.money import set_backend
+from finsim.savings_accounts import SavingsAccounts
+from finsim.sim_data import SimData
+from finsim.simulation import Simulation
+from finsim.strategies import RuleStrategy
+from test_data import generate_test_data
+
+def generate_debts_data():
+    return [
+        { 'name': 'Credit Card', 'starting_balance': '2000.00', 'interest_rate': '19.9' },
+        { 'name': 'Overdraft', 'starting_balance': '150.00' }
+    ]
+
+def generate_savings_data():
+    return [
+        { 'name': 'Savings Acc.', 'interest_rate': '1.00', 'starting_balance': '0.00' },
+        { 'name': 'Lifetime ISA', 'interest_rate': '1.05', 'starting_balance': '100.00', 'type': 'lisa' }
+    ]
+
+def run_accounts(debts, savings, months):
+    debts.apply_strategy([
+        { 'name': 'Credit Card', 'payment': Decimal('110.55') },
+        { 'name': 'Overdraft', 'payment': Decimal('100.00') }
+    ])
+    savings.apply_strategy([
+        { 'name': 'Savings Acc.', 'payment': Decimal('123.45') },
+        { 'name': 'Lifetime ISA', 'payment': Decimal('33.33') }
+    ])
+    deposited = Decimal('0')
+    for month in range(1, months + 1):
+        debts.pay()
+        deposited += savings.deposit()
+        if month % 12 == 0:
+            debts.end_year()
+            deposited += savings.end_year()
+            debts.begin_year()
+            savings.begin_year()
+    return deposited
+
+
+class TestDebtArrays(TestCase):
+
+    def test_pay__matches_debts(self):
+        arrays = DebtArrays(generate_debts_data())
+        objects = Debts(generate_debts_data())
+        run_accounts(arrays, SavingsArrays(generate_savings_data()), 30)
+        run_accounts(objects, SavingsAccounts(generate_savings_data()), 30)
+
+        for view, account in zip(arrays.to_list(active_only=False), objects.to_list(active_only=False)):
+            self.assertEqual(view.name, account.name)
+            self.assertEqual(view.balance, account.balance)
+            self.assertEqual(view.active, account.active)
+            self.assertEqual(view.annual_report, account.annual_report)
+            self.assertEqual(view.overall_report, account.overall_report)
+
+    def test_recently_cleared(self):
+        debts = DebtArrays(generate_debts_data())
+        debts.apply_strategy([ { 'name': 'Overdraft', 'payment': Decimal('100.00') } ])
+
+        debts.pay()
+        self.assertEqual(debts.recently_cleared, [])
+        debts.pay()
+        self.assertEqual(debts.recently_cleared, ['Overdraft'])
+        self.assertEqual([ d.name for d in debts.to_list() ], ['Credit Card'])
+
+        debts.reset_recently_cleared()
+        self.assertEqual(debts.recently_cleared, [])
+
+    def test_months_until_cleared(self):
+        debts = DebtArrays(generate_debts_data())
+        self.assertIsNone(debts.months_until_cleared())
+
+        debts.apply_strategy([
+            { 'name': 'Credit Card', 'payment': Decimal('100.00') },
+            { 'name': 'Overdraft', 'payment': Decimal('40.00') }
+        ])
+        self.assertEqual(debts.months_until_cleared(), 4)
+
+    def test_fork(self):
+        ledger = Ledger('monthly')
+        debts = DebtArrays(generate_debts_data(), ledger, 'Alice')
+        debts.apply_strategy([ { 'name': 'Overdraft', 'payment': Decimal('100.00') } ])
+        forked_ledger = ledger.fork()
+        forked = debts.fork(forked_ledger)
+        forked.pay()
+        forked.pay()
+
+        self.assertEqual(forked.recently_cleared, ['Overdraft'])
+        self.assertEqual(debts.recently_cleared, [])
+        self.assertEqual(debts.to_list()[1].balance, Decimal('150.00'))
+        self.assertEqual(forked.to_list(active_only=False)[1].balance, Decimal('-50.00'))
+        self.assertIs(forked.names, debts.names)
+        self.assertEqual(ledger.size, 0)
+        self.assertEqual(forked_ledger.size, 2)
+
+    def test_view_setters(self):
+        debts = DebtArrays(generate_debts_data())
+        view = debts.to_list()[1]
+        view.balance = '75.50'
+        view.payment_amount = Decimal('10')
+
+        self.assertEqual(view.balance, Decimal('75.50'))
+        self.assertEqual(debts.months_until_cleared(), 8)
+
+
+class TestSavingsArrays(TestCase):
+
+    def test_deposit__matches_savings_accounts(self):
+        arrays = SavingsArrays(generate_savings_data())
+        objects = SavingsAccounts(generate_savings_data())
+        arrays_deposited = run_accounts(DebtArrays(generate_debts_data()), arrays, 30)
+        objects_deposited = run_accounts(Debts(generate_debts_data()), objects, 30)
+
+        self.assertEqual(arrays_deposited, objects_deposited)
+        self.assertEqual(arrays.total_saved(), objects.total_saved())
+        self.assertEqual(arrays.monthly_deposit(), objects.monthly_deposit())
+        for view, account in zip(arrays.to_list(), objects.to_list()):
+            self.assertEqual(view.type, account.type)
+            self.assertEqual(view.balance, account.balance)
+            self.assertEqual(view.annual_report, account.annual_report)
+            self.assertEqual(view.overall_report, account.overall_report)
+
+    def test_reports__pence_backend(self):
+        try:
+            set_backend('pence')
+            arrays = SavingsArrays(generate_savings_data())
+            objects = SavingsAccounts(generate_savings_data())
+            run_accounts(DebtArrays(generate_debts_data()), arrays, 30)
+            run_accounts(Debts(generate_debts_data()), objects, 30)
+        finally:
+            set_backend('decimal')
+
+        for view, account in zip(arrays.to_list(), objects.to_list()):
+            for view_report, report in ((view.annual_report, account.annual_report),
+                                        (view.overall_report, account.overall_report)):
+                self.assertDictEqual(view_report, report)
+                self.assertTrue(all(isinstance(amount, Decimal) for amount in view_report.values()))
+
+    @patch('finsim.utils.VERIFY_TOTALS', True)
+    def test_balance_setter__recalculates_total(self):
+        savings = SavingsArrays(generate_savings_data())
+        savings.to_list()[0].balance = Decimal('250.00')
+
+        self.assertEqual(savings.total_saved(), Decimal('350.00'))
+
+
+class TestArraysSimulation(TestCase):
+
+    def tearDown(self):
+        set_backend('decimal')
+
+    def simulate(self, storage, engine, savings_goal):
+        test_data = generate_test_data()
+        test_data['savings_goal'] = savings_goal
+        simulation = Simulation(
+            SimData.from_dict(test_data),
+            RuleStrategy(debt_share='30', reserve='650'),
+            quiet=True,
+            engine=engine,
+            storage=storage)
+        months = simulation.simulate()
+        balances = [
+            account.balance
+            for person in simulation.model.people
+            for account in person.savings.to_list() + person.debts.to_list(active_only=False)
+        ]
+        return months, simulation.debt_free_month, balances
+
+    @patch('finsim.utils.VERIFY_TOTALS', True)
+    def test_arrays_identical_to_objects(self):
+        for backend in ('decimal', 'pence'):
+            set_backend(backend)
+            for engine in Simulation.ENGINES:
+                for savings_goal in ('10000', '500000'):
+                    self.assertEqual(
+                        self.simulate('objects', engine, savings_goal),
+                        self.simulate('arrays', engine, savings_goal))
@@ -2,7 +2,9 @@ from unittest import TestCase
 from unittest.mock import patch, Mock
 from decimal import Decimal
 
+from finsim import money
 from finsim.debts import Debts, Debt
+from finsim.ledger import Ledger
 
 def generate_test_data():
     return [
@@ -32,8 +34,8 @@ class TestAccounts(TestCase):
             'Loan from Friend': mock_account,
             'Credit Card': mock_account
         })
-        mock_account_init.assert_any_call(account_data=test_data[0])
-        mock_account_init.assert_any_call(account_data=test_data[1])
+        mock_account_init.assert_any_call(account_data=test_data[0], ledger=debt_group.ledger, person=None)
+        mock_account_init.assert_any_call(account_data=test_data[1], ledger=debt_group.ledger, person=None)
         self.assertEqual(mock_account_init.call_count, 2)
 
     def test_apply_strategy(self, mock_account_init):
@@ -99,15 +101,44 @@ class TestAccount(TestCase):
         self.assertIn('Interest', debt.overall_report)
 
     def test_begin_year(self):
-        mock_report = { 'Payments / Deposits': Decimal('500') }
         debt = Debt(generate_test_data()[0])
-        debt.annual_report = mock_report
-        debt.overall_report = mock_report
+        debt.payment_amount = Decimal('500')
+        debt.pay()
 
         debt.begin_year()
 
         self.assertEqual(debt.overall_report['Payments / Deposits'], Decimal('500'))
         self.assertEqual(debt.annual_report['Payments / Deposits'], Decimal('0'))
+        self.assertEqual(debt.annual_report['Starting Balance'], Decimal('500'))
+        self.assertEqual(debt.overall_report['Starting Balance'], Decimal('1000'))
+
+    def test_reports__no_detail(self):
+        debt = Debt(generate_test_data()[1], ledger=Ledger('none'))
+        debt.payment_amount = Decimal('500')
+        debt.pay()
+        debt.end_year()
+
+        self.assertIsNone(debt.annual_report)
+        self.assertIsNone(debt.overall_report)
+        self.assertEqual(debt.balance, Decimal('1100'))
+
+    def test_reports__pence_backend(self):
+        try:
+            money.set_backend('pence')
+            debt = Debt(generate_test_data()[1])
+            debt.payment_amount = Decimal('500')
+            debt.pay()
+            debt.end_year()
+        finally:
+            money.set_backend('decimal')
+
+        for report in (debt.annual_report, debt.overall_report):
+            self.assertDictEqual(report, {
+                'Starting Balance': Decimal('1500.00'),
+                'Payments / Deposits': Decimal('500.00'),
+                'Interest': Decimal('100.00')
+            })
+            self.assertTrue(all(isinstance(amount, Decimal) for amount in report.values()))
 
     def test_end_year__zero_interest(self):
         debt = Debt(generate_test_data()[0])
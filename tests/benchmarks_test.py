@@ -0,0 +1,53 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from finsim.benchmarks import (Comparison, benchmark_cases, calibrate_goal, compare, regressions,
+                               run_benchmarks, scripted_strategy, synthetic_data)
+from finsim.sim_data import SimData
+from finsim.simulation import Simulation
+
+class TestBenchmarks(TestCase):
+
+    def test_synthetic_data(self):
+        data = synthetic_data(11, savings_goal=1000)
+        sim_data = SimData.from_dict(data)
+        person = sim_data.data['people'][0]
+
+        self.assertEqual(len(person['savings']), 5)
+        self.assertEqual(len(person['debts']), 6)
+        self.assertEqual(len(person['expenses']['monthly']), 11)
+
+    def test_calibrate_goal(self):
+        for engine in Simulation.ENGINES:
+            data = synthetic_data(4)
+            data['savings_goal'] = str(calibrate_goal(data, 3))
+            simulation = Simulation(
+                SimData.from_dict(data), scripted_strategy(data), quiet=True, engine=engine)
+            simulation.simulate()
+            self.assertEqual(simulation.month, 36)
+
+    def test_benchmark_cases__budget(self):
+        names = [ name for name, _ in benchmark_cases((10, 1000), (1, 100), storages=('arrays',), budget=1000) ]
+
+        self.assertIn('simulate[accounts=1000,years=1,engine=stepwise,storage=arrays]', names)
+        self.assertNotIn('simulate[accounts=1000,years=100,engine=stepwise,storage=arrays]', names)
+        self.assertIn('simulate[accounts=1000,years=100,engine=event,storage=arrays]', names)
+
+    def test_run_benchmarks(self):
+        run, cleanup = MagicMock(), MagicMock()
+        progress = MagicMock()
+        results = run_benchmarks([ ('a', lambda: run), ('b', lambda: (run, cleanup)) ], repeat=2, progress=progress)
+
+        self.assertListEqual(sorted(results), ['a', 'b'])
+        self.assertTrue(all(seconds >= 0 for seconds in results.values()))
+        cleanup.assert_called_once_with()
+        self.assertEqual(progress.call_count, 2)
+
+    def test_compare(self):
+        comparisons = compare({ 'a': 1.0, 'b': 2.0, 'c': 1.0 }, { 'a': 1.05, 'b': 3.0, 'd': 1.0 })
+
+        self.assertListEqual(comparisons, [
+            Comparison('a', 1.0, 1.05, 1.05 - 1),
+            Comparison('b', 2.0, 3.0, 0.5)
+        ])
+        self.assertListEqual(regressions(comparisons, 0.1), [ comparisons[1] ])
@@ -0,0 +1,163 @@
+from unittest import TestCase
+from unittest.mock import patch
+from decimal import Decimal
+from json import loads as json_loads
+from os import listdir
+from os.path import join
+from tempfile import TemporaryDirectory
+
+from finsim import money
+from finsim.cache import CacheError, ResultCache, cache_key
+from finsim.economy import default_parameters
+from finsim.goal_seek import PinnedDeposit
+from finsim.sim_data import SimData
+from finsim.simulation import Simulation
+from finsim.strategies import AsyncFunctionStrategy, FixedStrategy, RuleStrategy
+from test_data import generate_test_data
+
+class TestCacheKey(TestCase):
+
+    def test_cache_key__normalised(self):
+        data = generate_test_data()
+        variant = generate_test_data()
+        variant['people'][0]['salary']['base_salary'] = variant['people'][0]['salary']['base_salary'] + '.00'
+        variant['SAVINGS_GOAL'] = variant.pop('savings_goal')
+
+        self.assertEqual(
+            cache_key(data, RuleStrategy(debt_share='60')),
+            cache_key(variant, RuleStrategy(debt_share='60.0')))
+
+    def test_cache_key__differs(self):
+        data = generate_test_data()
+        key = cache_key(data, RuleStrategy())
+        changed = generate_test_data()
+        changed['savings_goal'] = '20001'
+
+        self.assertNotEqual(key, cache_key(changed, RuleStrategy()))
+        self.assertNotEqual(key, cache_key(data, RuleStrategy(order='snowball')))
+        self.assertNotEqual(key, cache_key(data, FixedStrategy({})))
+        self.assertNotEqual(key, cache_key(data, RuleStrategy(), default_parameters().replace(it_rate='21')))
+        self.assertNotEqual(key, cache_key(data, RuleStrategy(), engine='stepwise'))
+        self.assertNotEqual(key, cache_key(data, RuleStrategy(), storage='arrays'))
+        self.assertNotEqual(key, cache_key(data, RuleStrategy(), max_months=120))
+
+    def test_cache_key__money_backend(self):
+        key = cache_key(generate_test_data(), RuleStrategy())
+        try:
+            money.set_backend('pence')
+            self.assertNotEqual(key, cache_key(generate_test_data(), RuleStrategy()))
+        finally:
+            money.set_backend('decimal')
+
+    def test_cache_key__nested_provider(self):
+        data = generate_test_data()
+        key = cache_key(data, PinnedDeposit(RuleStrategy(), 'Alice', 'Savings Acc.', '100'))
+
+        self.assertEqual(key, cache_key(data, PinnedDeposit(RuleStrategy(), 'Alice', 'Savings Acc.', '100.00')))
+        self.assertNotEqual(key, cache_key(data, PinnedDeposit(RuleStrategy(), 'Alice', 'Savings Acc.', '101')))
+
+    def test_cache_key__uncacheable(self):
+        async def func(person, initial):
+            pass
+
+        with self.assertRaises(CacheError):
+            cache_key(generate_test_data(), AsyncFunctionStrategy(func))
+        with self.assertRaises(CacheError):
+            cache_key(generate_test_data(), None)
+
+
+class TestResultCache(TestCase):
+
+    def test_get__memory(self):
+        cache = ResultCache(max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertDictEqual(cache.counters, {
+            'memory_hits': 3, 'disk_hits': 0, 'misses': 1, 'memory_evictions': 1, 'disk_evictions': 0
+        })
+
+    def test_get__disk(self):
+        with TemporaryDirectory() as path:
+            cache = ResultCache(max_entries=1, path=path)
+            cache.put('a', { 'months': 1 })
+            cache.put('b', { 'months': 2 })
+
+            self.assertEqual(cache.get('a'), { 'months': 1 })
+            self.assertEqual(cache.get('a'), { 'months': 1 })
+            self.assertEqual(ResultCache(path=path).get('b'), { 'months': 2 })
+            self.assertEqual(cache.counters['disk_hits'], 1)
+            self.assertEqual(cache.counters['memory_hits'], 1)
+            self.assertEqual(cache.counters['memory_evictions'], 2)
+
+    def test_get__disk_simulation_result(self):
+        with TemporaryDirectory() as path:
+            result = ResultCache(path=path).simulate(SimData.from_dict(generate_test_data()), RuleStrategy())
+            name = listdir(path)[0]
+            with open(join(path, name), 'rb') as f:
+                stored = json_loads(f.read().decode('utf-8'))
+            loaded = ResultCache(path=path).get(name[:-len('.result')])
+
+        self.assertEqual(stored['total_saved'], str(result['total_saved']))
+        self.assertDictEqual(loaded, result)
+        self.assertIsInstance(loaded['total_saved'], Decimal)
+        self.assertTrue(all(isinstance(balance, Decimal) for balance in loaded['balances'].values()))
+
+    def test_get__copy(self):
+        cache = ResultCache()
+        cache.put('a', { 'months': 1, 'balances': { 'Alice:ISA': Decimal('1.00') } })
+
+        cache.get('a')['balances']['Alice:ISA'] = Decimal('0')
+        cache.get('a')['months'] = 2
+
+        self.assertDictEqual(cache.get('a'), { 'months': 1, 'balances': { 'Alice:ISA': Decimal('1.00') } })
+
+    def test_put__disk_eviction(self):
+        with TemporaryDirectory() as path:
+            cache = ResultCache(max_entries=1, path=path, max_bytes=250)
+            for key in ('a', 'b', 'c'):
+                cache.put(key, 'x' * 100)
+
+            self.assertListEqual(sorted(listdir(path)), [ 'b.result', 'c.result' ])
+            self.assertEqual(cache.counters['disk_evictions'], 1)
+            self.assertIsNone(cache.get('a'))
+
+    def test_put__larger_than_disk(self):
+        with TemporaryDirectory() as path:
+            cache = ResultCache(path=path, max_bytes=10)
+            cache.put('a', 'x' * 100)
+
+            self.assertListEqual(listdir(path), [])
+            self.assertEqual(cache.get('a'), 'x' * 100)
+
+    def test_clear(self):
+        with TemporaryDirectory() as path:
+            cache = ResultCache(path=path)
+            cache.put('a', 1)
+            cache.clear()
+
+            self.assertIsNone(cache.get('a'))
+            self.assertListEqual(listdir(path), [])
+
+    def test_simulate(self):
+        cache = ResultCache()
+        sim_data = SimData.from_dict(generate_test_data())
+        expected = Simulation(sim_data, RuleStrategy(), quiet=True)
+
+        with patch('finsim.cache.Simulation', wraps=Simulation) as mock_simulation:
+            first = cache.simulate(sim_data, RuleStrategy())
+            second = cache.simulate(SimData.from_dict(generate_test_data()), RuleStrategy())
+
+        mock_simulation.assert_called_once()
+        self.assertIsNot(first, second)
+        self.assertDictEqual(first, second)
+        self.assertEqual(first['months'], expected.simulate())
+        self.assertEqual(first['total_saved'], expected.model.total_saved())
+        self.assertEqual(cache.counters['misses'], 1)
+        self.assertEqual(cache.counters['memory_hits'], 1)
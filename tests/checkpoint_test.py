@@ -0,0 +1,135 @@
+from unittest import TestCase
+from os.path import exists, join
+from tempfile import TemporaryDirectory
+
+from finsim.checkpoint import CheckpointError, Checkpointer, load, restore, save, snapshot
+from finsim.money import set_backend
+from finsim.profiler import Profiler
+from finsim.sim_data import SimData
+from finsim.simulation import Simulation
+from finsim.strategies import RuleStrategy
+from finsim.ui import UI
+from test_data import generate_test_data
+
+class TestCheckpoint(TestCase):
+
+    def setUp(self):
+        self.provider = RuleStrategy(debt_share='30', reserve='650')
+
+    def tearDown(self):
+        set_backend('decimal')
+
+    def create(self, engine='stepwise', storage='objects', **kwargs):
+        test_data = generate_test_data()
+        test_data['savings_goal'] = '60000'
+        return Simulation(
+            SimData.from_dict(test_data), self.provider, quiet=True, engine=engine, storage=storage,
+            report_detail='monthly', **kwargs)
+
+    def balances(self, simulation):
+        return [
+            account.balance
+            for person in simulation.model.people
+            for account in person.savings.to_list() + person.debts.to_list(active_only=False)
+        ]
+
+    def test_restore__matches_uninterrupted_run(self):
+        for backend in ('decimal', 'pence'):
+            set_backend(backend)
+            for engine in Simulation.ENGINES:
+                for storage in ('objects', 'arrays'):
+                    # Stop at the same month, as the event engine steps differently around it
+                    expected = self.create(engine, storage)
+                    expected.advance(until=30)
+                    expected.simulate()
+
+                    simulation = self.create(engine, storage)
+                    simulation.advance(until=30)
+                    resumed = restore(snapshot(simulation), self.provider)
+                    resumed.simulate()
+
+                    self.assertEqual(resumed.month, expected.month)
+                    self.assertEqual(resumed.debt_free_month, expected.debt_free_month)
+                    self.assertListEqual(self.balances(resumed), self.balances(expected))
+                    self.assertEqual(resumed.ledger.size, expected.ledger.size)
+
+    def test_restore__independent_branches(self):
+        simulation = self.create()
+        simulation.advance(until=12)
+        checkpoint = snapshot(simulation)
+        first, second = restore(checkpoint, self.provider), restore(checkpoint, self.provider)
+        first.advance(until=24)
+
+        self.assertEqual(second.month, 12)
+        self.assertNotEqual(self.balances(first), self.balances(second))
+        self.assertListEqual(self.balances(second), self.balances(simulation))
+
+    def test_restore__strategy_provider(self):
+        simulation = self.create()
+        resumed = restore(snapshot(simulation))
+        people = resumed.model.people
+
+        self.assertIsInstance(people[0].strategy_provider, UI)
+        self.assertIs(people[0].strategy_provider, people[1].strategy_provider)
+        self.assertIs(restore(snapshot(simulation), self.provider).model.people[0].strategy_provider, self.provider)
+
+    def test_restore__invalid(self):
+        with self.assertRaises(CheckpointError):
+            restore(b'not a checkpoint')
+
+    def test_snapshot__profiled(self):
+        with self.assertRaises(CheckpointError):
+            snapshot(self.create(profiler=Profiler()))
+
+    def test_save_and_load(self):
+        with TemporaryDirectory() as directory:
+            path = join(directory, 'state.bin')
+            simulation = self.create()
+            simulation.advance(until=18)
+            save(simulation, path)
+            resumed = load(path, self.provider)
+
+            self.assertFalse(exists(path + '.partial'))
+            self.assertEqual(resumed.month, 18)
+            self.assertListEqual(self.balances(resumed), self.balances(simulation))
+
+
+class TestCheckpointer(TestCase):
+
+    def simulate(self, checkpointer, engine='stepwise'):
+        test_data = generate_test_data()
+        test_data['savings_goal'] = '60000'
+        simulation = Simulation(
+            SimData.from_dict(test_data), RuleStrategy(debt_share='30', reserve='650'), quiet=True,
+            engine=engine, checkpointer=checkpointer)
+        simulation.simulate()
+        return simulation
+
+    def test_init__invalid(self):
+        with self.assertRaises(ValueError):
+            Checkpointer(every=0)
+
+    def test_record(self):
+        checkpointer = Checkpointer(every=10)
+        simulation = self.simulate(checkpointer)
+
+        self.assertListEqual(sorted(checkpointer.checkpoints), list(range(10, simulation.month + 1, 10)))
+        self.assertEqual(restore(checkpointer.latest()).month, max(checkpointer.checkpoints))
+
+    def test_record__event_engine(self):
+        checkpointer = Checkpointer(every=12)
+        simulation = self.simulate(checkpointer, engine='event')
+
+        self.assertListEqual(sorted(checkpointer.checkpoints), list(range(12, simulation.month + 1, 12)))
+
+    def test_record__keep_and_path(self):
+        with TemporaryDirectory() as directory:
+            path = join(directory, 'state.bin')
+            checkpointer = Checkpointer(every=6, path=path, keep=2)
+            self.simulate(checkpointer)
+
+            self.assertEqual(len(checkpointer.checkpoints), 2)
+            self.assertEqual(load(path).month, max(checkpointer.checkpoints))
+
+    def test_latest__empty(self):
+        self.assertIsNone(Checkpointer().latest())
@@ -0,0 +1,157 @@
+from unittest import TestCase
+from unittest.mock import patch, mock_open
+from decimal import Decimal
+from json import dumps as json_dumps
+
+from finsim.cohort import CohortStats, iter_lines, simulate_cohort, simulate_shard
+from finsim.sim_data import SimData
+from finsim.simulation import Simulation
+from finsim.strategies import FixedStrategy, RuleStrategy
+from test_data import generate_test_data
+
+def generate_household(savings_goal):
+    data = generate_test_data()
+    data['savings_goal'] = savings_goal
+    return data
+
+class TestCohortStats(TestCase):
+
+    def test_add(self):
+        stats = CohortStats()
+        stats.add(12, 5, Decimal('100.00'))
+        stats.add(None, None, Decimal('50.00'))
+        stats.add_error('Invalid')
+
+        self.assertEqual(stats.households, 3)
+        self.assertEqual(stats.reached, 1)
+        self.assertEqual(stats.not_reached, 1)
+        self.assertEqual(stats.errors, 1)
+        self.assertEqual(stats.debt_free, 1)
+        self.assertDictEqual(dict(stats.months), { 12: 1 })
+        self.assertEqual(stats.total_saved, Decimal('150.00'))
+        self.assertListEqual(stats.error_samples, [ 'Invalid' ])
+
+    def test_merge(self):
+        first, second = CohortStats(), CohortStats()
+        first.add(12, None, Decimal('1'))
+        second.add(12, 3, Decimal('2'))
+        second.add(24, 3, Decimal('3'))
+        for i in range(12):
+            second.add_error(str(i))
+
+        merged = first.merge(second)
+
+        self.assertIs(merged, first)
+        self.assertEqual(merged.households, 15)
+        self.assertDictEqual(dict(merged.months), { 12: 2, 24: 1 })
+        self.assertDictEqual(dict(merged.debt_free_months), { 3: 2 })
+        self.assertEqual(merged.total_saved, Decimal('6'))
+        self.assertEqual(len(merged.error_samples), 10)
+
+    def test_summary(self):
+        stats = CohortStats()
+        for months in range(1, 11):
+            stats.add(months, None, Decimal('10.00'))
+        stats.add(None, 4, Decimal('5.00'))
+
+        summary = stats.summary()
+
+        self.assertEqual(summary['reached_rate'], 10 / 11)
+        self.assertEqual(summary['debt_free_rate'], 1 / 11)
+        self.assertDictEqual(
+            summary['months_to_goal'], { 'min': 1, 'mean': 5.5, 'max': 10, 'p10': 2, 'p50': 6, 'p90': 10 })
+        self.assertEqual(summary['debt_free_month']['p50'], 4)
+        self.assertEqual(summary['mean_total_saved'], Decimal('9.54'))
+
+    def test_summary__empty(self):
+        summary = CohortStats().summary()
+
+        self.assertEqual(summary['households'], 0)
+        self.assertIsNone(summary['reached_rate'])
+        self.assertIsNone(summary['months_to_goal'])
+        self.assertIsNone(summary['mean_total_saved'])
+
+
+class TestSimulateCohort(TestCase):
+
+    def test_simulate_shard(self):
+        households = [
+            generate_household('5000'),
+            json_dumps(generate_household('20000')),
+            SimData.from_dict(generate_household('1000000000')).data,
+            '[ "not", "a", "household" ]',
+            generate_household('invalid')
+        ]
+
+        stats = simulate_shard(households, { 'debt_share': '60' }, max_months=120)
+
+        expected = Simulation(
+            SimData.from_dict(generate_household('5000')), RuleStrategy(debt_share='60'), quiet=True)
+        self.assertEqual(stats.households, 5)
+        self.assertEqual(stats.reached, 2)
+        self.assertEqual(stats.not_reached, 1)
+        self.assertEqual(stats.errors, 2)
+        self.assertIn(expected.simulate(), stats.months)
+
+    def test_simulate_shard__provider(self):
+        strategy = FixedStrategy({
+            'Alice': { 'savings': { 'Savings Acc.': '500' } },
+            'Bob': { 'savings': { 'Lifetime ISA': '500' } }
+        })
+
+        stats = simulate_shard([ generate_household('5000') ], strategy, max_months=120)
+
+        self.assertEqual(stats.reached, 1)
+        self.assertEqual(stats.debt_free, 0)
+
+    def test_simulate_shard__no_debts(self):
+        household = generate_household('5000')
+        for person in household['people']:
+            del person['debts']
+
+        for storage in ('objects', 'arrays'):
+            stats = simulate_shard([ household ], { 'debt_share': '60' }, max_months=120, storage=storage)
+
+            self.assertEqual(stats.errors, 0)
+            self.assertEqual(stats.reached, 1)
+
+    def test_simulate_shard__unexpected_error(self):
+        households = [ generate_household('5000'), generate_household('5000') ]
+        loaded = SimData.from_dict(generate_household('5000'))
+
+        with patch('finsim.cohort._load', side_effect=[ KeyError('debts'), loaded ]):
+            stats = simulate_shard(households, { 'debt_share': '60' }, max_months=120)
+
+        self.assertEqual(stats.households, 2)
+        self.assertEqual(stats.errors, 1)
+        self.assertEqual(stats.reached, 1)
+        self.assertIn('KeyError', stats.error_samples[0])
+
+    def test_simulate_cohort__process_pool_matches_serial(self):
+        households = [ generate_household(str(goal)) for goal in range(2000, 40000, 2000) ]
+        households.append(generate_household('invalid'))
+
+        serial = simulate_cohort(households, workers=1, shard_size=4)
+        parallel = simulate_cohort(iter(households), workers=2, shard_size=3)
+
+        self.assertDictEqual(serial.summary(), parallel.summary())
+        self.assertEqual(serial.households, 20)
+        self.assertEqual(serial.errors, 1)
+
+    def test_simulate_cohort__sim_data(self):
+        households = [ SimData.from_dict(generate_household('5000')) ]
+
+        stats = simulate_cohort(households, workers=1, storage='objects')
+
+        self.assertEqual(stats.reached, 1)
+
+    @patch('finsim.cohort.simulate_shard', return_value=CohortStats())
+    def test_simulate_cohort__shards(self, mock_simulate_shard):
+        simulate_cohort(( '{}' for _ in range(10) ), workers=1, shard_size=4)
+
+        shard_sizes = [ len(call[0][0]) for call in mock_simulate_shard.call_args_list ]
+        self.assertListEqual(shard_sizes, [ 4, 4, 2 ])
+
+    @patch('builtins.open', new_callable=mock_open, read_data='{ "a": 1 }\n\n  \n{ "b": 2 }\n')
+    def test_iter_lines(self, _):
+        self.assertListEqual(list(iter_lines('cohort.jsonl')), [ '{ "a": 1 }\n', '{ "b": 2 }\n' ])
@@ -42,6 +42,22 @@ class TestDebts(TestCase):
         mock_loan.was_updated.assert_called_once()
         self.assertListEqual(debt_group.recently_cleared, ['Credit Card'])
 
+    def test_months_until_cleared(self, mock_debt_init):
+        mock_loan = Mock()
+        mock_loan.months_until_cleared.return_value = None
+        mock_credit = Mock()
+        mock_credit.months_until_cleared.return_value = 7
+        mock_debt_init.side_effect = [mock_loan, mock_credit]
+        debt_group = Debts(generate_test_data())
+
+        self.assertEqual(debt_group.months_until_cleared(), 7)
+
+    def test_months_until_cleared__none(self, mock_debt_init):
+        mock_debt_init.return_value.months_until_cleared.return_value = None
+        debt_group = Debts(generate_test_data())
+
+        self.assertIsNone(debt_group.months_until_cleared())
+
     def test_reset_recently_cleared(self, *_):
         debt_group = Debts(generate_test_data())
         debt_group.recently_cleared = ['Credit Card']
@@ -131,6 +147,29 @@ class TestDebt(TestCase):
         self.assertEqual(debt.annual_report['Payments / Deposits'], Decimal('100'))
         self.assertEqual(debt.overall_report['Payments / Deposits'], Decimal('100'))
 
+    def test_pay__multiple_months(self):
+        debt = Debt(generate_test_data()[0])
+        debt.payment_amount = Decimal('300')
+        debt.pay(months=4)
+
+        self.assertEqual(debt.balance, Decimal('-200'))
+        self.assertFalse(debt.active)
+        self.assertTrue(debt.updated)
+        self.assertEqual(debt.annual_report['Payments / Deposits'], Decimal('1200'))
+
+    def test_months_until_cleared(self):
+        debt = Debt(generate_test_data()[0])
+        debt.payment_amount = Decimal('300')
+        self.assertEqual(debt.months_until_cleared(), 4)
+
+        debt.payment_amount = Decimal('250')
+        self.assertEqual(debt.months_until_cleared(), 4)
+
+    def test_months_until_cleared__no_payment(self):
+        debt = Debt(generate_test_data()[0])
+        debt.payment_amount = Decimal('0')
+        self.assertIsNone(debt.months_until_cleared())
+
     def test_pay__inactive(self):
         debt = Debt(generate_test_data()[0])
         debt.payment_amount = Decimal('100')
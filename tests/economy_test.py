@@ -0,0 +1,78 @@
+from unittest import TestCase
+from unittest.mock import patch
+from decimal import Decimal
+
+from finsim.economy import EconomicParameters, default_parameters
+from finsim.sim_data import SimData
+from finsim.simulation import Simulation
+from finsim.strategies import RuleStrategy
+from test_data import generate_test_data
+
+ENVIRON = {
+    'INFLATION_RATE': '2',
+    'NI_THRESHOLD': '9500',
+    'NI_RATE': '12',
+    'IT_THRESHOLD': '12500',
+    'IT_RATE': '20',
+    'SL_THRESHOLD': '26575',
+    'SL_RATE': '9'
+}
+
+class TestEconomicParameters(TestCase):
+
+    def generate_parameters(self):
+        return EconomicParameters('2', '9500', '12', '12500', '20', '26575', '9')
+
+    def test_init(self):
+        economy = self.generate_parameters()
+
+        self.assertIsInstance(economy.inflation_rate, Decimal)
+        self.assertEqual(economy.inflation_rate, Decimal('2'))
+        self.assertEqual(economy.tax_bands, (
+            (Decimal('9500'), Decimal('12')),
+            (Decimal('12500'), Decimal('20')),
+            (Decimal('26575'), Decimal('9'))
+        ))
+
+    def test_immutable(self):
+        economy = self.generate_parameters()
+        with self.assertRaises(AttributeError):
+            economy.inflation_rate = Decimal('5')
+
+    def test_replace(self):
+        economy = self.generate_parameters()
+        result = economy.replace(it_rate='25')
+
+        self.assertEqual(result.it_rate, Decimal('25'))
+        self.assertEqual(economy.it_rate, Decimal('20'))
+
+    @patch('finsim.economy.load_dotenv')
+    @patch.dict('finsim.economy.environ', ENVIRON)
+    def test_from_environ(self, mock_load):
+        economy = EconomicParameters.from_environ()
+
+        mock_load.assert_called_once_with('.env')
+        self.assertEqual(economy, self.generate_parameters())
+
+    def test_default_parameters(self):
+        self.assertIs(default_parameters(), default_parameters())
+
+
+class TestSimulationEconomy(TestCase):
+
+    def simulate(self, economy):
+        test_data = generate_test_data()
+        test_data['savings_goal'] = '50000'
+        simulation = Simulation(
+            SimData.from_dict(test_data),
+            RuleStrategy(debt_share='30', reserve='650'),
+            quiet=True,
+            economy=economy)
+        return simulation.simulate()
+
+    def test_side_by_side(self):
+        economy = default_parameters()
+        low_tax = economy.replace(it_rate='10')
+
+        self.assertLess(self.simulate(low_tax), self.simulate(economy))
+        self.assertEqual(self.simulate(economy), self.simulate(None))
@@ -2,6 +2,7 @@ from unittest import TestCase
 from unittest.mock import patch, Mock
 from decimal import Decimal
 
+from finsim.economy import default_parameters
 from finsim.expenses import Expenses, Expense
 from finsim.utils import get_percentage_of
 
@@ -38,6 +39,15 @@ class TestExpenses(TestCase):
         # Expecting calls for 1) Initialisation and 2) Post-inflation
         self.assertEqual(mock_recalculate.call_count, 2)
 
+    def test_fork(self):
+        expenses = Expenses(generate_test_data())
+        forked = expenses.fork()
+        forked.inflate()
+
+        self.assertGreater(forked.monthly_total, expenses.monthly_total)
+        self.assertEqual(expenses.monthly_expenses[0].cost, Decimal('500.00'))
+        self.assertIs(forked.monthly_expenses[0].name, expenses.monthly_expenses[0].name)
+
 class TestExpense(TestCase):
 
     def test_init(self):
@@ -49,10 +59,9 @@ class TestExpense(TestCase):
         self.assertEqual(expense.cost, Decimal('80'))
         self.assertTrue(expense.inflation)
 
-    @patch('finsim.expenses.INFLATION_RATE', Decimal('1'))
     def test_inflate(self):
         test_data = generate_test_data()['annual'][0]
-        expense = Expense(test_data)
+        expense = Expense(test_data, default_parameters().replace(inflation_rate='1'))
         expense.inflate()
 
         expected_new_cost = Decimal('80.80')
@@ -0,0 +1,97 @@
+from unittest import TestCase
+from unittest.mock import patch
+from csv import DictReader
+from decimal import Decimal
+from json import load as json_load
+from os.path import join
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from finsim.exporter import CSVExporter, ColumnarExporter, exporter_for
+from finsim.sim_data import SimData
+from finsim.simulation import Simulation
+from finsim.strategies import RuleStrategy
+from test_data import generate_test_data
+
+class TestExporters(TestCase):
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def simulate(self, exporter, engine='stepwise'):
+        test_data = generate_test_data()
+        test_data['savings_goal'] = '30000'
+        simulation = Simulation(
+            SimData.from_dict(test_data),
+            RuleStrategy(debt_share='30', reserve='650'),
+            quiet=True,
+            engine=engine,
+            exporter=exporter)
+        simulation.simulate()
+        return simulation
+
+    def test_exporter_for(self):
+        self.assertIsInstance(exporter_for('out.csv'), CSVExporter)
+        self.assertIsInstance(exporter_for('out'), ColumnarExporter)
+
+    def test_csv(self):
+        path = join(self.directory.name, 'trajectory.csv')
+        simulation = self.simulate(CSVExporter(path, chunk_size=7))
+
+        with open(path, newline='') as f:
+            rows = list(DictReader(f))
+        self.assertEqual(len(rows), 6 * (simulation.month + 1))
+        self.assertDictEqual(rows[1], {
+            'month': '0', 'person': 'Alice', 'account': 'Lifetime ISA', 'balance': '100.00'
+        })
+        final = rows[-6:]
+        self.assertEqual(final[0]['month'], str(simulation.month))
+        self.assertEqual(
+            Decimal(final[0]['balance']),
+            simulation.model.people[0].savings.to_list()[0].balance)
+
+    def test_columnar(self):
+        directory = join(self.directory.name, 'trajectory')
+        simulation = self.simulate(ColumnarExporter(directory, chunk_size=5))
+
+        with open(join(directory, 'header.json')) as f:
+            header = json_load(f)
+        columns = { name: np.load(join(directory, '{}.npy'.format(name))) for name in header['columns'] }
+
+        rows = 6 * (simulation.month + 1)
+        self.assertEqual(header['rows'], rows)
+        self.assertListEqual(header['people'], ['Alice', 'Bob'])
+        self.assertDictEqual(header['accounts'][4], { 'person': 'Bob', 'name': 'Lifetime ISA' })
+        self.assertEqual(columns['balance'].dtype, np.int64)
+        self.assertEqual(columns['month'].shape, (rows,))
+        self.assertListEqual(list(columns['month'][:7]), [0] * 6 + [1])
+        self.assertListEqual(list(columns['person'][:6]), [0, 0, 0, 0, 1, 1])
+        self.assertEqual(columns['balance'][1], 10000)
+
+    def test_columnar__event_engine(self):
+        directory = join(self.directory.name, 'trajectory')
+        simulation = self.simulate(ColumnarExporter(directory), engine='event')
+        months = np.load(join(directory, 'month.npy'))
+
+        self.assertEqual(len(months), 6 * (simulation.steps + 1))
+        self.assertEqual(months[-1], simulation.month)
+
+    def test_csv__closed_on_failure(self):
+        exporter = CSVExporter(join(self.directory.name, 'trajectory.csv'), chunk_size=7)
+        with patch('finsim.simulation.Simulation._step_forward', side_effect=RuntimeError('failed')):
+            with self.assertRaises(RuntimeError):
+                self.simulate(exporter)
+
+        self.assertTrue(exporter._file.closed)
+
+    def test_columnar__closed_on_failed_write(self):
+        exporter = ColumnarExporter(join(self.directory.name, 'trajectory'), chunk_size=5)
+        with patch.object(ColumnarExporter, '_flush', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                self.simulate(exporter)
+
+        self.assertTrue(all(f.closed for f in exporter._files.values()))
@@ -0,0 +1,107 @@
+from unittest import TestCase
+
+from finsim.economy import default_parameters
+from finsim.feasibility import earliest_month
+from finsim.sim_data import SimData
+from finsim.simulation import Simulation
+from finsim.strategies import FixedStrategy, RuleStrategy, ShareStrategy
+from test_data import generate_test_data
+
+def generate_simulation(savings_goal, stagnant=False, group_mode=True, provider=None, economy=None,
+                        max_months=None, rent=None):
+    data = generate_test_data()
+    data['savings_goal'] = savings_goal
+    if rent is not None:
+        for person in data['people']:
+            person['expenses']['monthly'][0]['cost'] = rent
+    if not group_mode:
+        del data['people'][1]
+        del data['group']
+    if stagnant:
+        for person in data['people']:
+            person['salary']['payrise_rate'] = '0'
+            for account in person['savings']:
+                account['interest_rate'] = '0'
+    economy = economy or default_parameters()
+    if stagnant:
+        economy = economy.replace(inflation_rate='0')
+    return Simulation(
+        SimData.from_dict(data), provider or RuleStrategy(debt_share='60'), quiet=True, engine='event',
+        economy=economy, report_detail='none', max_months=max_months)
+
+class TestEarliestMonth(TestCase):
+
+    def test_earliest_month__bounds_simulation(self):
+        for group_mode in (True, False):
+            for goal in ('2000', '10000', '50000', '250000'):
+                simulation = generate_simulation(goal, group_mode=group_mode)
+                bound = earliest_month(simulation)
+                months = simulation.simulate()
+
+                self.assertLessEqual(bound, months)
+
+    def test_earliest_month__part_way_through(self):
+        simulation = generate_simulation('50000')
+        simulation.advance(until=17)
+
+        bound = earliest_month(simulation)
+
+        self.assertGreater(bound, 17)
+        self.assertLessEqual(bound, simulation.fork().simulate())
+
+    def test_earliest_month__unreachable_within_limit(self):
+        simulation = generate_simulation('1000000')
+
+        self.assertIsNone(earliest_month(simulation, limit=120))
+        self.assertIsNotNone(earliest_month(simulation))
+
+    def test_earliest_month__never_reachable(self):
+        simulation = generate_simulation('1000000', stagnant=True, rent='3000.00')
+
+        self.assertIsNone(earliest_month(simulation))
+
+    def test_earliest_month__stagnant_but_reachable(self):
+        simulation = generate_simulation('20000', stagnant=True)
+        bound = earliest_month(simulation)
+
+        self.assertLessEqual(bound, simulation.simulate())
+
+    def test_earliest_month__goal_met(self):
+        simulation = generate_simulation('100')
+
+        self.assertEqual(earliest_month(simulation), 1)
+
+    def test_earliest_month__unbounded_strategy(self):
+        provider = FixedStrategy({ 'Alice': { 'savings': { 'Savings Acc.': '100000' } } })
+        simulation = generate_simulation('1000000', provider=provider)
+
+        self.assertEqual(earliest_month(simulation, limit=12), 1)
+
+    def test_earliest_month__share_strategy(self):
+        within = ShareStrategy({ 'Alice': { 'Savings Acc.': '0.5', 'Lifetime ISA': '0.5' } })
+        beyond = ShareStrategy({ 'Alice': { 'Savings Acc.': '0.7', 'Lifetime ISA': '0.5' } })
+
+        self.assertIsNone(earliest_month(generate_simulation('1000000', provider=within), limit=12))
+        self.assertEqual(earliest_month(generate_simulation('1000000', provider=beyond), limit=12), 1)
+
+    def test_earliest_month__negative_tax_rate(self):
+        economy = default_parameters().replace(it_rate='-20')
+        simulation = generate_simulation('1000000', economy=economy)
+
+        self.assertEqual(earliest_month(simulation, limit=12), 1)
+
+    def test_simulate__unreachable_goal(self):
+        simulation = generate_simulation('1000000', stagnant=True, rent='3000.00')
+
+        self.assertIsNone(simulation.simulate())
+        self.assertEqual(simulation.month, 0)
+
+    def test_simulate__horizon(self):
+        provider = FixedStrategy({
+            'Alice': { 'savings': { 'Savings Acc.': '10' } },
+            'Bob': { 'savings': { 'Lifetime ISA': '10' } }
+        })
+        simulation = generate_simulation('60000', provider=provider, max_months=36)
+
+        self.assertIsNone(simulation.simulate())
+        self.assertEqual(simulation.month, 36)
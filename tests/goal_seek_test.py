@@ -0,0 +1,119 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+from decimal import Decimal
+
+from finsim.goal_seek import GoalSeekError, PinnedDeposit, maximum_goal, minimum_deposit, savings_trajectory
+from finsim.sim_data import SimData
+from finsim.simulation import Simulation
+from finsim.strategies import RuleStrategy
+from test_data import generate_test_data
+
+class TestPinnedDeposit(TestCase):
+
+    def test_obtain_initial_strategy(self):
+        provider = Mock()
+        provider.obtain_initial_strategy.return_value = {
+            'savings': [
+                { 'name': 'ISA', 'payment': Decimal('100') },
+                { 'name': 'Savings', 'payment': Decimal('50') }
+            ],
+            'remaining': Decimal('20')
+        }
+        person = Mock()
+        person.name = 'Alice'
+        strategy = PinnedDeposit(provider, 'Alice', 'ISA', '70').obtain_initial_strategy(person)
+
+        self.assertEqual(strategy['savings'][0]['payment'], Decimal('70'))
+        self.assertEqual(strategy['savings'][1]['payment'], Decimal('50'))
+        self.assertEqual(strategy['remaining'], Decimal('50'))
+
+    def test_obtain_initial_strategy__unaffordable(self):
+        provider = Mock()
+        provider.obtain_initial_strategy.return_value = {
+            'savings': [ { 'name': 'ISA', 'payment': Decimal('100') } ],
+            'remaining': Decimal('20')
+        }
+        person = Mock()
+        person.name = 'Alice'
+        pinned = PinnedDeposit(provider, 'Alice', 'ISA', '120')
+        pinned.obtain_initial_strategy(person)
+        self.assertTrue(pinned.affordable)
+
+        pinned = PinnedDeposit(provider, 'Alice', 'ISA', '120.01')
+        pinned.obtain_initial_strategy(person)
+        self.assertFalse(pinned.affordable)
+
+    def test_obtain_new_strategy__other_person(self):
+        provider = Mock()
+        person = Mock()
+        person.name = 'Bob'
+        strategy = PinnedDeposit(provider, 'Alice', 'ISA', '70').obtain_new_strategy(person)
+
+        self.assertEqual(strategy, provider.obtain_new_strategy.return_value)
+
+
+class TestGoalSeek(TestCase):
+
+    def setUp(self):
+        test_data = generate_test_data()
+        test_data['savings_goal'] = '30000'
+        self.data = SimData.from_dict(test_data)
+        self.provider = RuleStrategy(debt_share='30', reserve='650')
+
+    def reaches_goal(self, deposit, months):
+        simulation = Simulation(
+            self.data, PinnedDeposit(self.provider, 'Alice', 'Lifetime ISA', deposit), quiet=True,
+            report_detail='none')
+        return simulation.advance(until=months)
+
+    def test_savings_trajectory(self):
+        simulation = Simulation(self.data, self.provider, quiet=True, report_detail='none')
+        months = simulation.simulate()
+        totals = savings_trajectory(self.data, months, self.provider)
+
+        self.assertEqual(len(totals), months + 1)
+        self.assertEqual(totals, sorted(totals))
+        self.assertLess(totals[months - 1], self.data.savings_goal)
+        self.assertGreaterEqual(totals[months], self.data.savings_goal)
+
+    def test_maximum_goal(self):
+        goal = maximum_goal(self.data, 20, self.provider)
+        test_data = generate_test_data()
+
+        for savings_goal, expected in ((goal, 20), (goal + Decimal('0.01'), 21)):
+            test_data['savings_goal'] = str(savings_goal)
+            simulation = Simulation(SimData.from_dict(test_data), self.provider, quiet=True)
+            self.assertEqual(simulation.simulate(), expected)
+
+    def test_maximum_goal__year_end(self):
+        test_data = generate_test_data()
+        for months in (12, 24):
+            test_data['savings_goal'] = str(maximum_goal(self.data, months, self.provider))
+            simulation = Simulation(SimData.from_dict(test_data), self.provider, quiet=True)
+            self.assertLessEqual(simulation.simulate(), months)
+
+    def test_minimum_deposit(self):
+        with patch.object(Simulation, 'advance', autospec=True, side_effect=Simulation.advance) as mock_advance:
+            deposit = minimum_deposit(self.data, 'Alice', 'Lifetime ISA', 36, self.provider)
+
+        self.assertTrue(self.reaches_goal(deposit, 36))
+        self.assertFalse(self.reaches_goal(deposit - Decimal('0.01'), 36))
+        self.assertLess(mock_advance.call_count, 40)
+
+    def test_minimum_deposit__already_reached(self):
+        deposit = minimum_deposit(self.data, 'Alice', 'Lifetime ISA', 24, self.provider, goal='100')
+        self.assertEqual(deposit, Decimal('0'))
+
+    def test_minimum_deposit__unaffordable(self):
+        with self.assertRaises(GoalSeekError):
+            minimum_deposit(self.data, 'Alice', 'Lifetime ISA', 24, self.provider)
+
+    def test_minimum_deposit__unknown_account(self):
+        with self.assertRaises(GoalSeekError):
+            minimum_deposit(self.data, 'Alice', 'Pension', 24)
+        with self.assertRaises(GoalSeekError):
+            minimum_deposit(self.data, 'Carol', 'Lifetime ISA', 24)
+
+    def test_minimum_deposit__no_months(self):
+        with self.assertRaises(GoalSeekError):
+            minimum_deposit(self.data, 'Alice', 'Lifetime ISA', 0)
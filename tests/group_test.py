@@ -1,8 +1,12 @@
 from unittest import TestCase
 from unittest.mock import patch, Mock
+from asyncio import sleep
 from decimal import Decimal
+from threading import Event
 
 from finsim.group import Group
+from finsim.strategies import AsyncFunctionStrategy, StrategyError
+from finsim.utils import TotalMismatchError
 from test_data import generate_test_data
 
 def generate_data_mock():
@@ -12,11 +16,24 @@ def generate_data_mock():
     mock_data.get_shared_expenses.return_value = data['group']['expenses']
     return mock_data
 
-def generate_person_mock(gross_salary='0', updated=False, total_saved='0'):
+def generate_person_mock(gross_salary='0', updated=False, total_saved='0', deposit='0', interest='0'):
     mock_person = Mock()
     mock_person.payroll.gross = Decimal(gross_salary)
     mock_person.updated = updated
     mock_person.total_saved.return_value = Decimal(total_saved)
+    mock_person.simulate_month.return_value = Decimal(deposit)
+    mock_person.end_year.return_value = Decimal(interest)
+    return mock_person
+
+def generate_async_person_mock(name, provider, events, gross_salary='0', updated=False):
+    mock_person = generate_person_mock(gross_salary=gross_salary, updated=updated)
+    mock_person.strategy_provider = provider
+
+    async def strategise_async():
+        events.append('start {}'.format(name))
+        await sleep(0)
+        events.append('end {}'.format(name))
+    mock_person.strategise_async = strategise_async
     return mock_person
 
 
@@ -25,6 +42,7 @@ def generate_person_mock(gross_salary='0', updated=False, total_saved='0'):
 class TestGroup(TestCase):
 
     def test_init(self, mock_person_init, mock_expenses_init):
+        mock_person_init.return_value = generate_person_mock()
         mock_data = generate_data_mock()
         mock_data.proportional_expenses = True
         group = Group(mock_data)
@@ -96,6 +114,33 @@ class TestGroup(TestCase):
         mock_person_2.total_saved.assert_called_once()
         self.assertEqual(result, Decimal('2500'))
 
+    def test_total_saved__running(self, mock_person_init, _):
+        mock_data = generate_data_mock()
+        mock_person_1 = generate_person_mock(total_saved='1500', deposit='100', interest='20')
+        mock_person_2 = generate_person_mock(total_saved='1000', deposit='50', interest='10')
+        mock_person_init.side_effect = [ mock_person_1, mock_person_2 ]
+        group = Group(mock_data)
+
+        group.simulate_month(months=2)
+        group.end_year()
+        result = group.total_saved()
+
+        mock_person_1.simulate_month.assert_called_once_with(2)
+        self.assertEqual(mock_person_1.total_saved.call_count, 1)
+        self.assertEqual(result, Decimal('2680'))
+
+    @patch('finsim.utils.VERIFY_TOTALS', True)
+    def test_total_saved__verify(self, mock_person_init, _):
+        mock_data = generate_data_mock()
+        mock_person_1 = generate_person_mock(total_saved='1500', deposit='100')
+        mock_person_2 = generate_person_mock(total_saved='1000')
+        mock_person_init.side_effect = [ mock_person_1, mock_person_2 ]
+        group = Group(mock_data)
+        group.simulate_month()
+
+        with self.assertRaises(TotalMismatchError):
+            group.total_saved()
+
     def test_end_year(self, mock_person_init, mock_expenses_init):
         mock_data = generate_data_mock()
         mock_person_1 = generate_person_mock(total_saved='1500')
@@ -123,3 +168,74 @@ class TestGroup(TestCase):
         mock_person_1.strategise.assert_not_called()
         mock_person_2.strategise.assert_called_once()
         self.assertFalse(group.updated)
+
+    def test_begin_year__async_providers(self, mock_person_init, mock_expenses_init):
+        mock_data = generate_data_mock()
+        mock_data.proportional_expenses = False
+        provider = AsyncFunctionStrategy(Mock())
+        self.addCleanup(provider.close)
+        events = []
+        mock_person_1 = generate_async_person_mock('Alice', provider, events)
+        mock_person_2 = generate_async_person_mock('Bob', provider, events)
+        mock_person_init.side_effect = [ mock_person_1, mock_person_2 ]
+        mock_expenses = Mock()
+        mock_expenses.monthly_total = Decimal('1500')
+        mock_expenses_init.return_value = mock_expenses
+        group = Group(mock_data)
+
+        group.begin_year()
+
+        mock_person_1.begin_year.assert_called_with(joint_contrib=Decimal('750'), strategise=False)
+        mock_person_2.begin_year.assert_called_with(joint_contrib=Decimal('750'), strategise=False)
+        self.assertListEqual(events, [ 'start Alice', 'start Bob', 'end Alice', 'end Bob' ])
+
+    def test_strategise__async_providers(self, mock_person_init, _):
+        mock_data = generate_data_mock()
+        provider = AsyncFunctionStrategy(Mock())
+        self.addCleanup(provider.close)
+        events = []
+        mock_person_1 = generate_async_person_mock('Alice', provider, events, updated=True)
+        mock_person_2 = generate_async_person_mock('Bob', provider, events, updated=False)
+        mock_person_init.side_effect = [ mock_person_1, mock_person_2 ]
+        group = Group(mock_data)
+
+        group.strategise()
+
+        self.assertListEqual(events, [ 'start Alice', 'end Alice' ])
+        self.assertFalse(group.updated)
+
+    def test_strategise__sync_provider_outside_loop(self, mock_person_init, _):
+        mock_data = generate_data_mock()
+        provider = AsyncFunctionStrategy(Mock())
+        self.addCleanup(provider.close)
+        started = Event()
+        events = []
+        mock_person_1 = generate_async_person_mock('Alice', provider, events, updated=True)
+        original = mock_person_1.strategise_async
+        async def strategise_async():
+            started.set()
+            await original()
+        mock_person_1.strategise_async = strategise_async
+        mock_person_2 = generate_person_mock(updated=True)
+        mock_person_2.strategise.side_effect = lambda: events.append('sync Bob' if started.wait(5) else 'blocked')
+        mock_person_init.side_effect = [ mock_person_1, mock_person_2 ]
+        group = Group(mock_data)
+
+        group.strategise()
+
+        self.assertIn('sync Bob', events)
+        self.assertIn('end Alice', events)
+        mock_person_2.strategise_async.assert_not_called()
+
+    def test_strategise__different_loops(self, mock_person_init, _):
+        mock_data = generate_data_mock()
+        providers = [ AsyncFunctionStrategy(Mock()), AsyncFunctionStrategy(Mock()) ]
+        for provider in providers:
+            self.addCleanup(provider.close)
+        mock_person_1 = generate_async_person_mock('Alice', providers[0], [], updated=True)
+        mock_person_2 = generate_async_person_mock('Bob', providers[1], [], updated=True)
+        mock_person_init.side_effect = [ mock_person_1, mock_person_2 ]
+        group = Group(mock_data)
+
+        with self.assertRaises(StrategyError):
+            group.strategise()
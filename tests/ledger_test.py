@@ -0,0 +1,161 @@
+from unittest import TestCase
+from decimal import Decimal
+
+import numpy as np
+
+from finsim.ledger import Ledger, PAYMENT, INTEREST, BONUS
+from finsim.money import set_backend
+from finsim.sim_data import SimData
+from finsim.simulation import Simulation
+from finsim.strategies import RuleStrategy
+from test_data import generate_test_data
+
+class TestLedger(TestCase):
+
+    def test_init__invalid_detail(self):
+        with self.assertRaises(ValueError):
+            Ledger('daily')
+
+    def test_register(self):
+        ledger = Ledger()
+        self.assertEqual(ledger.register('Alice', 'ISA'), 0)
+        self.assertEqual(ledger.register('Bob', 'ISA'), 1)
+        self.assertEqual(ledger.register('Alice', 'Loan'), 2)
+        self.assertListEqual(ledger.people, ['Alice', 'Bob'])
+        self.assertListEqual(ledger.accounts, ['ISA', 'ISA', 'Loan'])
+
+    def test_record__monthly(self):
+        ledger = Ledger('monthly', capacity=2)
+        account = ledger.register('Alice', 'ISA')
+        for month in range(1, 6):
+            ledger.month = month
+            ledger.record(account, PAYMENT, Decimal('10.50'))
+        ledger.record(account, INTEREST, Decimal('0'))
+
+        columns = ledger.columns()
+        self.assertListEqual(list(columns['month']), [1, 2, 3, 4, 5])
+        self.assertListEqual(list(columns['amount']), [1050] * 5)
+        self.assertEqual(columns['amount'].dtype, np.int64)
+        self.assertEqual(ledger.overall(account, (PAYMENT, INTEREST)), {
+            'Payments / Deposits': Decimal('52.50'),
+            'Interest': Decimal('0')
+        })
+
+    def test_record__annual(self):
+        ledger = Ledger('annual')
+        account = ledger.register('Alice', 'ISA')
+        for month in range(1, 15):
+            ledger.month = month
+            if month == 13:
+                ledger.begin_year(account)
+            ledger.record(account, PAYMENT, Decimal('10'))
+
+        self.assertEqual(ledger.annual(account, (PAYMENT,)), { 'Payments / Deposits': Decimal('20') })
+        self.assertEqual(ledger.overall(account, (PAYMENT,)), { 'Payments / Deposits': Decimal('140') })
+        self.assertListEqual(list(ledger.columns()['month']), [12])
+        self.assertListEqual(list(ledger.columns()['amount']), [12000])
+
+        ledger.flush()
+        self.assertListEqual(list(ledger.columns()['month']), [12, 14])
+        self.assertListEqual(list(ledger.columns()['amount']), [12000, 2000])
+
+    def test_record__none(self):
+        ledger = Ledger('none')
+        account = ledger.register('Alice', 'ISA')
+        ledger.record(account, PAYMENT, Decimal('10'))
+        ledger.begin_year(account)
+        ledger.flush()
+
+        self.assertEqual(ledger.size, 0)
+        self.assertEqual(ledger.overall(account, (PAYMENT,)), { 'Payments / Deposits': Decimal('0') })
+
+    def test_fork(self):
+        ledger = Ledger('monthly', capacity=1)
+        account = ledger.register('Alice', 'ISA')
+        ledger.record(account, PAYMENT, Decimal('10'))
+        forked = ledger.fork()
+        forked.record(account, PAYMENT, Decimal('5'))
+        forked.record(account, PAYMENT, Decimal('5'))
+        ledger.record(account, INTEREST, Decimal('1'))
+
+        self.assertListEqual(list(ledger.columns()['amount']), [1000, 100])
+        self.assertListEqual(list(forked.columns()['amount']), [1000, 500, 500])
+        self.assertEqual(ledger.overall(account, (PAYMENT,)), { 'Payments / Deposits': Decimal('10') })
+        self.assertEqual(forked.overall(account, (PAYMENT,)), { 'Payments / Deposits': Decimal('20') })
+        self.assertIs(forked.accounts, ledger.accounts)
+
+    def test_record_many(self):
+        ledger = Ledger('monthly')
+        ids = np.array([ ledger.register(person, 'ISA') for person in ('Alice', 'Bob', 'Carol') ])
+        ledger.month = 3
+        ledger.record_many(ids, BONUS, np.array([ 100, 0, 250 ]))
+
+        columns = ledger.columns()
+        self.assertListEqual(list(columns['person']), [0, 2])
+        self.assertListEqual(list(columns['kind']), [BONUS, BONUS])
+        self.assertListEqual(list(columns['amount']), [100, 250])
+        self.assertListEqual(list(columns['month']), [3, 3])
+
+
+class TestSimulationLedger(TestCase):
+
+    def tearDown(self):
+        set_backend('decimal')
+
+    def simulate(self, detail, storage='objects', engine='stepwise'):
+        test_data = generate_test_data()
+        test_data['savings_goal'] = '40000'
+        simulation = Simulation(
+            SimData.from_dict(test_data),
+            RuleStrategy(debt_share='30', reserve='650'),
+            quiet=True,
+            engine=engine,
+            storage=storage,
+            report_detail=detail)
+        simulation.simulate()
+        return simulation
+
+    def totals(self, ledger):
+        columns = ledger.columns()
+        totals = {}
+        for account, kind, amount in zip(columns['account'], columns['kind'], columns['amount']):
+            key = (ledger.accounts[account], int(kind))
+            totals[key] = totals.get(key, 0) + int(amount)
+        return totals
+
+    def test_rows_match_reports(self):
+        for detail in ('annual', 'monthly'):
+            simulation = self.simulate(detail)
+            people = simulation.model.people
+            expected = {}
+            for person in people:
+                for account in person.savings.to_list() + person.debts.to_list(active_only=False):
+                    report = account.overall_report
+                    for kind, name in enumerate(('Payments / Deposits', 'Interest', 'Government Bonus')):
+                        amount = report.get(name, 0)
+                        if amount != 0:
+                            key = (account.name, kind)
+                            expected[key] = expected.get(key, 0) + int(amount * 100)
+            self.assertDictEqual(self.totals(simulation.ledger), expected)
+
+    def test_rows__monthly(self):
+        simulation = self.simulate('monthly')
+        months = simulation.ledger.columns()['month']
+        self.assertEqual(months.min(), 1)
+        self.assertEqual(months.max(), simulation.month)
+
+    def test_arrays_match_objects(self):
+        for detail in ('annual', 'monthly'):
+            for engine in Simulation.ENGINES:
+                objects = self.simulate(detail, 'objects', engine).ledger
+                arrays = self.simulate(detail, 'arrays', engine).ledger
+                self.assertDictEqual(self.totals(objects), self.totals(arrays))
+                self.assertEqual(objects.size, arrays.size)
+
+    def test_reports__none(self):
+        simulation = self.simulate('none')
+        account = simulation.model.people[0].savings.to_list()[0]
+
+        self.assertEqual(simulation.ledger.size, 0)
+        self.assertIsNone(account.annual_report)
+        self.assertEqual(simulation.month, self.simulate('annual').month)
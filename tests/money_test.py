@@ -0,0 +1,115 @@
+from unittest import TestCase
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from multiprocessing import get_context
+from random import Random
+
+from finsim.money import BACKENDS, call_with_backend, get_backend, set_backend
+from finsim.sim_data import SimData
+from finsim.simulation import Simulation
+from finsim.strategies import RuleStrategy
+from test_data import generate_test_data
+
+DECIMAL = BACKENDS['decimal']
+PENCE = BACKENDS['pence']
+FLOAT = BACKENDS['float']
+
+def random_amounts(count=2000, seed=0):
+    rng = Random(seed)
+    return [ Decimal(rng.randint(-10000000, 10000000)).scaleb(-2) for _ in range(count) ]
+
+def backend_name():
+    return get_backend().name
+
+class TestBackendSelection(TestCase):
+
+    def tearDown(self):
+        set_backend('decimal')
+
+    def test_default_backend(self):
+        self.assertIs(get_backend(), DECIMAL)
+
+    def test_set_backend(self):
+        set_backend('pence')
+        self.assertIs(get_backend(), PENCE)
+
+    def test_set_backend__invalid(self):
+        with self.assertRaises(ValueError):
+            set_backend('bitcoin')
+
+    def test_call_with_backend__spawned_worker(self):
+        set_backend('pence')
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as executor:
+            default = executor.submit(backend_name).result()
+            selected = executor.submit(call_with_backend, get_backend().name, backend_name).result()
+
+        self.assertEqual(default, 'decimal')
+        self.assertEqual(selected, 'pence')
+
+
+class TestPenceMoney(TestCase):
+
+    def test_conversions(self):
+        self.assertEqual(PENCE.from_value('1234.56'), 123456)
+        self.assertEqual(PENCE.from_value(Decimal('-0.5')), -50)
+        self.assertEqual(PENCE.to_decimal(-123456), Decimal('-1234.56'))
+
+    def test_percentage_of__matches_decimal(self):
+        rng = Random(1)
+        for amount in random_amounts():
+            percentage = Decimal(rng.randint(0, 5000)).scaleb(-2)
+            for round_up in (False, True):
+                expected = DECIMAL.percentage_of(amount, percentage, round_up)
+                result = PENCE.percentage_of(PENCE.from_value(amount), percentage, round_up)
+                self.assertEqual(PENCE.to_decimal(result), expected)
+
+    def test_divide__matches_decimal(self):
+        for amount in random_amounts():
+            for round_up in (False, True):
+                expected = DECIMAL.divide(amount, 12, round_up)
+                result = PENCE.divide(PENCE.from_value(amount), 12, round_up)
+                self.assertEqual(PENCE.to_decimal(result), expected)
+
+    def test_months_to_cover(self):
+        self.assertEqual(PENCE.months_to_cover(1000, 250), 4)
+        self.assertEqual(PENCE.months_to_cover(1001, 250), 5)
+
+
+class TestFloatMoney(TestCase):
+
+    def test_percentage_of(self):
+        self.assertEqual(FLOAT.percentage_of(FLOAT.from_value('0.29'), Decimal('100')), 29.0)
+        self.assertEqual(FLOAT.percentage_of(-1050.0, Decimal('10')), -105.0)
+        self.assertEqual(FLOAT.percentage_of(1055.0, Decimal('1'), round_up=True), 11.0)
+
+    def test_to_decimal(self):
+        self.assertEqual(FLOAT.to_decimal(123456.0), Decimal('1234.56'))
+
+
+class TestSimulationBackends(TestCase):
+
+    def tearDown(self):
+        set_backend('decimal')
+
+    def simulate(self, backend, savings_goal):
+        set_backend(backend)
+        test_data = generate_test_data()
+        test_data['savings_goal'] = savings_goal
+        simulation = Simulation(
+            SimData.from_dict(test_data),
+            RuleStrategy(debt_share='30', reserve='650'),
+            quiet=True)
+        months = simulation.simulate()
+        balances = [
+            account.balance
+            for person in simulation.model.people
+            for account in person.savings.to_list() + person.debts.to_list(active_only=False)
+        ]
+        salaries = [ person.payroll.net_monthly for person in simulation.model.people ]
+        return months, balances, salaries
+
+    def test_pence_identical_to_decimal(self):
+        for savings_goal in ('10000', '500000'):
+            self.assertEqual(
+                self.simulate('decimal', savings_goal),
+                self.simulate('pence', savings_goal))
@@ -0,0 +1,159 @@
+from unittest import TestCase
+from unittest.mock import Mock
+from decimal import Decimal
+
+import numpy as np
+
+from finsim.monte_carlo import MonteCarlo, MonteCarloResult
+from finsim.simulation import Simulation
+from finsim.strategies import RuleStrategy, ShareStrategy
+from test_data import generate_test_data
+
+def generate_data_mock(group_mode=True, savings_goal='100000', debts=True):
+    data = generate_test_data()
+    mock_data = Mock()
+    mock_data.group_mode = group_mode
+    mock_data.savings_goal = Decimal(savings_goal)
+    if group_mode:
+        mock_data.get_shared_expenses.return_value = data['group']['expenses']
+        mock_data.proportional_expenses = True
+    else:
+        del data['people'][1]
+        mock_data.proportional_expenses = None
+    if not debts:
+        for person in data['people']:
+            person['debts'] = []
+    mock_data.get_people.return_value = data['people']
+    return mock_data
+
+EVEN_SHARES = {
+    'Alice': { 'Savings Acc.': 0.5, 'Lifetime ISA': 0.5 },
+    'Bob': { 'Lifetime ISA': 1 }
+}
+
+DEBT_SHARES = {
+    'Alice': { 'Credit Card': 0.3, 'Overdraft': 0.1, 'Savings Acc.': 0.3, 'Lifetime ISA': 0.3 },
+    'Bob': { 'Overdraft': 0.5, 'Lifetime ISA': 0.5 }
+}
+
+class TestMonteCarlo(TestCase):
+
+    def test_run__matches_deterministic_simulation(self):
+        for group_mode in (True, False):
+            simulation = Simulation(
+                generate_data_mock(group_mode, debts=False),
+                strategy_provider=RuleStrategy(debt_share='0'),
+                quiet=True)
+            expected_months = simulation.simulate()
+
+            monte_carlo = MonteCarlo(
+                generate_data_mock(group_mode, debts=False),
+                shares=EVEN_SHARES,
+                scenarios=4,
+                inflation_sd=0,
+                payrise_sd=0)
+            result = monte_carlo.run()
+
+            self.assertListEqual(list(result.months_to_goal), [ expected_months ] * 4)
+
+    def test_run__matches_simulation_with_debts(self):
+        for group_mode in (True, False):
+            for savings_goal in ('5000', '20000', '60000'):
+                simulation = Simulation(
+                    generate_data_mock(group_mode, savings_goal),
+                    strategy_provider=ShareStrategy(DEBT_SHARES),
+                    quiet=True,
+                    report_detail='none')
+                expected_months = simulation.simulate()
+
+                monte_carlo = MonteCarlo(
+                    generate_data_mock(group_mode, savings_goal),
+                    shares=DEBT_SHARES,
+                    scenarios=2,
+                    inflation_sd=0,
+                    payrise_sd=0)
+                result = monte_carlo.run()
+
+                self.assertListEqual(list(result.months_to_goal), [ expected_months ] * 2)
+
+    def test_run__stochastic_paths(self):
+        monte_carlo = MonteCarlo(
+            generate_data_mock(savings_goal='300000'),
+            scenarios=2000,
+            inflation_sd='3',
+            payrise_sd='3',
+            seed=1)
+        result = monte_carlo.run()
+
+        self.assertEqual(result.months_to_goal.shape, (2000,))
+        self.assertEqual(result.reached_fraction(), 1.0)
+        self.assertLess(result.percentile(10), result.percentile(90))
+
+    def test_run__seeded(self):
+        results = [
+            MonteCarlo(generate_data_mock(), scenarios=100, seed=7).run().months_to_goal
+            for _ in range(2)
+        ]
+        np.testing.assert_array_equal(results[0], results[1])
+
+    def test_run__horizon(self):
+        monte_carlo = MonteCarlo(generate_data_mock(savings_goal='10000000'), scenarios=10, max_years=2)
+        result = monte_carlo.run()
+
+        self.assertEqual(result.reached_fraction(), 0.0)
+        self.assertIsNone(result.percentile(50))
+
+    def test_roll_over__next_debt(self):
+        monte_carlo = MonteCarlo(
+            generate_data_mock(group_mode=False),
+            shares={ 'Alice': { 'Credit Card': 0.2, 'Overdraft': 0.3, 'Savings Acc.': 0.5 } },
+            scenarios=2)
+        person = monte_carlo.people[0]
+        cleared = np.array([ [ False, True ], [ False, False ] ])
+        person.debt_active &= ~cleared
+
+        person._roll_over(cleared)
+
+        np.testing.assert_allclose(person.shares[0], [ 0.5, 0, 0.5, 0 ])
+        np.testing.assert_allclose(person.shares[1], [ 0.2, 0.3, 0.5, 0 ])
+
+    def test_roll_over__savings(self):
+        monte_carlo = MonteCarlo(
+            generate_data_mock(group_mode=False),
+            shares={ 'Alice': { 'Credit Card': 0.4, 'Savings Acc.': 0.3, 'Lifetime ISA': 0.3 } },
+            scenarios=1)
+        person = monte_carlo.people[0]
+        cleared = np.array([ [ True, True ] ])
+        person.debt_active &= ~cleared
+
+        person._roll_over(cleared)
+
+        np.testing.assert_allclose(person.shares[0], [ 0, 0, 0.5, 0.5 ])
+
+    def test_assign_shares(self):
+        monte_carlo = MonteCarlo(generate_data_mock(debts=False), shares=EVEN_SHARES, scenarios=2,
+                                 inflation_sd=0, payrise_sd=0)
+        self.assertListEqual(monte_carlo.account_names('Alice'), ['Savings Acc.', 'Lifetime ISA'])
+        monte_carlo.assign_shares({ 'Alice': [ [ 0.5, 0.5 ], [ 0, 1 ] ] })
+        result = monte_carlo.run()
+
+        np.testing.assert_allclose(monte_carlo.people[0].shares, [ [ 0.5, 0.5 ], [ 0, 1 ] ])
+        self.assertLess(result.months_to_goal[1], result.months_to_goal[0])
+
+    def test_account_names__unknown_person(self):
+        with self.assertRaises(KeyError):
+            MonteCarlo(generate_data_mock(), scenarios=1).account_names('Carol')
+
+
+class TestMonteCarloResult(TestCase):
+
+    def test_summary(self):
+        result = MonteCarloResult(np.array([ 10, 20, 30, 40, -1 ]))
+        summary = result.summary()
+
+        self.assertEqual(summary['scenarios'], 5)
+        self.assertEqual(summary['reached_fraction'], 0.8)
+        self.assertEqual(summary['mean'], 25.0)
+        self.assertEqual(summary['p10'], 20)
+        self.assertEqual(summary['p50'], 30)
+        self.assertIsNone(summary['p90'])
@@ -0,0 +1,87 @@
+from unittest import TestCase
+
+import numpy as np
+
+from finsim.optimiser import OptimiserResult, StrategyOptimiser
+from finsim.sim_data import SimData
+from finsim.simulation import Simulation
+from finsim.strategies import ShareStrategy
+from test_data import generate_test_data
+
+def generate_data(savings_goal='40000', group_mode=True):
+    test_data = generate_test_data()
+    test_data['savings_goal'] = savings_goal
+    if not group_mode:
+        del test_data['people'][1]
+        del test_data['group']
+    return SimData.from_dict(test_data)
+
+class TestStrategyOptimiser(TestCase):
+
+    def setUp(self):
+        self.optimiser = StrategyOptimiser(generate_data(), min_debt_share='0.2', seed=1)
+
+    def test_init(self):
+        self.assertListEqual(self.optimiser.people, ['Alice', 'Bob'])
+        self.assertListEqual(
+            self.optimiser.accounts['Alice'], ['Credit Card', 'Overdraft', 'Savings Acc.', 'Lifetime ISA'])
+        self.assertEqual(self.optimiser.num_debts['Bob'], 1)
+
+    def test_rule_candidates(self):
+        shares = self.optimiser.rule_candidates('avalanche', steps=5)['Alice']
+
+        self.assertEqual(shares.shape, (5, 4))
+        np.testing.assert_allclose(shares.sum(axis=1), 1)
+        np.testing.assert_allclose(shares[:, 1], [ 0.2, 0.4, 0.6, 0.8, 1 ])
+        np.testing.assert_allclose(shares[0], [ 0, 0.2, 0.4, 0.4 ])
+
+    def test_greedy_candidates(self):
+        shares = self.optimiser.greedy_candidates()
+
+        np.testing.assert_allclose(shares['Alice'], [ [ 0, 0.2, 0, 0.8 ] ])
+        np.testing.assert_allclose(shares['Bob'], [ [ 0.2, 0.8 ] ])
+
+    def test_random_candidates(self):
+        shares = self.optimiser.random_candidates(500)['Alice']
+
+        self.assertEqual(shares.shape, (500, 4))
+        np.testing.assert_allclose(shares.sum(axis=1), 1)
+        self.assertTrue((shares[:, :2].sum(axis=1) >= 0.2 - 1e-9).all())
+
+    def test_evaluate(self):
+        shares = self.optimiser.rule_candidates('avalanche', steps=3)
+        months = self.optimiser.evaluate(shares)
+
+        self.assertEqual(months.shape, (3,))
+        self.assertLessEqual(months[0], months[1])
+        self.assertTrue((months > 0).all())
+
+    def test_compare(self):
+        results = self.optimiser.compare(candidates=200)
+
+        self.assertListEqual([ r.name for r in results ], ['avalanche', 'snowball', 'greedy', 'search'])
+        self.assertLessEqual(results[3].months, results[2].months)
+        self.assertEqual(results[2].shares['Bob'], { 'Overdraft': 0.2, 'Lifetime ISA': 0.8 })
+
+    def test_compare__matches_simulation(self):
+        for group_mode in (True, False):
+            optimiser = StrategyOptimiser(generate_data(group_mode=group_mode), min_debt_share='0.2', seed=1)
+            for result in optimiser.compare(candidates=200):
+                simulation = Simulation(generate_data(group_mode=group_mode), result.strategy(), quiet=True)
+                self.assertEqual(result.months, simulation.simulate(), result.name)
+
+    def test_optimise__strategy(self):
+        optimiser = StrategyOptimiser(generate_data(group_mode=False), seed=1)
+        result = optimiser.optimise(candidates=100)
+        strategy = result.strategy()
+
+        self.assertIsInstance(result, OptimiserResult)
+        self.assertIsInstance(strategy, ShareStrategy)
+        simulation = Simulation(generate_data(group_mode=False), strategy, quiet=True)
+        self.assertEqual(simulation.simulate(), result.months)
+
+    def test_optimise__unreachable(self):
+        optimiser = StrategyOptimiser(generate_data(savings_goal='100000000'), max_years=2)
+        result = optimiser.optimise(candidates=10)
+
+        self.assertIsNone(result.months)
@@ -3,7 +3,9 @@ from unittest.mock import patch, Mock
 from decimal import Decimal
 from os import environ
 
-from finsim.payroll import Payroll
+from finsim.economy import EconomicParameters, default_parameters
+from finsim.money import BACKENDS
+from finsim.payroll import Payroll, TaxSchedule, net_salary_cache_info
 
 def generate_test_data():
     return {
@@ -35,16 +37,58 @@ class TestPayroll(TestCase):
         self.assertEqual(payroll.gross, Decimal('21000'))
         self.assertEqual(mock_calculate.call_count, 2)
 
-    @patch('finsim.payroll.data')
-    def test_calculate_net_salary(self, mock_data):
-        mock_data.INFLATION_RATE = Decimal('1')
-        mock_data.NI_THRESHOLD = Decimal('10000')
-        mock_data.NI_RATE = Decimal('10')
-        mock_data.IT_THRESHOLD = Decimal('12500')
-        mock_data.IT_RATE = Decimal('20')
-        mock_data.SL_THRESHOLD = Decimal('25000')
-        mock_data.SL_RATE = Decimal('10')
-        payroll = Payroll(generate_test_data())
+    def test_calculate_net_salary(self):
+        economy = EconomicParameters('1', '10000', '10', '12500', '20', '25000', '10')
+        payroll = Payroll(generate_test_data(), economy)
 
         self.assertIsInstance(payroll.net_monthly, Decimal)
         self.assertEqual(payroll.net_monthly, Decimal('1460'))
+
+    def test_init__default_payrise(self):
+        salary_data = generate_test_data()
+        del salary_data['payrise_rate']
+        economy = default_parameters().replace(inflation_rate='2.5')
+        payroll = Payroll(salary_data, economy)
+
+        self.assertEqual(payroll.payrise_rate, Decimal('2.5'))
+
+    def test_calculate_net_salary__memoised(self):
+        before = net_salary_cache_info()
+        first = Payroll(generate_test_data())
+        second = Payroll(generate_test_data())
+        after = net_salary_cache_info()
+
+        self.assertEqual(first.net_monthly, second.net_monthly)
+        self.assertGreaterEqual(after.hits - before.hits, 1)
+
+
+class TestTaxSchedule(TestCase):
+
+    def generate_schedule(self):
+        return TaxSchedule([
+            ('10000', '10'),
+            ('12500', '20'),
+            ('25000', '10')
+        ])
+
+    def test_for_economy(self):
+        economy = default_parameters()
+        self.assertEqual(TaxSchedule.for_economy(economy), TaxSchedule.for_economy(economy))
+        self.assertIs(TaxSchedule.for_economy(economy), TaxSchedule.for_economy(economy))
+        self.assertEqual(TaxSchedule.for_economy(economy).bands, economy.tax_bands)
+
+    def test_net_monthly(self):
+        result = self.generate_schedule().net_monthly(BACKENDS['decimal'], Decimal('20000'), Decimal('4.0'))
+        self.assertEqual(result, Decimal('1460'))
+
+    def test_net_monthly_batch__matches_decimal(self):
+        schedule = self.generate_schedule()
+        salaries = [ Decimal(s).scaleb(-2) for s in range(500000, 15000000, 123457) ]
+
+        result = schedule.net_monthly_batch([ float(s) for s in salaries ], Decimal('4.5'))
+
+        expected = [
+            float(schedule.net_monthly(BACKENDS['decimal'], s, Decimal('4.5'))) for s in salaries
+        ]
+        self.assertEqual(result.shape, (len(salaries),))
+        self.assertListEqual(list(result), expected)
@@ -1,8 +1,10 @@
 from unittest import TestCase
 from unittest.mock import patch, Mock
+from asyncio import new_event_loop
 from decimal import Decimal
 
 from finsim.person import Person
+from finsim.strategies import AsyncFunctionStrategy
 
 def generate_test_data():
     from test_data import generate_test_data as gtd
@@ -19,10 +21,10 @@ class TestPerson(TestCase):
         person = Person(test_data)
 
         self.assertEqual(person.name, 'Alice')
-        mock_payroll_init.assert_called_with(test_data['salary'])
-        mock_expenses_init.assert_called_with(test_data['expenses'])
-        mock_savings_init.assert_called_with(test_data['savings'])
-        mock_debts_init.assert_called_with(test_data['debts'])
+        mock_payroll_init.assert_called_with(test_data['salary'], None)
+        mock_expenses_init.assert_called_with(test_data['expenses'], None)
+        mock_savings_init.assert_called_with(test_data['savings'], person.ledger, 'Alice')
+        mock_debts_init.assert_called_with(test_data['debts'], person.ledger, 'Alice')
 
     @patch('finsim.person.Person.strategise')
     def test_begin_year(self, mock_strat, mock_expenses_init, mock_payroll_init, *_):
@@ -100,6 +102,47 @@ class TestPerson(TestCase):
         mock_debts.reset_recently_cleared.assert_called_once()
         self.assertFalse(person.updated)
 
+    def test_strategise__provider(self, *mocks):
+        mock_strategy = { 'savings': [] }
+        mock_provider = Mock()
+        mock_provider.obtain_initial_strategy.return_value = mock_strategy
+        mock_provider.obtain_new_strategy.return_value = mock_strategy
+        person = Person(generate_test_data(), strategy_provider=mock_provider)
+
+        person.strategise()
+        person.strategise()
+
+        mock_provider.obtain_initial_strategy.assert_called_once_with(person)
+        mock_provider.obtain_new_strategy.assert_called_once_with(person)
+        self.assertListEqual(person.outdated_strategies, [mock_strategy])
+
+    def test_strategise_async(self, *mocks):
+        calls = []
+        async def func(person, initial):
+            calls.append(initial)
+            return { 'savings': [] }
+        loop = new_event_loop()
+        self.addCleanup(loop.close)
+        person = Person(generate_test_data(), strategy_provider=AsyncFunctionStrategy(func, loop))
+
+        loop.run_until_complete(person.strategise_async())
+        loop.run_until_complete(person.strategise_async())
+
+        self.assertListEqual(calls, [ True, False ])
+        self.assertListEqual(person.outdated_strategies, [ { 'savings': [] } ])
+        self.assertFalse(person.updated)
+
+    def test_strategise_async__sync_provider(self, *mocks):
+        mock_provider = Mock()
+        mock_provider.obtain_initial_strategy.return_value = { 'savings': [] }
+        person = Person(generate_test_data(), strategy_provider=mock_provider)
+
+        loop = new_event_loop()
+        self.addCleanup(loop.close)
+        loop.run_until_complete(person.strategise_async())
+
+        mock_provider.obtain_initial_strategy.assert_called_once_with(person)
+
     def test_simulate_month__updated(self, *mocks):
         mock_savings = Mock()
         mock_savings_init = mocks[2]
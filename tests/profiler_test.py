@@ -0,0 +1,93 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from finsim.profiler import Profiler
+from finsim.sim_data import SimData
+from finsim.simulation import Simulation
+from finsim.strategies import RuleStrategy
+from test_data import generate_test_data
+
+class TestProfiler(TestCase):
+
+    def simulate(self, profiler=None, people=2, storage='objects'):
+        test_data = generate_test_data()
+        test_data['people'] = test_data['people'][:people]
+        if people == 1:
+            del test_data['group']
+        test_data['savings_goal'] = '30000'
+        simulation = Simulation(
+            SimData.from_dict(test_data),
+            RuleStrategy(debt_share='30', reserve='650'),
+            quiet=True,
+            engine='stepwise',
+            storage=storage,
+            profiler=profiler)
+        simulation.simulate()
+        return simulation
+
+    def test_summary(self):
+        profiler = Profiler()
+        simulation = self.simulate(profiler)
+        summary = profiler.summary()
+
+        self.assertListEqual(
+            list(summary),
+            ['simulation', 'group', 'Alice', 'Alice.savings', 'Alice.debts', 'Bob', 'Bob.savings', 'Bob.debts'])
+        self.assertEqual(summary['simulation']['achieved_goal']['calls'], simulation.month)
+        self.assertEqual(summary['simulation']['months_until_event']['calls'], 0)
+        self.assertEqual(summary['group']['simulate_month']['calls'], simulation.month)
+        self.assertEqual(summary['Bob.debts']['pay']['calls'], simulation.month)
+        self.assertEqual(summary['Alice']['begin_year']['calls'], (simulation.month + 11) // 12)
+        self.assertGreater(summary['Alice']['simulate_month']['seconds'], summary['Alice.savings']['deposit']['seconds'])
+
+    def test_summary__single_person(self):
+        profiler = Profiler()
+        simulation = self.simulate(profiler, people=1, storage='arrays')
+        summary = profiler.summary()
+
+        self.assertListEqual(list(summary), ['simulation', 'Alice', 'Alice.savings', 'Alice.debts'])
+        self.assertEqual(summary['Alice.savings']['deposit']['calls'], simulation.month)
+
+    def test_summary__shared_name(self):
+        test_data = generate_test_data()
+        test_data['people'][1]['name'] = 'Alice'
+        test_data['savings_goal'] = '30000'
+        profiler = Profiler()
+        simulation = Simulation(
+            SimData.from_dict(test_data), RuleStrategy(debt_share='30', reserve='650'), quiet=True,
+            engine='stepwise', profiler=profiler)
+        simulation.simulate()
+        summary = profiler.summary()
+
+        self.assertListEqual(
+            list(summary),
+            [ 'simulation', 'group', 'Alice[0]', 'Alice[0].savings', 'Alice[0].debts', 'Alice[1]',
+              'Alice[1].savings', 'Alice[1].debts' ])
+        self.assertEqual(summary['Alice[0]']['simulate_month']['calls'], simulation.month)
+        self.assertEqual(summary['Alice[1]']['simulate_month']['calls'], simulation.month)
+
+    def test_disabled(self):
+        simulation = self.simulate()
+
+        self.assertNotIn('simulate_month', vars(simulation.model))
+        self.assertNotIn('_achieved_goal', vars(simulation))
+
+    def test_months_match(self):
+        self.assertEqual(self.simulate(Profiler()).month, self.simulate().month)
+
+    def test_to_table(self):
+        profiler = Profiler()
+        self.simulate(profiler)
+        lines = profiler.to_table().split('\n')
+
+        self.assertListEqual(lines[0].split(), ['Scope', 'Phase', 'Calls', 'Seconds', 'Per', 'Call', '(us)'])
+        self.assertTrue(set(lines[1]) <= set('- '))
+        self.assertEqual(lines[2].split()[:2], ['simulation', 'achieved_goal'])
+        self.assertFalse(any('months_until_event' in line for line in lines))
+
+    @patch('builtins.print')
+    def test_print_table(self, mock_print):
+        profiler = Profiler()
+        self.simulate(profiler)
+        profiler.print_table()
+        mock_print.assert_called_once_with(profiler.to_table())
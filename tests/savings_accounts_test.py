@@ -3,6 +3,7 @@ from unittest.mock import patch, Mock
 from decimal import Decimal
 
 from finsim.savings_accounts import SavingsAccounts, SavingsAccount
+from finsim.utils import TotalMismatchError
 
 def generate_test_data():
     return [
@@ -20,17 +21,25 @@ def generate_test_data():
         }
     ]
 
+def generate_account_mock(balance='0', deposit='0', interest='0'):
+    mock_account = Mock()
+    mock_account.balance = Decimal(balance)
+    mock_account.deposit.return_value = Decimal(deposit)
+    mock_account.end_year.return_value = Decimal(interest)
+    return mock_account
+
 @patch('finsim.savings_accounts.SavingsAccount')
 class TestSavingsAccounts(TestCase):
 
     def test_init(self, mock_acc_init):
+        mock_acc_init.return_value = generate_account_mock()
         test_data = generate_test_data()
         accounts = SavingsAccounts(test_data)
         self.assertEqual(mock_acc_init.call_count, 2)
 
     def test_pay(self, mock_acc_init):
-        mock_traditional = Mock()
-        mock_lisa = Mock()
+        mock_traditional = generate_account_mock()
+        mock_lisa = generate_account_mock()
         mock_acc_init.side_effect = [mock_traditional, mock_lisa]
         accounts = SavingsAccounts(generate_test_data())
 
@@ -40,19 +49,54 @@ class TestSavingsAccounts(TestCase):
         mock_lisa.deposit.assert_called_once()
 
     def test_total_saved(self, mock_acc_init):
-        mock_traditional = Mock()
-        mock_traditional.balance = Decimal('1000')
-        mock_lisa = Mock()
-        mock_lisa.balance = Decimal('1500')
+        mock_traditional = generate_account_mock(balance='1000')
+        mock_lisa = generate_account_mock(balance='1500')
         mock_acc_init.side_effect = [mock_traditional, mock_lisa]
         accounts = SavingsAccounts(generate_test_data())
 
         result = accounts.total_saved()
         self.assertEqual(result, Decimal('2500'))
 
+    def test_monthly_deposit(self, mock_acc_init):
+        mock_traditional = generate_account_mock()
+        mock_traditional.monthly_deposit.return_value = Decimal('100')
+        mock_lisa = generate_account_mock()
+        mock_lisa.monthly_deposit.return_value = Decimal('125')
+        mock_acc_init.side_effect = [mock_traditional, mock_lisa]
+        accounts = SavingsAccounts(generate_test_data())
+
+        self.assertEqual(accounts.monthly_deposit(), Decimal('225'))
+
+    def test_total_saved__running(self, mock_acc_init):
+        mock_traditional = generate_account_mock(balance='1000', deposit='100', interest='11')
+        mock_lisa = generate_account_mock(balance='1500', deposit='125', interest='17.38')
+        mock_acc_init.side_effect = [mock_traditional, mock_lisa]
+        accounts = SavingsAccounts(generate_test_data())
+
+        deposited = accounts.deposit()
+        interest = accounts.end_year()
+
+        self.assertEqual(deposited, Decimal('225'))
+        self.assertEqual(interest, Decimal('28.38'))
+        self.assertEqual(accounts.total_saved(), Decimal('2753.38'))
+
+    @patch('finsim.utils.VERIFY_TOTALS', True)
+    def test_total_saved__verify(self, mock_acc_init):
+        mock_traditional = generate_account_mock(balance='1000', deposit='100')
+        mock_lisa = generate_account_mock(balance='1500')
+        mock_acc_init.side_effect = [mock_traditional, mock_lisa]
+        accounts = SavingsAccounts(generate_test_data())
+        accounts.deposit()
+
+        with self.assertRaises(TotalMismatchError):
+            accounts.total_saved()
+
+        mock_traditional.balance = Decimal('1100')
+        self.assertEqual(accounts.total_saved(), Decimal('2600'))
+
     def test_to_list__all(self, mock_acc_init):
-        mock_traditional = Mock()
-        mock_lisa = Mock()
+        mock_traditional = generate_account_mock()
+        mock_lisa = generate_account_mock()
         mock_acc_init.side_effect = [mock_traditional, mock_lisa]
         accounts = SavingsAccounts(generate_test_data())
 
@@ -90,9 +134,28 @@ class TestSavingsAccount(TestCase):
         savings_acc = SavingsAccount(generate_test_data()[1])
         savings_acc.payment_amount = Decimal('100')
 
-        savings_acc.deposit()
+        result = savings_acc.deposit()
+        self.assertEqual(result, Decimal('125'))
         self.assertEqual(savings_acc.balance, Decimal('225'))
         self.assertEqual(savings_acc.annual_report['Payments / Deposits'], Decimal('100'))
         self.assertEqual(savings_acc.overall_report['Payments / Deposits'], Decimal('100'))
         self.assertEqual(savings_acc.annual_report['Government Bonus'], Decimal('25'))
         self.assertEqual(savings_acc.overall_report['Government Bonus'], Decimal('25'))
+
+    def test_deposit__lisa_multiple_months(self):
+        savings_acc = SavingsAccount(generate_test_data()[1])
+        savings_acc.payment_amount = Decimal('100')
+
+        savings_acc.deposit(months=3)
+        self.assertEqual(savings_acc.balance, Decimal('475'))
+        self.assertEqual(savings_acc.annual_report['Payments / Deposits'], Decimal('300'))
+        self.assertEqual(savings_acc.annual_report['Government Bonus'], Decimal('75'))
+
+    def test_monthly_deposit(self):
+        traditional = SavingsAccount(generate_test_data()[0])
+        traditional.payment_amount = Decimal('100')
+        lisa = SavingsAccount(generate_test_data()[1])
+        lisa.payment_amount = Decimal('100')
+
+        self.assertEqual(traditional.monthly_deposit(), Decimal('100'))
+        self.assertEqual(lisa.monthly_deposit(), Decimal('125'))
@@ -0,0 +1,249 @@
+from unittest import TestCase
+from unittest.mock import patch
+from http.client import HTTPConnection
+from json import dumps as json_dumps, loads as json_loads
+from threading import Thread
+from decimal import Decimal
+
+from finsim.cache import ResultCache
+from finsim.service import (
+    LatencyStats, ServiceError, ServiceServer, SimulationService, run_batch, run_request
+)
+from finsim.sim_data import SimData
+from finsim.simulation import Simulation
+from finsim.strategies import RuleStrategy
+from test_data import generate_test_data
+
+def generate_request(**strategy):
+    return { 'data': generate_test_data(), 'strategy': strategy or { 'debt_share': '60' } }
+
+class TestRunRequest(TestCase):
+
+    def test_run_request(self):
+        response = run_request(generate_request(debt_share='60', order='snowball'))
+
+        simulation = Simulation(
+            SimData.from_dict(generate_test_data()), RuleStrategy(debt_share='60', order='snowball'),
+            quiet=True)
+        self.assertEqual(response['months'], simulation.simulate())
+        self.assertEqual(response['total_saved'], simulation.model.total_saved())
+        self.assertIn('Bob:Overdraft', response['balances'])
+
+    def test_run_request__fixed_strategy(self):
+        fixed = {
+            'Alice': { 'savings': { 'Savings Acc.': '500' } },
+            'Bob': { 'savings': { 'Lifetime ISA': '500' } }
+        }
+        response = run_request({ 'data': generate_test_data(), 'strategy': { 'fixed': fixed } })
+
+        self.assertGreater(response['months'], 0)
+        self.assertEqual(response['balances']['Alice:Lifetime ISA'], Decimal('100.00'))
+
+    def test_run_request__economy(self):
+        base = run_request(generate_request())
+        taxed = run_request(dict(generate_request(), economy={ 'it_rate': '40' }))
+
+        self.assertGreater(taxed['months'], base['months'])
+
+    def test_run_request__max_years(self):
+        fixed = {
+            'Alice': { 'savings': { 'Savings Acc.': '10' } },
+            'Bob': { 'savings': { 'Lifetime ISA': '10' } }
+        }
+        request = { 'data': generate_test_data(), 'strategy': { 'fixed': fixed } }
+        request['data']['savings_goal'] = '1000000'
+
+        self.assertIsNone(run_request(request, max_years=5)['months'])
+        self.assertIsNone(run_request(dict(request, max_years=2), max_years=100)['months'])
+        with self.assertRaises(ServiceError):
+            run_request(dict(request, max_years='forever'))
+        with self.assertRaises(ServiceError):
+            run_request(dict(request, max_years=None), max_years=5)
+
+    def test_run_batch__errors(self):
+        data = generate_test_data()
+        data['people'] = []
+        results = run_batch(
+            [ { 'data': data }, dict(generate_request(), strategy={ 'bogus': '1' }), 'data', generate_request() ],
+            'event', 'objects', None)
+        responses = [ response for response, _ in results ]
+
+        self.assertEqual(responses[0]['errors'][0][0], '$.people')
+        self.assertIn('error', responses[1])
+        self.assertIn('error', responses[2])
+        self.assertNotIn('error', responses[3])
+        for _, seconds in results:
+            self.assertGreaterEqual(seconds, 0)
+
+    def test_run_batch__unexpected_error(self):
+        request = generate_request()
+        request['strategy'] = { 'fixed': { 'Alice': {}, 'Bob': {} } }
+        for person in request['data']['people']:
+            for account in person['savings']:
+                account['interest_rate'] = '0'
+
+        results = run_batch([ request, generate_request() ], 'event', 'objects', None)
+
+        self.assertIn('InvalidOperation', results[0][0]['error'])
+        self.assertNotIn('error', results[1][0])
+
+
+class TestLatencyStats(TestCase):
+
+    def test_summary(self):
+        stats = LatencyStats(window=100)
+        stats.record_batch([ i / 1000 for i in range(1, 101) ])
+        stats.record_batch([ 0.5 ])
+
+        summary = stats.summary()
+
+        self.assertEqual(summary['requests'], 101)
+        self.assertEqual(summary['batches'], 2)
+        self.assertAlmostEqual(summary['mean_batch_size'], 50.5)
+        self.assertAlmostEqual(summary['p50_ms'], 52)
+        self.assertAlmostEqual(summary['p99_ms'], 500)
+        self.assertAlmostEqual(summary['max_ms'], 500)
+
+    def test_summary__empty(self):
+        summary = LatencyStats().summary()
+
+        self.assertEqual(summary['requests'], 0)
+        self.assertEqual(summary['p99_ms'], 0)
+
+
+class TestSimulationService(TestCase):
+
+    def test_submit__not_started(self):
+        with self.assertRaises(ServiceError):
+            SimulationService(workers=0).submit(generate_request())
+
+    def test_simulate(self):
+        with SimulationService(workers=0) as service:
+            response = service.simulate(generate_request())
+
+        self.assertEqual(response['months'], run_request(generate_request())['months'])
+        self.assertEqual(response['latency']['batch_size'], 1)
+        self.assertGreaterEqual(response['latency']['total_ms'], response['latency']['simulate_ms'])
+        self.assertEqual(service.latency.summary()['requests'], 1)
+
+    def test_submit__batches(self):
+        service = SimulationService(workers=0, batch_size=3, batch_wait=0.2)
+        with patch('finsim.service.run_batch', wraps=run_batch) as mock_run_batch:
+            with service:
+                futures = [ service.submit(generate_request(debt_share=str(share))) for share in range(10, 80, 10) ]
+                responses = [ future.result() for future in futures ]
+
+        batch_sizes = [ len(call[0][0]) for call in mock_run_batch.call_args_list[1:] ]
+        self.assertListEqual(batch_sizes, [ 3, 3, 1 ])
+        self.assertListEqual(
+            [ response['months'] for response in responses ],
+            [ run_request(generate_request(debt_share=str(share)))['months'] for share in range(10, 80, 10) ])
+
+    def test_simulate__cached(self):
+        cache = ResultCache()
+        with SimulationService(workers=0, cache=cache) as service:
+            first = service.simulate(generate_request())
+            second = service.simulate(generate_request())
+            invalid = service.simulate({ 'data': {} })
+
+        self.assertFalse(first['latency']['cached'])
+        self.assertTrue(second['latency']['cached'])
+        self.assertEqual(first['months'], second['months'])
+        self.assertIn('errors', invalid)
+        self.assertEqual(cache.counters['memory_hits'], 1)
+        self.assertEqual(service.latency.summary()['cached'], 1)
+
+    def test_simulate__cached_by_horizon(self):
+        cache = ResultCache()
+        request = generate_request()
+        request['data']['savings_goal'] = '50000'
+        with SimulationService(workers=0, cache=cache, max_years=2) as service:
+            capped = service.simulate(request)
+            uncapped = service.simulate(dict(request, max_years=50))
+
+        self.assertIsNone(capped['months'])
+        self.assertGreater(uncapped['months'], 24)
+        self.assertFalse(uncapped['latency']['cached'])
+
+    def test_simulate__process_pool_horizon(self):
+        fixed = {
+            'Alice': { 'savings': { 'Savings Acc.': '10' } },
+            'Bob': { 'savings': { 'Lifetime ISA': '10' } }
+        }
+        request = { 'data': generate_test_data(), 'strategy': { 'fixed': fixed } }
+        request['data']['savings_goal'] = '1000000'
+        with SimulationService(workers=1, batch_wait=0.05, max_years=5) as service:
+            response = service.simulate(request)
+
+        self.assertNotIn('error', response)
+        self.assertIsNone(response['months'])
+
+    def test_simulate__process_pool_matches_in_process(self):
+        requests = [ generate_request(debt_share=str(share)) for share in (20, 50, 80) ]
+        with SimulationService(workers=1, batch_wait=0.05) as service:
+            futures = [ service.submit(request) for request in requests ]
+            pooled = [ future.result() for future in futures ]
+
+        for request, response in zip(requests, pooled):
+            del response['latency']
+            self.assertDictEqual(response, run_request(request))
+
+
+class TestServiceServer(TestCase):
+
+    def setUp(self):
+        self.service = SimulationService(workers=0).start()
+        self.server = ServiceServer(self.service, '127.0.0.1', 0)
+        self.thread = Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.connection = HTTPConnection('127.0.0.1', self.server.server_address[1])
+
+    def tearDown(self):
+        self.connection.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.service.close()
+
+    def request(self, method, path, body=None):
+        self.connection.request(method, path, body)
+        response = self.connection.getresponse()
+        return response.status, json_loads(response.read().decode('utf-8'))
+
+    def test_simulate(self):
+        status, body = self.request('POST', '/simulate', json_dumps(generate_request()))
+
+        self.assertEqual(status, 200)
+        self.assertEqual(body['months'], run_request(generate_request())['months'])
+        self.assertIn('total_ms', body['latency'])
+
+    def test_simulate__list(self):
+        status, body = self.request('POST', '/simulate', json_dumps([ generate_request(), { 'data': {} } ]))
+
+        self.assertEqual(status, 200)
+        self.assertEqual(len(body), 2)
+        self.assertIn('months', body[0])
+        self.assertIn('errors', body[1])
+
+    def test_simulate__invalid(self):
+        status, body = self.request('POST', '/simulate', '{ "data": {} }')
+        self.assertEqual(status, 400)
+        self.assertIn('errors', body)
+
+        status, body = self.request('POST', '/simulate', '{ not json')
+        self.assertEqual(status, 400)
+        self.assertIn('error', body)
+
+    def test_metrics(self):
+        self.request('POST', '/simulate', json_dumps(generate_request()))
+
+        status, body = self.request('GET', '/metrics')
+
+        self.assertEqual(status, 200)
+        self.assertEqual(body['requests'], 1)
+        self.assertGreater(body['p99_ms'], 0)
+        self.assertNotIn('cache', body)
+
+    def test_not_found(self):
+        self.assertEqual(self.request('GET', '/nowhere')[0], 404)
+        self.assertEqual(self.request('POST', '/nowhere')[0], 404)
+        self.assertEqual(self.request('GET', '/health'), (200, { 'status': 'ok' }))
@@ -1,25 +1,39 @@
 from unittest import TestCase
 from unittest.mock import patch, Mock, mock_open
 from decimal import Decimal
+from io import StringIO
+from json import dumps
+from os.path import join
+from tempfile import TemporaryDirectory
 
-from finsim.sim_data import SimData, _lower_keys, DataImportError
+from finsim.sim_data import SimData, _lower_keys, _lower_pairs, DataImportError, iter_scenarios, validate_files
+from finsim.validation import ValidationError
 from test_data import generate_test_data
 
 @patch("builtins.open", new_callable=mock_open, read_data="data")
 @patch('finsim.sim_data.json_load')
 class TestSimData(TestCase):
 
-    @patch('finsim.sim_data._lower_keys', return_value={ 'test_data': 'test' })
     @patch('finsim.sim_data.SimData._process')
-    def test_init(self, mock_process, mock_lower, mock_json, _):
-        mock_json.return_value = generate_test_data()
+    def test_init(self, mock_process, mock_json, _):
+        mock_json.return_value = { 'test_data': 'test' }
         sim_data = SimData()
 
         mock_json.assert_called_once()
-        mock_lower.assert_called_once()
+        self.assertIs(mock_json.call_args[1]['object_pairs_hook'], _lower_pairs)
         mock_process.assert_called_once()
         self.assertDictEqual(sim_data.data, { 'test_data': 'test' })
 
+    def test_from_dict(self, mock_json, mock_file):
+        test_data = generate_test_data()
+        test_data['Savings_Goal'] = test_data.pop('savings_goal')
+        sim_data = SimData.from_dict(test_data)
+
+        mock_file.assert_not_called()
+        mock_json.assert_not_called()
+        self.assertTrue(sim_data.group_mode)
+        self.assertEqual(sim_data.savings_goal, Decimal('10000'))
+
     def test_people(self, mock_json, _):
         mock_json.return_value = generate_test_data()
         sim_data = SimData()
@@ -39,68 +53,71 @@ class TestSimData(TestCase):
         self.assertEqual(len(result['monthly']), 2)
         self.assertEqual(len(result['annual']), 2)
 
-    @patch('finsim.sim_data.SimData._validate_people')
-    @patch('finsim.sim_data.SimData._validate_expenses')
-    def test_process__group_mode(self, mock_val_exp, mock_val_people, mock_json, _):
+    def test_process__group_mode(self, mock_json, _):
         test_data = generate_test_data()
         mock_json.return_value = test_data
         sim_data = SimData()
-        
-        mock_val_people.assert_called_once()
-        mock_val_exp.assert_any_call(test_data['group']['expenses'])
-        self.assertEqual(sim_data.savings_goal, Decimal('10000'))
 
+        self.assertTrue(sim_data.group_mode)
+        self.assertEqual(sim_data.savings_goal, Decimal('10000'))
 
-    @patch('finsim.sim_data.SimData._validate_people')
-    @patch('finsim.sim_data.SimData._validate_expenses')
-    def test_process__single_mode(self, mock_val_exp, mock_val_people, mock_json, _):
+    def test_process__single_mode(self, mock_json, _):
         test_data = generate_test_data()
         del test_data['group']
         del test_data['people'][1]
         mock_json.return_value = test_data
         sim_data = SimData()
-        
-        mock_val_people.assert_called_once()
-        mock_val_exp.assert_not_called()
+
+        self.assertFalse(sim_data.group_mode)
         self.assertEqual(sim_data.savings_goal, Decimal('10000'))
 
-    @patch('finsim.sim_data.SimData._validate_people')
-    @patch('finsim.sim_data.SimData._validate_expenses')
-    def test_process__negative_savings_goal(self, mock_val_exp, mock_val_people, mock_json, _):
+    def test_process__negative_savings_goal(self, mock_json, _):
         test_data = generate_test_data()
         test_data['savings_goal'] = '-1000'
         mock_json.return_value = test_data
-        
+
         with self.assertRaises(DataImportError) as context:
             sim_data = SimData()
 
-        expected_err = 'Savings Goal must be greater than Zero.'
-        self.assertEqual(expected_err, str(context.exception))
+        expected_err = ValidationError('$.savings_goal', 'Savings Goal must be greater than Zero.')
+        self.assertListEqual(context.exception.errors, [ expected_err ])
 
-    @patch('finsim.sim_data.SimData._validate_people')
-    @patch('finsim.sim_data.SimData._validate_expenses')
-    def test_process__invalid_savings_goal(self, mock_val_exp, mock_val_people, mock_json, _):
+    def test_process__invalid_savings_goal(self, mock_json, _):
         test_data = generate_test_data()
         test_data['savings_goal'] = 'LOTS OF MONEY'
         mock_json.return_value = test_data
-        
+
         with self.assertRaises(DataImportError) as context:
             sim_data = SimData()
 
-        expected_err = 'Savings Goal must be a valid number.'
-        self.assertEqual(expected_err, str(context.exception))
+        expected_err = ValidationError('$.savings_goal', 'Savings Goal must be a valid number.')
+        self.assertListEqual(context.exception.errors, [ expected_err ])
+        self.assertEqual(str(context.exception), '$.savings_goal: Savings Goal must be a valid number.')
 
-    @patch('finsim.sim_data.SimData._validate_people')
-    @patch('finsim.sim_data.SimData._validate_expenses')
-    def test_process__missing_savings_goal(self, mock_val_exp, mock_val_people, mock_json, _):
+    def test_process__missing_savings_goal(self, mock_json, _):
         test_data = generate_test_data()
         del test_data['savings_goal']
         mock_json.return_value = test_data
-        
+
         sim_data = SimData()
 
         self.assertIsNone(sim_data.savings_goal)
-    
+
+    def test_process__all_errors(self, mock_json, _):
+        test_data = generate_test_data()
+        test_data['savings_goal'] = '0'
+        test_data['people'][0]['name'] = 100
+        test_data['people'][1]['expenses']['monthly'][0]['cost'] = 'ten'
+        mock_json.return_value = test_data
+
+        with self.assertRaises(DataImportError) as context:
+            sim_data = SimData()
+
+        self.assertListEqual(context.exception.errors, [
+            ValidationError('$.people[0].name', 'Each person in the data file must have a valid name.'),
+            ValidationError('$.people[1].expenses.monthly[0].cost', 'Expense costs must be a valid number.'),
+            ValidationError('$.savings_goal', 'Savings Goal must be greater than Zero.')
+        ])
 
     def test_process_mode__ok_single(self, mock_json, _):
         test_data = generate_test_data()
@@ -108,7 +125,7 @@ class TestSimData(TestCase):
         del test_data['people'][1]
         mock_json.return_value = test_data
         sim_data = SimData()
-        
+
         self.assertFalse(sim_data.group_mode)
         self.assertIsNone(sim_data.proportional_expenses)
 
@@ -116,7 +133,7 @@ class TestSimData(TestCase):
         test_data = generate_test_data()
         mock_json.return_value = test_data
         sim_data = SimData()
-        
+
         self.assertTrue(sim_data.group_mode)
         self.assertTrue(sim_data.proportional_expenses)
 
@@ -129,8 +146,8 @@ class TestSimData(TestCase):
         with self.assertRaises(DataImportError) as context:
             sim_data = SimData()
 
-        expected_err = 'The data file must contain at least one person.'
-        self.assertEqual(expected_err, str(context.exception))
+        expected_err = ValidationError('$.people', 'The data file must contain at least one person.')
+        self.assertListEqual(context.exception.errors, [ expected_err ])
 
     def test_process_mode__err_redundant_group(self, mock_json, _):
         test_data = generate_test_data()
@@ -140,8 +157,8 @@ class TestSimData(TestCase):
         with self.assertRaises(DataImportError) as context:
             sim_data = SimData()
 
-        expected_err = '"Group" data is not permitted when only one person is defined.'
-        self.assertEqual(expected_err, str(context.exception))
+        expected_err = ValidationError('$.group', '"Group" data is not permitted when only one person is defined.')
+        self.assertListEqual(context.exception.errors, [ expected_err ])
 
     def test_process_mode__err_missing_group(self, mock_json, _):
         test_data = generate_test_data()
@@ -151,120 +168,8 @@ class TestSimData(TestCase):
         with self.assertRaises(DataImportError) as context:
             sim_data = SimData()
 
-        expected_err = 'If the data file contains more than one person, a "group" must be defined.'
-        self.assertEqual(expected_err, str(context.exception))
-
-    @patch('finsim.sim_data.SimData._validate_object')
-    @patch('finsim.sim_data.SimData._validate_expenses')
-    def test_validate_people__ok(self, mock_val_exp, mock_val_obj, *_):
-        test_data = generate_test_data()['people']
-        SimData._validate_people(test_data)
-
-        self.assertEqual(mock_val_obj.call_count, 7)
-        self.assertEqual(mock_val_exp.call_count, 2)
-
-    @patch('finsim.sim_data.SimData._validate_object')
-    @patch('finsim.sim_data.SimData._validate_expenses')
-    def test_validate_people__err_invalid_name(self, mock_val_exp, mock_val_obj, *_):
-        test_data = generate_test_data()['people']
-        test_data[0]['name'] = 100
-
-        with self.assertRaises(DataImportError) as context:
-            SimData._validate_people(test_data)
-
-        expected_err = 'Each person in the data file must have a valid name.'
-        self.assertEqual(expected_err, str(context.exception))
-
-    @patch('finsim.sim_data.SimData._validate_object')
-    @patch('finsim.sim_data.SimData._validate_expenses')
-    def test_validate_people__err_missing_savings(self, mock_val_exp, mock_val_obj, *_):
-        test_data = generate_test_data()['people']
-        test_data[0]['savings'] = []
-
-        with self.assertRaises(DataImportError) as context:
-            SimData._validate_people(test_data)
-
-        expected_err = 'Alice must have at least one savings account.'
-        self.assertEqual(expected_err, str(context.exception))
-    
-    @patch('finsim.sim_data.SimData._validate_object')
-    def test_validate_expenses__ok(self, mock_val_obj, *_):
-        test_data = generate_test_data()['people'][0]['expenses']
-        SimData._validate_expenses(test_data)
-
-        self.assertEqual(mock_val_obj.call_count, 2)
-    
-    @patch('finsim.sim_data.SimData._validate_object')
-    def test_validate_expenses__err_negative_cost(self, mock_val_obj, *_):
-        test_data = generate_test_data()['people'][0]['expenses']
-        test_data['monthly'][0]['cost'] = '-100'
-
-        with self.assertRaises(DataImportError) as context:
-            SimData._validate_expenses(test_data)
-
-        expected_err = 'Expense costs must be greater than Zero.'
-        self.assertEqual(expected_err, str(context.exception))
-    
-    @patch('finsim.sim_data.SimData._validate_object')
-    def test_validate_expenses__err_invalid_cost(self, mock_val_obj, *_):
-        test_data = generate_test_data()['people'][0]['expenses']
-        test_data['monthly'][0]['cost'] = 'ten'
-
-        with self.assertRaises(DataImportError) as context:
-            SimData._validate_expenses(test_data)
-
-        expected_err = 'Expense costs must be a valid number.'
-        self.assertEqual(expected_err, str(context.exception))
-    
-    @patch('finsim.sim_data.SimData._validate_object')
-    def test_validate_expenses__err_invalid_inflation(self, mock_val_obj, *_):
-        test_data = generate_test_data()['people'][0]['expenses']
-        test_data['monthly'][0]['inflation'] = 'yes'
-
-        with self.assertRaises(DataImportError) as context:
-            SimData._validate_expenses(test_data)
-
-        expected_err = 'The "inflation" attribute of an expense item, if included, must be either "true" or "false".'
-        self.assertEqual(expected_err, str(context.exception))
-    
-    def test_validate_object__ok(self, *_):
-        test_data = generate_test_data()['people'][0]
-        SimData._validate_object(
-            test_data,
-            'person',
-            req_attr=['name', 'salary', 'savings'],
-            optional_attr=['expenses', 'debts']
-        )
-    
-    def test_validate_object__err_missing_attr(self, *_):
-        test_data = generate_test_data()['people'][0]
-        del test_data['salary']
-
-        with self.assertRaises(DataImportError) as context:
-            SimData._validate_object(
-                test_data,
-                'person',
-                req_attr=['name', 'salary', 'savings'],
-                optional_attr=['expenses', 'debts']
-            )
-
-        expected_err = '"person" object must contain a "salary" attribute.'
-        self.assertEqual(expected_err, str(context.exception))
-    
-    def test_validate_object__err_invalid_attr(self, *_):
-        test_data = generate_test_data()['people'][0]
-        test_data['invalid_attr'] = 'TEST'
-
-        with self.assertRaises(DataImportError) as context:
-            SimData._validate_object(
-                test_data,
-                'person',
-                req_attr=['name', 'salary', 'savings'],
-                optional_attr=['expenses', 'debts']
-            )
-
-        expected_err = '"invalid_attr" is not a valid attribute of "person".'
-        self.assertEqual(expected_err, str(context.exception))
+        expected_err = ValidationError('$', 'If the data file contains more than one person, a "group" must be defined.')
+        self.assertListEqual(context.exception.errors, [ expected_err ])
 
     def test_lower_keys(self, *_):
         test_data = generate_test_data()
@@ -284,3 +189,96 @@ class TestSimData(TestCase):
         self.assertIn('cost', result['group']['expenses']['monthly'][0])
         self.assertEqual(result['people'][0]['name'], 'Alice')
         self.assertEqual(result['group']['expenses']['monthly'][0]['cost'], '500.00')
+
+
+def generate_jsonl(*scenarios):
+    return ''.join(dumps(scenario) + '\n' for scenario in scenarios)
+
+class TestIterScenarios(TestCase):
+
+    def test_iter_scenarios(self):
+        second = generate_test_data()
+        second['Savings_Goal'] = '25000'
+        del second['savings_goal']
+        contents = generate_jsonl(generate_test_data()) + '\n' + generate_jsonl(second)
+
+        with patch('builtins.open', return_value=StringIO(contents)) as mock_file:
+            scenarios = list(iter_scenarios('scenarios.jsonl'))
+
+        mock_file.assert_called_once_with('scenarios.jsonl', 'r')
+        self.assertEqual(len(scenarios), 2)
+        self.assertEqual(scenarios[0].savings_goal, Decimal('10000'))
+        self.assertEqual(scenarios[1].savings_goal, Decimal('25000'))
+        self.assertEqual(scenarios[1].get_people()[0]['name'], 'Alice')
+
+    @patch('finsim.sim_data.stdin', new_callable=StringIO)
+    def test_iter_scenarios__stdin(self, mock_stdin):
+        mock_stdin.write(generate_jsonl(generate_test_data()))
+        mock_stdin.seek(0)
+        scenarios = iter_scenarios('-')
+
+        self.assertTrue(next(scenarios).group_mode)
+        with self.assertRaises(StopIteration):
+            next(scenarios)
+
+    @patch('finsim.sim_data.stdin', new_callable=StringIO)
+    def test_iter_scenarios__lazy(self, mock_stdin):
+        invalid = generate_test_data()
+        invalid['savings_goal'] = '-5'
+        mock_stdin.write(generate_jsonl(generate_test_data(), invalid))
+        mock_stdin.seek(0)
+        scenarios = iter_scenarios('-')
+
+        self.assertEqual(next(scenarios).savings_goal, Decimal('10000'))
+        with self.assertRaises(DataImportError) as context:
+            next(scenarios)
+        self.assertEqual(str(context.exception), 'Line 2: $.savings_goal: Savings Goal must be greater than Zero.')
+        self.assertEqual(len(context.exception.errors), 1)
+
+    @patch('finsim.sim_data.stdin', new_callable=StringIO)
+    def test_iter_scenarios__invalid_json(self, mock_stdin):
+        mock_stdin.write('{ "people": \n')
+        mock_stdin.seek(0)
+
+        with self.assertRaises(DataImportError) as context:
+            list(iter_scenarios('-'))
+        self.assertTrue(str(context.exception).startswith('Line 1: '))
+
+
+class TestValidateFiles(TestCase):
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.paths = []
+        for i in range(6):
+            test_data = generate_test_data()
+            if i % 2 == 1:
+                test_data['people'][0]['salary']['base_salary'] = '-{}'.format(i)
+            path = join(self.directory.name, 'data-{}.json'.format(i))
+            with open(path, 'w') as f:
+                f.write(dumps(test_data))
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_validate_files(self):
+        results = validate_files(self.paths, workers=1)
+
+        self.assertListEqual([ path for path, _ in results ], self.paths)
+        self.assertListEqual([ len(errors) for _, errors in results ], [ 0, 1, 0, 1, 0, 1 ])
+        self.assertEqual(results[1][1][0].path, '$.people[0].salary.base_salary')
+
+    def test_validate_files__parallel(self):
+        self.assertListEqual(
+            validate_files(self.paths, workers=2, chunksize=2),
+            validate_files(self.paths, workers=1))
+
+    def test_validate_files__invalid_json(self):
+        with open(self.paths[0], 'w') as f:
+            f.write('{ "people": ')
+        missing = join(self.directory.name, 'missing.json')
+        results = validate_files([ self.paths[0], missing ], workers=1)
+
+        self.assertEqual(results[0][1][0].path, '$')
+        self.assertEqual(results[1][1][0].path, '$')
@@ -2,7 +2,11 @@ from unittest import TestCase
 from unittest.mock import patch, Mock
 from decimal import Decimal
 
+from finsim.profiler import Profiler
+from finsim.sim_data import SimData
 from finsim.simulation import Simulation
+from finsim.sim_data import DataImportError
+from finsim.strategies import RuleStrategy
 from test_data import generate_test_data
 
 def generate_data_mock(group_mode=True, savings_goal='10000'):
@@ -54,6 +58,7 @@ class TestSimulation(TestCase):
         mock_person_init.assert_not_called()
         mock_ui.obtain_savings_goal.assert_called_once()
 
+    @patch('finsim.simulation.earliest_month', return_value=1)
     @patch('finsim.simulation.Simulation._step_forward')
     @patch('finsim.simulation.UI')
     def test_simulate__single_loop(self, mock_ui, mock_step, *_):
@@ -66,6 +71,7 @@ class TestSimulation(TestCase):
         mock_step.assert_called_once()
         self.assertEqual(simulation.month, 1)
 
+    @patch('finsim.simulation.earliest_month', return_value=1)
     @patch('finsim.simulation.Simulation._step_forward')
     @patch('finsim.simulation.UI')
     def test_simulate__n_loop(self, mock_ui, mock_step, *_):
@@ -243,3 +249,240 @@ class TestSimulation(TestCase):
         
         result = simulation._achieved_goal()
         self.assertFalse(result)
+
+    def test_init__strategy_provider(self, mock_group_init, mock_person_init):
+        mock_data = generate_data_mock(group_mode=True)
+        mock_provider = Mock()
+        simulation = Simulation(mock_data, strategy_provider=mock_provider)
+
+        mock_group_init.assert_called_once_with(
+            mock_data, mock_provider, 'objects', simulation.economy, simulation.ledger)
+
+    def test_init__storage(self, mock_group_init, mock_person_init):
+        mock_data = generate_data_mock(group_mode=False)
+        simulation = Simulation(mock_data, storage='arrays')
+
+        mock_person_init.assert_called_once_with(
+            mock_data.get_people()[0], None, 'arrays', simulation.economy, simulation.ledger)
+
+    @patch('finsim.simulation.UI')
+    def test_init__quiet_goal_not_provided(self, mock_ui, *_):
+        mock_data = generate_data_mock(group_mode=True, savings_goal=None)
+
+        with self.assertRaises(DataImportError):
+            Simulation(mock_data, quiet=True)
+
+        mock_ui.obtain_savings_goal.assert_not_called()
+
+    @patch('finsim.simulation.earliest_month', return_value=1)
+    @patch('finsim.simulation.Simulation._step_forward')
+    @patch('finsim.simulation.UI')
+    def test_simulate__quiet(self, mock_ui, mock_step, *_):
+        mock_data = generate_data_mock()
+        simulation = Simulation(mock_data, quiet=True)
+        mock_step.side_effect = ([ False ] * 4) + [ True ]
+        result = simulation.simulate()
+
+        mock_ui.end.assert_not_called()
+        self.assertEqual(result, 5)
+
+    @patch('finsim.simulation.earliest_month', return_value=1)
+    @patch('finsim.simulation.Simulation._step_forward', return_value=False)
+    @patch('finsim.simulation.UI')
+    def test_simulate__horizon(self, mock_ui, mock_step, mock_earliest, *_):
+        simulation = Simulation(generate_data_mock(), max_months=24)
+        result = simulation.simulate()
+
+        mock_earliest.assert_called_once_with(simulation, 24)
+        mock_ui.end.assert_called_once_with(24, False)
+        self.assertEqual(mock_step.call_count, 24)
+        self.assertIsNone(result)
+
+    @patch('finsim.simulation.earliest_month', return_value=None)
+    @patch('finsim.simulation.Simulation._step_forward')
+    @patch('finsim.simulation.UI')
+    def test_simulate__unreachable(self, mock_ui, mock_step, *_):
+        simulation = Simulation(generate_data_mock())
+        result = simulation.simulate()
+
+        mock_step.assert_not_called()
+        mock_ui.end.assert_called_once_with(0, False)
+        self.assertIsNone(result)
+
+    @patch('finsim.simulation.Simulation._achieved_goal')
+    def test_step_forward__event_engine(self, mock_goal, mock_group_init, _):
+        mock_group = Mock()
+        mock_group.updated = True
+        mock_group.months_until_debt_cleared.return_value = 4
+        mock_group.monthly_deposit.return_value = Decimal('0')
+        mock_group_init.return_value = mock_group
+        mock_goal.return_value = False
+        simulation = Simulation(generate_data_mock(), engine='event')
+        simulation.month = 3
+
+        result = simulation._step_forward()
+
+        mock_group.simulate_month.assert_called_once_with(4)
+        mock_group.strategise.assert_called_once()
+        self.assertEqual(simulation.month, 6)
+        self.assertFalse(result)
+
+    def test_months_until_event__year_end(self, mock_group_init, _):
+        mock_group = Mock()
+        mock_group.months_until_debt_cleared.return_value = None
+        mock_group.monthly_deposit.return_value = Decimal('100')
+        mock_group.total_saved.return_value = Decimal('0')
+        mock_group_init.return_value = mock_group
+        simulation = Simulation(generate_data_mock(), engine='event')
+        simulation.month = 5
+
+        self.assertEqual(simulation._months_until_event(), 8)
+
+    def test_months_until_event__goal(self, mock_group_init, _):
+        mock_group = Mock()
+        mock_group.months_until_debt_cleared.return_value = 6
+        mock_group.monthly_deposit.return_value = Decimal('1000')
+        mock_group.total_saved.return_value = Decimal('7500')
+        mock_group_init.return_value = mock_group
+        simulation = Simulation(generate_data_mock(), engine='event')
+        simulation.month = 1
+
+        self.assertEqual(simulation._months_until_event(), 3)
+
+    def test_months_until_event__until(self, mock_group_init, _):
+        mock_group = Mock()
+        mock_group.months_until_debt_cleared.return_value = None
+        mock_group.monthly_deposit.return_value = Decimal('100')
+        mock_group.total_saved.return_value = Decimal('0')
+        mock_group_init.return_value = mock_group
+        simulation = Simulation(generate_data_mock(), engine='event')
+        simulation.month = 5
+
+        self.assertEqual(simulation._months_until_event(until=7), 3)
+
+    @patch('finsim.simulation.Simulation._step_forward')
+    def test_advance__until(self, mock_step, *_):
+        simulation = Simulation(generate_data_mock(), quiet=True)
+        mock_step.return_value = False
+
+        self.assertFalse(simulation.advance(until=4))
+        self.assertEqual(simulation.month, 4)
+        self.assertFalse(simulation.advance(until=6))
+        self.assertEqual(simulation.month, 6)
+        mock_step.assert_called_with(6)
+        self.assertEqual(mock_step.call_count, 6)
+
+    @patch('finsim.simulation.Simulation._step_forward')
+    def test_advance__goal_met(self, mock_step, *_):
+        simulation = Simulation(generate_data_mock(), quiet=True)
+        mock_step.side_effect = [ False, True ]
+
+        self.assertTrue(simulation.advance(until=12))
+        self.assertEqual(simulation.month, 2)
+
+    def test_init__invalid_engine(self, *_):
+        with self.assertRaises(ValueError):
+            Simulation(generate_data_mock(), engine='quantum')
+
+
+class TestSimulationEngines(TestCase):
+
+    def generate_data_mock(self, savings_goal):
+        data = generate_test_data()
+        mock_data = Mock()
+        mock_data.group_mode = True
+        mock_data.get_people.return_value = data['people']
+        mock_data.get_shared_expenses.return_value = data['group']['expenses']
+        mock_data.proportional_expenses = True
+        mock_data.savings_goal = Decimal(savings_goal)
+        return mock_data
+
+    @patch('finsim.utils.VERIFY_TOTALS', True)
+    def test_event_engine_matches_stepwise(self):
+        for goal in ('10000', '250000'):
+            results = []
+            for engine in Simulation.ENGINES:
+                simulation = Simulation(
+                    self.generate_data_mock(goal),
+                    strategy_provider=RuleStrategy(debt_share='30', reserve='700'),
+                    quiet=True,
+                    engine=engine)
+                months = simulation.simulate()
+                results.append((months, simulation.steps, simulation.model.total_saved()))
+
+            stepwise, event = results
+            self.assertEqual(stepwise[0], event[0])
+            self.assertEqual(stepwise[2], event[2])
+            self.assertLess(event[1], stepwise[1] // 5)
+
+
+class TestSimulationFork(TestCase):
+
+    def create(self, storage='objects', engine='stepwise'):
+        test_data = generate_test_data()
+        test_data['savings_goal'] = '60000'
+        return Simulation(
+            SimData.from_dict(test_data), RuleStrategy(debt_share='30', reserve='650'), quiet=True,
+            engine=engine, storage=storage, report_detail='monthly')
+
+    def balances(self, simulation):
+        return [
+            account.balance
+            for person in simulation.model.people
+            for account in person.savings.to_list() + person.debts.to_list(active_only=False)
+        ]
+
+    @patch('finsim.utils.VERIFY_TOTALS', True)
+    def test_fork__matches_original(self):
+        for storage in ('objects', 'arrays'):
+            for engine in Simulation.ENGINES:
+                simulation = self.create(storage, engine)
+                simulation.advance(until=30)
+                branch = simulation.fork()
+                branch.simulate()
+                simulation.simulate()
+
+                self.assertEqual(branch.month, simulation.month)
+                self.assertListEqual(self.balances(branch), self.balances(simulation))
+                self.assertEqual(branch.ledger.size, simulation.ledger.size)
+
+    @patch('finsim.utils.VERIFY_TOTALS', True)
+    def test_fork__independent(self):
+        for storage in ('objects', 'arrays'):
+            simulation = self.create(storage)
+            simulation.advance(until=12)
+            before = self.balances(simulation)
+            size = simulation.ledger.size
+            branch = simulation.fork()
+            branch.simulate()
+
+            self.assertEqual(simulation.month, 12)
+            self.assertListEqual(self.balances(simulation), before)
+            self.assertEqual(simulation.ledger.size, size)
+            self.assertNotEqual(branch.model.people[0].payroll.gross, simulation.model.people[0].payroll.gross)
+
+    def test_fork__shares_fixed_data(self):
+        simulation = self.create()
+        branch = simulation.fork()
+        person, branch_person = simulation.model.people[0], branch.model.people[0]
+
+        self.assertIs(branch.economy, simulation.economy)
+        self.assertIs(branch_person.payroll.economy, person.payroll.economy)
+        self.assertIs(branch_person.expenses.monthly_expenses[0].name, person.expenses.monthly_expenses[0].name)
+        self.assertIsNot(branch_person.savings.to_list()[0], person.savings.to_list()[0])
+
+    def test_fork__strategy_provider(self):
+        simulation = self.create()
+        simulation.advance(until=6)
+        branch = simulation.fork(RuleStrategy(debt_share='80'))
+
+        self.assertIs(branch.model.people[0].strategy_provider, branch.model.people[1].strategy_provider)
+        self.assertNotEqual(branch.model.people[0].current_strategy, simulation.model.people[0].current_strategy)
+        self.assertLess(branch.simulate(), simulation.simulate())
+
+    def test_fork__profiled(self):
+        test_data = generate_test_data()
+        test_data['savings_goal'] = '60000'
+        simulation = Simulation(SimData.from_dict(test_data), RuleStrategy(), quiet=True, profiler=Profiler())
+        with self.assertRaises(ValueError):
+            simulation.fork()
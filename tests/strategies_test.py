@@ -0,0 +1,325 @@
+from unittest import TestCase
+from unittest.mock import patch, Mock, mock_open
+from asyncio import StreamReader, new_event_loop, open_connection, sleep, start_server
+from decimal import Decimal
+from json import loads as json_loads
+
+from finsim.strategies import (
+    AsyncFunctionStrategy, FixedStrategy, FileStrategy, FunctionStrategy, RuleStrategy, ShareStrategy,
+    StrategyError, StreamStrategy, build_strategy, order_debts
+)
+
+def generate_account_mock(name, balance='0', interest_rate='0'):
+    mock_account = Mock()
+    mock_account.name = name
+    mock_account.balance = Decimal(balance)
+    mock_account.interest_rate = Decimal(interest_rate)
+    return mock_account
+
+def generate_person_mock(disposable_income='1000', debts=None):
+    mock_person = Mock()
+    mock_person.name = 'Alice'
+    mock_person.disposable_income = Decimal(disposable_income)
+    if debts is None:
+        debts = [
+            generate_account_mock('Credit Card', balance='2000', interest_rate='0'),
+            generate_account_mock('Overdraft', balance='100', interest_rate='1.00')
+        ]
+    mock_person.debts.to_list.return_value = debts
+    mock_person.savings.to_list.return_value = [
+        generate_account_mock('Savings Acc.'),
+        generate_account_mock('Lifetime ISA')
+    ]
+    return mock_person
+
+def payments(items):
+    return { item['name']: item['payment'] for item in items }
+
+
+class TestBuildStrategy(TestCase):
+
+    def test_build_strategy(self):
+        person = generate_person_mock()
+        result = build_strategy(person, { 'Credit Card': '200' }, { 'Lifetime ISA': '100' })
+
+        self.assertDictEqual(payments(result['debts']), {
+            'Credit Card': Decimal('200'), 'Overdraft': Decimal('0') })
+        self.assertDictEqual(payments(result['savings']), {
+            'Savings Acc.': Decimal('0'), 'Lifetime ISA': Decimal('100') })
+        self.assertEqual(result['remaining'], Decimal('700'))
+
+    def test_build_strategy__no_active_debts(self):
+        person = generate_person_mock(debts=[])
+        result = build_strategy(person, { 'Credit Card': '200' }, { 'Lifetime ISA': '100' })
+
+        self.assertNotIn('debts', result)
+        self.assertEqual(result['remaining'], Decimal('900'))
+
+
+class TestFixedStrategy(TestCase):
+
+    def test_obtain_initial_strategy(self):
+        provider = FixedStrategy({
+            'Alice': {
+                'debts': [ { 'name': 'Overdraft', 'payment': '50' } ],
+                'savings': { 'Savings Acc.': '300' }
+            }
+        })
+        result = provider.obtain_initial_strategy(generate_person_mock())
+
+        self.assertEqual(payments(result['debts'])['Overdraft'], Decimal('50'))
+        self.assertEqual(payments(result['savings'])['Savings Acc.'], Decimal('300'))
+        self.assertEqual(result['remaining'], Decimal('650'))
+
+    def test_obtain_new_strategy__matches_initial(self):
+        provider = FixedStrategy({ 'Alice': { 'savings': { 'Savings Acc.': '300' } } })
+        person = generate_person_mock()
+
+        self.assertDictEqual(
+            provider.obtain_initial_strategy(person),
+            provider.obtain_new_strategy(person))
+
+    def test_obtain_initial_strategy__missing_person(self):
+        provider = FixedStrategy({ 'Bob': { 'savings': {} } })
+
+        with self.assertRaises(StrategyError) as context:
+            provider.obtain_initial_strategy(generate_person_mock())
+
+        self.assertEqual('No strategy has been provided for Alice.', str(context.exception))
+
+
+class TestFileStrategy(TestCase):
+
+    @patch('builtins.open', new_callable=mock_open,
+           read_data='{ "Alice": { "savings": { "Lifetime ISA": "250" } } }')
+    def test_init(self, mock_file):
+        provider = FileStrategy('strategy.json')
+        result = provider.obtain_initial_strategy(generate_person_mock())
+
+        mock_file.assert_called_once_with('strategy.json', 'r')
+        self.assertEqual(payments(result['savings'])['Lifetime ISA'], Decimal('250'))
+
+
+class TestFunctionStrategy(TestCase):
+
+    def test_obtain_strategies(self):
+        func = Mock(side_effect=[ 'INITIAL', 'NEW' ])
+        provider = FunctionStrategy(func)
+        person = generate_person_mock()
+
+        self.assertEqual(provider.obtain_initial_strategy(person), 'INITIAL')
+        self.assertEqual(provider.obtain_new_strategy(person), 'NEW')
+        func.assert_any_call(person, True)
+        func.assert_any_call(person, False)
+
+
+class TestRuleStrategy(TestCase):
+
+    def test_init__invalid_order(self):
+        with self.assertRaises(StrategyError):
+            RuleStrategy(order='alphabetical')
+
+    def test_avalanche(self):
+        provider = RuleStrategy(debt_share='50', order='avalanche')
+        result = provider.obtain_initial_strategy(generate_person_mock())
+
+        self.assertDictEqual(payments(result['debts']), {
+            'Credit Card': Decimal('400'), 'Overdraft': Decimal('100') })
+        self.assertDictEqual(payments(result['savings']), {
+            'Savings Acc.': Decimal('250'), 'Lifetime ISA': Decimal('250') })
+        self.assertEqual(result['remaining'], Decimal('0'))
+
+    def test_snowball(self):
+        debts = [
+            generate_account_mock('Credit Card', balance='2000', interest_rate='20'),
+            generate_account_mock('Overdraft', balance='1000', interest_rate='1')
+        ]
+        provider = RuleStrategy(debt_share='40', order='snowball')
+        result = provider.obtain_initial_strategy(generate_person_mock(debts=debts))
+
+        self.assertDictEqual(payments(result['debts']), {
+            'Credit Card': Decimal('0'), 'Overdraft': Decimal('400') })
+
+    def test_savings_weights_and_reserve(self):
+        provider = RuleStrategy(
+            debt_share='0', savings_weights={ 'Lifetime ISA': 3, 'Savings Acc.': 1 }, reserve='200')
+        result = provider.obtain_initial_strategy(generate_person_mock())
+
+        self.assertDictEqual(payments(result['savings']), {
+            'Savings Acc.': Decimal('200'), 'Lifetime ISA': Decimal('600') })
+        self.assertEqual(result['remaining'], Decimal('200'))
+
+    def test_negative_disposable_income(self):
+        provider = RuleStrategy()
+        result = provider.obtain_initial_strategy(generate_person_mock(disposable_income='-50'))
+
+        for item in result['debts'] + result['savings']:
+            self.assertEqual(item['payment'], Decimal('0'))
+
+
+class TestShareStrategy(TestCase):
+
+    SHARES = {
+        'Alice': {
+            'Credit Card': '0.2', 'Overdraft': '0.1', 'Savings Acc.': '0.3', 'Lifetime ISA': '0.1'
+        }
+    }
+
+    def test_init__invalid_order(self):
+        with self.assertRaises(StrategyError):
+            ShareStrategy({}, order='alphabetical')
+
+    def test_obtain_initial_strategy(self):
+        result = ShareStrategy(self.SHARES).obtain_initial_strategy(generate_person_mock())
+
+        self.assertDictEqual(payments(result['debts']), {
+            'Credit Card': Decimal('200'), 'Overdraft': Decimal('100') })
+        self.assertDictEqual(payments(result['savings']), {
+            'Savings Acc.': Decimal('300'), 'Lifetime ISA': Decimal('100') })
+        self.assertEqual(result['remaining'], Decimal('300'))
+
+    def test_obtain_new_strategy__debt_cleared(self):
+        credit_card = generate_account_mock('Credit Card', balance='2000')
+        overdraft = generate_account_mock('Overdraft', balance='0', interest_rate='1.00')
+        person = generate_person_mock(debts=[ credit_card ])
+        person.debts.to_list.side_effect = lambda active_only=True: (
+            [ credit_card ] if active_only else [ credit_card, overdraft ])
+        result = ShareStrategy(self.SHARES).obtain_new_strategy(person)
+
+        self.assertDictEqual(payments(result['debts']), { 'Credit Card': Decimal('300') })
+
+    def test_obtain_new_strategy__all_debts_cleared(self):
+        debts = [ generate_account_mock('Credit Card'), generate_account_mock('Overdraft') ]
+        person = generate_person_mock(debts=[])
+        person.debts.to_list.side_effect = lambda active_only=True: [] if active_only else debts
+        result = ShareStrategy(self.SHARES).obtain_new_strategy(person)
+
+        self.assertNotIn('debts', result)
+        self.assertDictEqual(payments(result['savings']), {
+            'Savings Acc.': Decimal('525'), 'Lifetime ISA': Decimal('175') })
+
+    def test_obtain_initial_strategy__unknown_person(self):
+        result = ShareStrategy({}).obtain_initial_strategy(generate_person_mock())
+
+        self.assertEqual(result['remaining'], Decimal('1000'))
+
+
+class TestOrderDebts(TestCase):
+
+    def test_order_debts(self):
+        debts = [
+            generate_account_mock('Credit Card', balance='2000', interest_rate='20'),
+            generate_account_mock('Overdraft', balance='1000', interest_rate='1')
+        ]
+
+        self.assertListEqual([ d.name for d in order_debts(debts, 'avalanche') ], ['Credit Card', 'Overdraft'])
+        self.assertListEqual([ d.name for d in order_debts(debts, 'snowball') ], ['Overdraft', 'Credit Card'])
+
+
+class TestAsyncStrategies(TestCase):
+
+    def test_async_function_strategy__sync(self):
+        async def func(person, initial):
+            return { 'initial': initial }
+        provider = AsyncFunctionStrategy(func)
+
+        self.assertEqual(provider.obtain_initial_strategy(Mock()), { 'initial': True })
+        self.assertEqual(provider.obtain_new_strategy(Mock()), { 'initial': False })
+        loop = provider.loop
+        provider.close()
+        self.assertTrue(loop.is_closed())
+
+    def test_async_strategy_provider__loop(self):
+        async def func(person, initial):
+            return {}
+        loop = new_event_loop()
+        provider = AsyncFunctionStrategy(func, loop)
+        unused = AsyncFunctionStrategy(func)
+
+        provider.close()
+        unused.close()
+
+        self.assertFalse(loop.is_closed())
+        self.assertIsNone(unused._loop)
+        loop.close()
+
+    def test_stream_strategy(self):
+        loop = new_event_loop()
+        requests = []
+
+        async def handle(reader, writer):
+            requests.append(json_loads((await reader.readline()).decode('utf-8')))
+            writer.write(b'{ "debts": { "Overdraft": "100" }, "savings": { "Lifetime ISA": "250.50" } }\n')
+            await writer.drain()
+            writer.close()
+
+        async def connect():
+            server = await start_server(handle, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            return server, await open_connection('127.0.0.1', port)
+
+        server, streams = loop.run_until_complete(connect())
+        provider = StreamStrategy({ 'Alice': streams }, loop)
+        result = provider.obtain_initial_strategy(generate_person_mock())
+        provider.close()
+        server.close()
+        loop.run_until_complete(server.wait_closed())
+        loop.close()
+
+        self.assertEqual(requests[0]['person'], 'Alice')
+        self.assertTrue(requests[0]['initial'])
+        self.assertEqual(requests[0]['disposable_income'], '1000')
+        self.assertEqual(requests[0]['debts'][1], { 'name': 'Overdraft', 'balance': '100', 'interest_rate': '1.00' })
+        self.assertDictEqual(payments(result['debts']), {
+            'Credit Card': Decimal('0'), 'Overdraft': Decimal('100') })
+        self.assertEqual(payments(result['savings'])['Lifetime ISA'], Decimal('250.50'))
+        self.assertEqual(result['remaining'], Decimal('649.50'))
+
+    def test_stream_strategy__invalid_reply(self):
+        for reply in (b'not json\n', b'[1, 2]\n', b''):
+            loop = new_event_loop()
+            reader = StreamReader(loop=loop)
+            reader.feed_data(reply)
+            reader.feed_eof()
+            provider = StreamStrategy({ 'Alice': (reader, Mock(drain=self.no_op)) }, loop)
+            with self.assertRaises(StrategyError):
+                provider.obtain_initial_strategy(generate_person_mock())
+            loop.close()
+
+    def test_stream_strategy__missing_person(self):
+        provider = StreamStrategy({})
+        self.addCleanup(provider.close)
+        with self.assertRaises(StrategyError):
+            provider.obtain_initial_strategy(generate_person_mock())
+
+    def test_listen(self):
+        loop = new_event_loop()
+        replies = []
+        clients = []
+
+        def ready(port):
+            async def connect(name):
+                reader, writer = await open_connection('127.0.0.1', port)
+                writer.write('{}\n'.format(name).encode('utf-8'))
+                clients.append(writer)
+                return reader
+
+            async def connect_all():
+                rejected = await connect('Mallory')
+                replies.append(await rejected.readline())
+                for name in ('Alice', 'Bob'):
+                    await connect(name)
+            loop.create_task(connect_all())
+
+        provider = StreamStrategy.listen(['Alice', 'Bob'], host='127.0.0.1', loop=loop, ready=ready)
+
+        self.assertListEqual(sorted(provider.streams), ['Alice', 'Bob'])
+        self.assertListEqual(replies, [ b'"Mallory" is not expected or is already connected.\n' ])
+        provider.close()
+        for writer in clients:
+            writer.close()
+        loop.run_until_complete(sleep(0))
+        loop.close()
+
+    async def no_op(self):
+        pass
@@ -0,0 +1,179 @@
+from unittest import TestCase
+from unittest.mock import patch, ANY, Mock
+from decimal import Decimal
+
+from finsim.sim_data import SimData
+from finsim.strategies import FixedStrategy
+from finsim.sweep import sweep, sweep_arrays, set_path, SweepError
+from test_data import generate_test_data
+
+AXES = {
+    'savings_goal': [ '5000', '20000' ],
+    'people.*.salary.payrise_rate': [ '1', '4' ],
+    'strategy.debt_share': [ '25', '75' ]
+}
+
+class TestSweep(TestCase):
+
+    def test_sweep(self):
+        rows = sweep(SimData.from_dict(generate_test_data()), AXES, workers=1)
+
+        self.assertEqual(len(rows), 8)
+        self.assertDictEqual(
+            { k: rows[0][k] for k in AXES },
+            { 'savings_goal': '5000', 'people.*.salary.payrise_rate': '1', 'strategy.debt_share': '25' })
+        for row in rows:
+            self.assertGreater(row['months'], 0)
+            self.assertGreaterEqual(row['total_saved'], Decimal(row['savings_goal']))
+            self.assertIn('Alice:Lifetime ISA', row)
+            self.assertIn('Bob:Overdraft', row)
+        self.assertLess(rows[0]['months'], rows[-1]['months'])
+
+    def test_sweep__process_pool_matches_serial(self):
+        base_data = SimData.from_dict(generate_test_data())
+        serial = sweep(base_data, AXES, workers=1)
+        parallel = sweep(base_data, AXES, workers=2, chunksize=3)
+
+        self.assertListEqual(serial, parallel)
+
+    def test_sweep__debt_free_month(self):
+        rows = sweep(
+            SimData.from_dict(generate_test_data()),
+            { 'savings_goal': [ '50000' ], 'strategy.debt_share': [ '90' ] },
+            workers=1)
+
+        self.assertIsNotNone(rows[0]['debt_free_month'])
+        self.assertLess(rows[0]['debt_free_month'], rows[0]['months'])
+
+    def test_sweep__economy_axis(self):
+        rows = sweep(
+            SimData.from_dict(generate_test_data()),
+            { 'savings_goal': [ '50000' ], 'economy.it_rate': [ '10', '20', '30' ] },
+            workers=2)
+        months = [ row['months'] for row in rows ]
+
+        self.assertListEqual(months, sorted(months))
+        self.assertLess(months[0], months[-1])
+
+    @patch('finsim.sweep.Simulation.advance', autospec=True, return_value=False)
+    def test_sweep__max_years(self, mock_advance):
+        rows = sweep(
+            SimData.from_dict(generate_test_data()),
+            { 'savings_goal': [ '5000', '1000000000' ] },
+            workers=1, max_years=10)
+
+        self.assertListEqual([ row['months'] for row in rows ], [ None, None ])
+        self.assertEqual(mock_advance.call_count, 1)
+        mock_advance.assert_called_once_with(ANY, until=120)
+        self.assertEqual(rows[1]['total_saved'], Decimal('200.00'))
+
+    def test_sweep__unreachable_by_default(self):
+        strategy = FixedStrategy({
+            'Alice': { 'savings': { 'Savings Acc.': '10' } },
+            'Bob': { 'savings': { 'Lifetime ISA': '10' } }
+        })
+
+        rows = sweep(
+            SimData.from_dict(generate_test_data()), { 'savings_goal': [ '100000000' ] }, strategy=strategy,
+            workers=1)
+
+        self.assertIsNone(rows[0]['months'])
+
+    def test_sweep__strategy_axis_requires_rules(self):
+        with self.assertRaises(SweepError):
+            sweep(Mock(), { 'strategy.debt_share': [ '50' ] }, strategy=FixedStrategy({}))
+
+    def test_sweep__empty_axis(self):
+        self.assertListEqual(sweep(Mock(), { 'savings_goal': [] }), [])
+
+
+class TestSetPath(TestCase):
+
+    def test_set_path__key(self):
+        data = generate_test_data()
+        set_path(data, 'savings_goal', '1')
+        self.assertEqual(data['savings_goal'], '1')
+
+    def test_set_path__wildcard(self):
+        data = generate_test_data()
+        set_path(data, 'people.*.salary.pension', '7')
+        self.assertListEqual([ p['salary']['pension'] for p in data['people'] ], [ '7', '7' ])
+
+    def test_set_path__index_and_name(self):
+        data = generate_test_data()
+        set_path(data, 'people.1.salary.base_salary', '30000')
+        set_path(data, 'people.Alice.savings.Lifetime ISA.interest_rate', '2.5')
+
+        self.assertEqual(data['people'][1]['salary']['base_salary'], '30000')
+        self.assertEqual(data['people'][0]['savings'][1]['interest_rate'], '2.5')
+
+    def test_set_path__optional_attribute(self):
+        data = generate_test_data()
+        set_path(data, 'people.Bob.salary.payrise_rate', '3')
+        set_path(data, 'people.Bob.savings.*.type', 'traditional')
+        self.assertEqual(data['people'][1]['salary']['payrise_rate'], '3')
+        self.assertEqual(data['people'][1]['savings'][0]['type'], 'traditional')
+
+    def test_set_path__misspelt_attribute(self):
+        for path in ('people.alice.salary.base_salry', 'savings_gaol', 'people.*.salery.pension'):
+            with self.assertRaises(SweepError) as context:
+                set_path(generate_test_data(), path, '1')
+            self.assertIn(path, str(context.exception))
+
+    def test_set_path__unknown_name(self):
+        with self.assertRaises(SweepError) as context:
+            set_path(generate_test_data(), 'people.Carol.salary.pension', '1')
+
+        self.assertEqual('"carol" does not match any item in "people.Carol.salary.pension".', str(context.exception))
+
+
+class TestSweepArrays(TestCase):
+
+    def test_sweep_arrays__matches_sweep(self):
+        base_data = SimData.from_dict(generate_test_data())
+        rows = sweep(base_data, AXES, workers=1)
+
+        for workers, shared in ((1, True), (2, True), (2, False)):
+            with sweep_arrays(base_data, AXES, workers=workers, chunksize=3, shared=shared) as results:
+                self.assertListEqual(results.points, [ { k: row[k] for k in AXES } for row in rows ])
+                self.assertListEqual(results.months.tolist(), [ row['months'] for row in rows ])
+                self.assertListEqual(
+                    results.debt_free_month.tolist(),
+                    [ row['debt_free_month'] if row['debt_free_month'] is not None else -1 for row in rows ])
+                self.assertListEqual(
+                    results.total_saved.tolist(), [ int(row['total_saved'] * 100) for row in rows ])
+                for column, account in enumerate(results.accounts):
+                    self.assertListEqual(
+                        results.balances[:, column].tolist(), [ int(row[account] * 100) for row in rows ])
+
+    def test_sweep_arrays__totals(self):
+        base_data = SimData.from_dict(generate_test_data())
+        axes = { 'savings_goal': [ '5000', '1000000000' ] }
+
+        with sweep_arrays(base_data, axes, workers=2, max_years=2, totals=True) as results:
+            months = results.months.tolist()
+            totals = results.totals.copy()
+            total_saved = results.total_saved.tolist()
+
+        self.assertEqual(months[1], -1)
+        self.assertTupleEqual(totals.shape, (2, 25))
+        self.assertEqual(totals[0, 0], 20000)
+        self.assertEqual(totals[0, months[0]], total_saved[0])
+        self.assertTrue((totals[0, months[0] + 1:] == 0).all())
+        self.assertTrue((totals[1, 1:] > totals[1, :-1]).all())
+
+    def test_sweep_arrays__prunes_unreachable_points(self):
+        base_data = SimData.from_dict(generate_test_data())
+        axes = { 'savings_goal': [ '5000', '1000000000' ] }
+
+        with patch('finsim.sweep.Simulation.advance', autospec=True, return_value=True) as mock_advance:
+            with sweep_arrays(base_data, axes, workers=1, max_years=2) as results:
+                months = results.months.tolist()
+
+        self.assertEqual(mock_advance.call_count, 1)
+        self.assertEqual(months[1], -1)
+
+    def test_sweep_arrays__strategy_axis_requires_rules(self):
+        with self.assertRaises(SweepError):
+            sweep_arrays(Mock(), { 'strategy.debt_share': [ '50' ] }, strategy=FixedStrategy({}))
+
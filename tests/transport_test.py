@@ -0,0 +1,55 @@
+from unittest import TestCase, skipUnless
+
+import numpy as np
+
+from finsim.transport import SHARED_MEMORY, ArrayBlock, BlockDescriptor
+
+LAYOUT = [
+    ('months', np.int32, (3,)),
+    ('balances', np.int64, (3, 2))
+]
+
+class TestArrayBlock(TestCase):
+
+    def test_private(self):
+        block = ArrayBlock(LAYOUT, shared=False)
+
+        self.assertFalse(block.shared)
+        self.assertIsNone(block.descriptor)
+        self.assertEqual(block['months'].dtype, np.int32)
+        self.assertTupleEqual(block['balances'].shape, (3, 2))
+        self.assertFalse(block['balances'].any())
+        block.close()
+        block.unlink()
+
+    @skipUnless(SHARED_MEMORY, 'shared memory needs Python 3.8 or later')
+    def test_shared(self):
+        block = ArrayBlock(LAYOUT)
+        try:
+            descriptor = block.descriptor
+            self.assertIsInstance(descriptor, BlockDescriptor)
+            self.assertFalse(block['months'].any())
+
+            attached = ArrayBlock.attach(descriptor)
+            attached['months'][1] = 7
+            attached['balances'][2] = [ 100, -5 ]
+            attached.close()
+
+            self.assertListEqual(list(block['months']), [ 0, 7, 0 ])
+            self.assertListEqual(block['balances'].tolist(), [ [ 0, 0 ], [ 0, 0 ], [ 100, -5 ] ])
+        finally:
+            block.close()
+            block.unlink()
+
+    @skipUnless(SHARED_MEMORY, 'shared memory needs Python 3.8 or later')
+    def test_shared__aligned(self):
+        block = ArrayBlock([ ('flag', np.int8, (3,)), ('total', np.int64, (2,)) ])
+        try:
+            block['flag'][:] = 1
+            block['total'][:] = -1
+
+            self.assertEqual(block['total'].ctypes.data % 8, 0)
+            self.assertListEqual(list(block['flag']), [ 1, 1, 1 ])
+        finally:
+            block.close()
+            block.unlink()
@@ -48,6 +48,13 @@ class TestUI(TestCase):
         mock_heading.assert_called_once_with(ANY, level=1)
         mock_print.assert_any_call('Goal achieved in 1 year and 1 month.\n')
 
+    @patch('builtins.print')
+    @patch('finsim.ui.UI._heading', return_value='Test')
+    def test_end__goal_not_met(self, mock_heading, mock_print):
+        UI.end(total_months=120, goal_met=False)
+        mock_heading.assert_called_once_with(ANY, level=1)
+        mock_print.assert_any_call('Goal not achieved within 10 years and 0 months.\n')
+
     # -- Initialisation Functions -----------------------------------
     
     @patch('finsim.ui.UI._err')
@@ -0,0 +1,90 @@
+from unittest import TestCase
+
+from finsim.validation import DATA_VALIDATOR, ValidationError
+from test_data import generate_test_data
+
+class TestDataValidator(TestCase):
+
+    def assertErrors(self, test_data, *expected):
+        self.assertListEqual(DATA_VALIDATOR.validate(test_data), [ ValidationError(*e) for e in expected ])
+
+    def test_validate__ok(self):
+        self.assertErrors(generate_test_data())
+
+    def test_validate__null_savings_goal(self):
+        test_data = generate_test_data()
+        test_data['savings_goal'] = None
+        self.assertErrors(test_data)
+
+    def test_validate__err_invalid_name(self):
+        test_data = generate_test_data()
+        test_data['people'][0]['name'] = 100
+
+        self.assertErrors(
+            test_data,
+            ('$.people[0].name', 'Each person in the data file must have a valid name.'))
+
+    def test_validate__err_missing_savings(self):
+        test_data = generate_test_data()
+        test_data['people'][0]['savings'] = []
+
+        self.assertErrors(
+            test_data,
+            ('$.people[0].savings', 'Alice must have at least one savings account.'))
+
+    def test_validate__err_missing_attr(self):
+        test_data = generate_test_data()
+        del test_data['people'][1]['salary']
+
+        self.assertErrors(
+            test_data,
+            ('$.people[1]', '"person" object must contain a "salary" attribute.'))
+
+    def test_validate__err_invalid_attr(self):
+        test_data = generate_test_data()
+        test_data['people'][0]['invalid_attr'] = 'TEST'
+
+        self.assertErrors(
+            test_data,
+            ('$.people[0]', '"invalid_attr" is not a valid attribute of "person".'))
+
+    def test_validate__err_expense_costs(self):
+        test_data = generate_test_data()
+        test_data['people'][0]['expenses']['monthly'][0]['cost'] = '-100'
+        test_data['group']['expenses']['annual'][1]['cost'] = 'ten'
+
+        self.assertErrors(
+            test_data,
+            ('$.people[0].expenses.monthly[0].cost', 'Expense costs must be greater than Zero.'),
+            ('$.group.expenses.annual[1].cost', 'Expense costs must be a valid number.'))
+
+    def test_validate__err_invalid_inflation(self):
+        test_data = generate_test_data()
+        test_data['group']['expenses']['monthly'][0]['inflation'] = 'yes'
+
+        self.assertErrors(
+            test_data,
+            ('$.group.expenses.monthly[0].inflation',
+             'The "inflation" attribute of an expense item, if included, must be either "true" or "false".'))
+
+    def test_validate__err_accounts(self):
+        test_data = generate_test_data()
+        test_data['people'][0]['savings'][1]['type'] = 'isa'
+        test_data['people'][1]['debts'][0]['interest_rate'] = '-2'
+        del test_data['people'][1]['debts'][0]['starting_balance']
+
+        self.assertErrors(
+            test_data,
+            ('$.people[0].savings[1].type', 'Savings account types must be either "traditional" or "lisa".'),
+            ('$.people[1].debts[0]', '"debt" object must contain a "starting_balance" attribute.'),
+            ('$.people[1].debts[0].interest_rate', 'Interest rates must not be negative.'))
+
+    def test_validate__err_wrong_types(self):
+        test_data = generate_test_data()
+        test_data['people'][0]['salary'] = '20000'
+        test_data['people'][1]['savings'] = { 'name': 'ISA' }
+
+        self.assertErrors(
+            test_data,
+            ('$.people[0].salary', 'Expected a "salary" object.'),
+            ('$.people[1].savings', '"savings" must be a list.'))
@@ -0,0 +1,40 @@
+from argparse import ArgumentParser
+from json import dump as json_dump
+from sys import exit
+from time import perf_counter
+
+from finsim.sim_data import validate_files
+
+parser = ArgumentParser(description='Validate data files, reporting every error in each.')
+parser.add_argument('paths', nargs='+', help='data files to validate')
+parser.add_argument('--workers', type=int, help='number of worker processes (defaults to the CPU count)')
+parser.add_argument('--chunksize', type=int, help='files sent to a worker at a time')
+parser.add_argument('--output', help='JSON file to write a summary of the results to')
+args = parser.parse_args()
+
+start = perf_counter()
+results = validate_files(args.paths, workers=args.workers, chunksize=args.chunksize)
+elapsed = perf_counter() - start
+
+invalid = [ (path, errors) for path, errors in results if len(errors) > 0 ]
+for path, errors in invalid:
+    print(path)
+    for error in errors:
+        print('\t{}: {}'.format(error.path, error.message))
+
+print('Checked {} files in {:.2f}s: {} valid, {} invalid.'.format(
+    len(results), elapsed, len(results) - len(invalid), len(invalid)))
+
+if args.output:
+    summary = {
+        'checked': len(results),
+        'valid': len(results) - len(invalid),
+        'invalid': {
+            path: [ { 'path': e.path, 'message': e.message } for e in errors ]
+            for path, errors in invalid
+        }
+    }
+    with open(args.output, 'w') as f:
+        json_dump(summary, f, indent=4)
+
+exit(1 if len(invalid) > 0 else 0)